@@ -0,0 +1,4 @@
+from advent_of_code.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from glob import glob
+from importlib import import_module
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from time import perf_counter
+
+from advent_of_code.cache import Answer
+from advent_of_code.memo import Scope, memo_scope
+from advent_of_code.parallel import Backend, get_backend, limit_workers
+from advent_of_code.runner import Day
+
+CHUNKS_PER_WORKER = 4
+
+_solvers: dict[str, Callable[[str], tuple[Answer, Answer]]] = {}
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    filepath: str
+    answers: tuple[Answer, Answer] | None
+    seconds: float
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "filepath": self.filepath,
+            "answers": self.answers,
+            "seconds": self.seconds,
+            "error": self.error,
+        }
+
+
+def find_inputs(pattern: str) -> list[str]:
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(
+            str(filepath) for filepath in path.iterdir() if filepath.is_file()
+        )
+    return sorted(glob(pattern))  # noqa: PTH207
+
+
+def get_chunksize(input_count: int, workers: int) -> int:
+    return max(1, input_count // (workers * CHUNKS_PER_WORKER))
+
+
+def _init_worker(module_name: str) -> None:
+    _solvers[module_name] = import_module(module_name).solve
+
+
+def _init_pool_worker(module_name: str) -> None:
+    limit_workers()
+    _init_worker(module_name)
+
+
+def _solve_input(module_name: str, filepath: str) -> BatchResult:
+    start = perf_counter()
+    try:
+        with memo_scope(Scope.RUN):
+            answers = _solvers[module_name](filepath)
+    except Exception as error:  # noqa: BLE001
+        return BatchResult(filepath, None, perf_counter() - start, repr(error))
+    return BatchResult(filepath, answers, perf_counter() - start)
+
+
+def _solve_day_input(args: tuple[str, str]) -> BatchResult:
+    return _solve_input(*args)
+
+
+def run_batch(
+    day: Day,
+    filepaths: Sequence[str],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    backend: Backend | None = None,
+) -> Iterator[BatchResult]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(day.module_name)
+        yield from (_solve_input(day.module_name, filepath) for filepath in filepaths)
+        return
+    chunksize = chunksize or get_chunksize(len(filepaths), workers)
+    pool_type = ThreadPool if get_backend(backend) is Backend.THREAD else Pool
+    with pool_type(
+        workers, initializer=_init_pool_worker, initargs=(day.module_name,)
+    ) as pool:
+        yield from pool.imap_unordered(
+            _solve_day_input,
+            ((day.module_name, filepath) for filepath in filepaths),
+            chunksize,
+        )
@@ -0,0 +1,82 @@
+from collections.abc import Buffer, Iterator, Sequence
+
+# Boards are ints whose bit i stands for cell i of a Grid. Border cells are never
+# in a mask, so a shift that runs off a row lands on a border bit and is masked
+# away, as stepping off a Grid lands on a border cell.
+
+_CLEAR = ord("0")
+_SET = ord("1")
+
+
+def get_mask(cells: Buffer, *values: int) -> int:
+    """Return the board of the cells holding any of values."""
+    table = bytearray([_CLEAR]) * 256
+    for value in values:
+        table[value] = _SET
+    # The last cell is the first digit, as the highest bit.
+    return int(bytes(cells).translate(table)[::-1], 2)
+
+
+def shift(board: int, offset: int) -> int:
+    """Move every cell of a board by offset."""
+    return board << offset if offset >= 0 else board >> -offset
+
+
+def get_adjacent(board: int, stride: int) -> int:
+    """Return the cells a move up, right, down or left from any cell of a board."""
+    return board << 1 | board >> 1 | board << stride | board >> stride
+
+
+def iter_levels(seeds: int, mask: int, stride: int) -> Iterator[int]:
+    """Breadth-first search the mask from seeds, yielding the board of each level.
+
+    Level n holds the cells first reached after n moves, so each level costs a few
+    big-int operations however many cells it has. The mask is only ever and-ed, so
+    those operations are as long as the boards of reached cells, not the mask.
+    """
+    frontier = seeds & mask
+    reached = frontier
+    while frontier:
+        yield frontier
+        frontier = get_adjacent(frontier, stride) & mask & ~reached
+        reached |= frontier
+
+
+def flood_fill(seeds: int, mask: int, stride: int) -> int:
+    """Return the cells of the mask connected to seeds."""
+    filled = 0
+    for level in iter_levels(seeds, mask, stride):
+        filled |= level
+    return filled
+
+
+def iter_bits(board: int) -> Iterator[int]:
+    """Yield the cells of a board from the lowest."""
+    while board:
+        lowest = board & -board
+        yield lowest.bit_length() - 1
+        board ^= lowest
+
+
+def add_counts(counts: Sequence[int], other_counts: Sequence[int]) -> list[int]:
+    """Add two bit-sliced counters, whose board n holds bit n of each cell's count.
+
+    This adds a count for every cell at once, as a ripple-carry adder.
+    """
+    if len(counts) < len(other_counts):
+        counts, other_counts = other_counts, counts
+    total = []
+    carry = 0
+    for i, board in enumerate(counts):
+        other_board = other_counts[i] if i < len(other_counts) else 0
+        partial = board ^ other_board
+        total.append(partial ^ carry)
+        carry = (board & other_board) | (partial & carry)
+    if carry:
+        total.append(carry)
+    return total
+
+
+def sum_counts(counts: Sequence[int], mask: int = -1) -> int:
+    """Return the total of a bit-sliced counter over the cells of a mask."""
+    return sum((board & mask).bit_count() << i for i, board in enumerate(counts))
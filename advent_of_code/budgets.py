@@ -0,0 +1,235 @@
+import os
+import subprocess
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from advent_of_code.lazy import is_installed, optional_import
+from advent_of_code.runner import Day
+
+if TYPE_CHECKING:
+    import resource
+else:
+    # Only POSIX has resource, so measure() fails on first use elsewhere.
+    resource = optional_import("resource")
+
+CALIBRATION_ROUNDS = 5
+# Best calibration time on the machine the budgets below were measured on.
+REFERENCE_CALIBRATION_SECONDS = 0.035
+MIB = 1 << 20
+MAX_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+STARTUP_ROUNDS = 5
+# Limits for starting an interpreter and solving a trivial day, directly and
+# through the command line.
+DAY_STARTUP_BUDGET_SECONDS = 0.05
+CLI_STARTUP_BUDGET_SECONDS = 0.15
+
+
+@dataclass(frozen=True)
+class Budget:
+    seconds: float
+    peak_size: int
+
+
+@dataclass(frozen=True)
+class Measurement:
+    seconds: float
+    peak_size: int
+
+
+# Limits for solving each part of the seeded 1x synthetic inputs: about twice the
+# measured time, at least 0.1s, and twice the measured memory, at least 16 MiB.
+BUDGETS: dict[tuple[int, int, int], Budget] = {
+    (2024, 1, 1): Budget(0.1, 16 * MIB),
+    (2024, 1, 2): Budget(0.1, 16 * MIB),
+    (2024, 2, 1): Budget(0.1, 16 * MIB),
+    (2024, 2, 2): Budget(0.1, 16 * MIB),
+    (2024, 3, 1): Budget(0.1, 16 * MIB),
+    (2024, 3, 2): Budget(0.1, 16 * MIB),
+    (2024, 4, 1): Budget(0.3, 16 * MIB),
+    (2024, 4, 2): Budget(0.2, 16 * MIB),
+    (2024, 5, 1): Budget(0.1, 16 * MIB),
+    (2024, 5, 2): Budget(0.1, 16 * MIB),
+    (2024, 6, 1): Budget(0.1, 16 * MIB),
+    (2024, 6, 2): Budget(10, 16 * MIB),
+    (2024, 7, 1): Budget(1.2, 16 * MIB),
+    (2024, 7, 2): Budget(90, 16 * MIB),
+    (2024, 8, 1): Budget(0.1, 16 * MIB),
+    (2024, 8, 2): Budget(0.1, 16 * MIB),
+    (2024, 9, 1): Budget(30, 16 * MIB),
+    (2024, 9, 2): Budget(220, 16 * MIB),
+    (2024, 10, 1): Budget(0.1, 16 * MIB),
+    (2024, 10, 2): Budget(0.1, 16 * MIB),
+    (2024, 11, 1): Budget(0.1, 16 * MIB),
+    (2024, 11, 2): Budget(0.7, 40 * MIB),
+    (2024, 12, 1): Budget(0.1, 16 * MIB),
+    (2024, 12, 2): Budget(0.1, 16 * MIB),
+    (2024, 13, 1): Budget(0.1, 16 * MIB),
+    (2024, 13, 2): Budget(0.1, 16 * MIB),
+    (2024, 14, 1): Budget(0.1, 16 * MIB),
+    (2024, 14, 2): Budget(0.1, 16 * MIB),
+    (2024, 15, 1): Budget(0.1, 16 * MIB),
+    (2024, 15, 2): Budget(0.1, 16 * MIB),
+    (2024, 16, 1): Budget(0.25, 16 * MIB),
+    (2024, 16, 2): Budget(0.25, 16 * MIB),
+    (2024, 17, 1): Budget(0.1, 16 * MIB),
+    (2024, 17, 2): Budget(0.1, 16 * MIB),
+    (2024, 18, 1): Budget(0.1, 16 * MIB),
+    (2024, 18, 2): Budget(0.25, 16 * MIB),
+    (2024, 19, 1): Budget(0.1, 16 * MIB),
+    (2024, 19, 2): Budget(0.1, 16 * MIB),
+    (2024, 20, 1): Budget(0.25, 16 * MIB),
+    (2024, 20, 2): Budget(0.25, 16 * MIB),
+}
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    seconds: float
+    cumulative_seconds: float
+
+
+def _calibration_workload() -> int:
+    counts: dict[int, int] = {}
+    for i in range(200_000):
+        key = i * 7919 % 1009
+        counts[key] = counts.get(key, 0) + i
+    return sum(sorted(counts.values())[::2])
+
+
+def calibrate(rounds: int = CALIBRATION_ROUNDS) -> float:
+    """Return how much slower this machine is than the reference machine."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        _calibration_workload()
+        best = min(best, perf_counter() - start)
+    return best / REFERENCE_CALIBRATION_SECONDS
+
+
+def can_measure() -> bool:
+    """Return whether measure() can read peak memory here, which needs POSIX."""
+    return is_installed(resource)
+
+
+def _get_max_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * MAX_RSS_UNIT
+
+
+def _measure_part(
+    day: Day, part: int, filepath: str, parse_kwargs: Mapping[str, int]
+) -> Measurement:
+    module = day.load()
+    solver = getattr(module, f"solve_part{part}")
+    baseline = _get_max_rss()
+    start = perf_counter()
+    solver(module.parse(filepath, **parse_kwargs))
+    seconds = perf_counter() - start
+    return Measurement(seconds, _get_max_rss() - baseline)
+
+
+def measure(
+    day: Day, part: int, filepath: str, parse_kwargs: Mapping[str, int] | None = None
+) -> Measurement:
+    """Solve a part in a fresh process, timing it and measuring its peak memory.
+
+    The fresh process starts with cold caches and its peak resident memory is the
+    part's own, which tracemalloc could only give at many times the runtime.
+    """
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+        future = executor.submit(
+            _measure_part, day, part, filepath, dict(parse_kwargs or {})
+        )
+        return future.result()
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    # Startup should be measured from cached bytecode, not from compiling sources.
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "PYTHONDONTWRITEBYTECODE"
+    }
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args], capture_output=True, check=True, env=env, text=True
+    )
+
+
+def measure_startup(*args: str, rounds: int = STARTUP_ROUNDS) -> float:
+    """Return the best wall time of running the interpreter with the arguments."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        _run_python(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def measure_import_times(*args: str) -> list[ImportTime]:
+    """Run the interpreter with -X importtime, returning the slowest imports first."""
+    import_times = []
+    for line in _run_python("-X", "importtime", *args).stderr.splitlines():
+        self_us, _, fields = line.removeprefix("import time:").partition("|")
+        cumulative_us, _, module = fields.partition("|")
+        if self_us.strip().isdigit():
+            import_times.append(
+                ImportTime(module.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6)
+            )
+    return sorted(
+        import_times, key=lambda import_time: import_time.seconds, reverse=True
+    )
+
+
+def check_startup(
+    seconds: float,
+    budget_seconds: float,
+    factor: float,
+    import_times: list[ImportTime],
+    top: int = 10,
+) -> str | None:
+    """Describe a startup over its budget with its slowest imports, or return None."""
+    seconds_limit = budget_seconds * factor
+    if seconds <= seconds_limit:
+        return None
+    lines = [
+        (
+            f"startup took {seconds:.3f}s, over its {seconds_limit:.3f}s limit "
+            f"({budget_seconds}s budget x {factor:.2f} machine factor); "
+            "slowest imports:"
+        )
+    ]
+    lines.extend(
+        f"  {import_time.seconds * 1e3:>7.1f} ms"
+        f" {import_time.cumulative_seconds * 1e3:>7.1f} ms cumulative"
+        f"  {import_time.module}"
+        for import_time in import_times[:top]
+    )
+    return "\n".join(lines)
+
+
+def check_budget(
+    key: tuple[int, int, int], measurement: Measurement, factor: float
+) -> str | None:
+    """Describe how a measurement exceeds its budget, or return None if it fits."""
+    budget = BUDGETS[key]
+    seconds_limit = budget.seconds * factor
+    problems = []
+    if measurement.seconds > seconds_limit:
+        problems.append(
+            f"took {measurement.seconds:.3f}s, over its {seconds_limit:.3f}s limit "
+            f"({budget.seconds}s budget x {factor:.2f} machine factor)"
+        )
+    if measurement.peak_size > budget.peak_size:
+        problems.append(
+            f"peaked at {measurement.peak_size:,} B, "
+            f"over its {budget.peak_size:,} B limit"
+        )
+    if not problems:
+        return None
+    year, day, part = key
+    return f"{year} day {day:02} part {part} " + " and ".join(problems)
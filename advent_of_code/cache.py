@@ -0,0 +1,194 @@
+import os
+from collections.abc import Callable
+from functools import wraps
+from importlib.util import find_spec
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Self
+
+from advent_of_code.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import ast
+    import hashlib
+    import json
+    import pickle
+    import sqlite3
+    import tempfile
+else:
+    # Every day module imports this for cached_parse, which usually does nothing.
+    ast = lazy_import("ast")
+    hashlib = lazy_import("hashlib")
+    json = lazy_import("json")
+    pickle = lazy_import("pickle")
+    sqlite3 = lazy_import("sqlite3")
+    tempfile = lazy_import("tempfile")
+
+CACHE_DIRPATH_ENV = "AOC_CACHE_DIR"
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"
+DEFAULT_CACHE_DIRPATH = ".cache"
+DEFAULT_ANSWER_STORE_SIZE = 10_000
+PACKAGE_NAME = "advent_of_code"
+
+type Answer = int | str
+
+
+def get_cache_dirpath() -> Path:
+    return Path(os.environ.get(CACHE_DIRPATH_ENV, DEFAULT_CACHE_DIRPATH))
+
+
+def is_parse_cache_enabled() -> bool:
+    return os.environ.get(PARSE_CACHE_ENV) == "1"
+
+
+def file_digest(filepath: str | Path) -> str:
+    with Path(filepath).open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def _find_module_filepath(module_name: str) -> Path | None:
+    try:
+        spec = find_spec(module_name)
+    except ModuleNotFoundError:
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin)
+
+
+def _find_package_imports(filepath: Path) -> set[str]:
+    imports: set[str] = set()
+    for node in ast.walk(ast.parse(filepath.read_bytes())):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.add(node.module)
+            imports.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {
+        name
+        for name in imports
+        if name == PACKAGE_NAME or name.startswith(f"{PACKAGE_NAME}.")
+    }
+
+
+def module_digest(module_name: str) -> str:
+    filepaths: dict[str, Path] = {}
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        filepath = _find_module_filepath(name)
+        if name in filepaths or filepath is None:
+            continue
+        filepaths[name] = filepath
+        pending.extend(_find_package_imports(filepath))
+    digest = hashlib.sha256()
+    for name, filepath in sorted(filepaths.items()):
+        digest.update(f"{name}:{file_digest(filepath)}\n".encode())
+    return digest.hexdigest()
+
+
+def _call_digest(filepath: str, *args: object, **kwargs: object) -> str:
+    call = repr((str(Path(filepath).resolve()), args, sorted(kwargs.items())))
+    return hashlib.sha256(call.encode()).hexdigest()[:16]
+
+
+def _write_atomically(filepath: Path, value: object) -> None:
+    with tempfile.NamedTemporaryFile(dir=filepath.parent, delete=False) as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    Path(file.name).replace(filepath)
+
+
+def _evict_stale(dirpath: Path, entry: Path) -> None:
+    call, _, source = entry.stem.split("-")
+    for path in dirpath.glob("*.pickle"):
+        if path == entry:
+            continue
+        path_call, _, path_source = path.stem.split("-")
+        if path_call == call or path_source != source:
+            path.unlink(missing_ok=True)
+
+
+# Called before every parse, to drop anything kept for the previous input.
+_parse_callbacks: list[Callable[[], object]] = []
+
+
+def on_parse(callback: Callable[[], object]) -> None:
+    _parse_callbacks.append(callback)
+
+
+def cached_parse[**P, T](parse: Callable[P, T]) -> Callable[P, T]:
+    @wraps(parse)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        for callback in _parse_callbacks:
+            callback()
+        if not is_parse_cache_enabled():
+            return parse(*args, **kwargs)
+        filepath = str(args[0])
+        dirpath = (
+            get_cache_dirpath() / "parsed" / f"{parse.__module__}.{parse.__qualname__}"
+        )
+        entry = dirpath / (
+            f"{_call_digest(filepath, *args[1:], **kwargs)}"
+            f"-{file_digest(filepath)}"
+            f"-{module_digest(parse.__module__)}.pickle"
+        )
+        try:
+            with entry.open("rb") as file:
+                value: T = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            value = parse(*args, **kwargs)
+            dirpath.mkdir(parents=True, exist_ok=True)
+            _write_atomically(entry, value)
+            _evict_stale(dirpath, entry)
+        return value
+
+    return wrapper
+
+
+class AnswerStore:
+    def __init__(
+        self, filepath: Path, max_size: int = DEFAULT_ANSWER_STORE_SIZE
+    ) -> None:
+        self.filepath = filepath
+        self.max_size = max_size
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(filepath, timeout=30)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS answers"
+                " (key TEXT PRIMARY KEY, answer TEXT NOT NULL, used REAL NOT NULL)"
+            )
+
+    @classmethod
+    def open_default(cls, max_size: int = DEFAULT_ANSWER_STORE_SIZE) -> Self:
+        return cls(get_cache_dirpath() / "answers.sqlite3", max_size)
+
+    def __len__(self) -> int:
+        (size,) = self.connection.execute("SELECT COUNT(*) FROM answers").fetchone()
+        return int(size)
+
+    def get(self, key: str) -> Answer | None:
+        with self.connection:
+            row = self.connection.execute(
+                "UPDATE answers SET used = ? WHERE key = ? RETURNING answer",
+                (time(), key),
+            ).fetchone()
+        if row is None:
+            return None
+        answer: Answer = json.loads(row[0])
+        return answer
+
+    def set(self, key: str, answer: Answer) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?)",
+                (key, json.dumps(answer), time()),
+            )
+            self.connection.execute(
+                "DELETE FROM answers WHERE key NOT IN"
+                " (SELECT key FROM answers ORDER BY used DESC LIMIT ?)",
+                (self.max_size,),
+            )
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import os
+from argparse import ArgumentParser, Namespace
+from contextlib import closing, nullcontext
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from advent_of_code.cache import (
+    DEFAULT_ANSWER_STORE_SIZE,
+    PARSE_CACHE_ENV,
+    AnswerStore,
+)
+from advent_of_code.lazy import lazy_import
+from advent_of_code.memory import DEFAULT_MEMORY_TOP, MemoryReport
+from advent_of_code.parallel import PARALLEL_BACKEND_ENV, Backend
+from advent_of_code.profiling import DEFAULT_PROFILE_TOP
+from advent_of_code.runner import (
+    DATA_DIRPATH,
+    PARTS,
+    Day,
+    PartResult,
+    RunOptions,
+    Task,
+    discover_days,
+    run_tasks,
+)
+
+if TYPE_CHECKING:
+    import json
+    from collections.abc import Sequence
+
+    from advent_of_code import batch, daemon, differential, spans
+else:
+    json = lazy_import("json")
+    batch = lazy_import("advent_of_code.batch")
+    daemon = lazy_import("advent_of_code.daemon")
+    differential = lazy_import("advent_of_code.differential")
+    spans = lazy_import("advent_of_code.spans")
+
+
+def _build_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python -m advent_of_code", description="Run Advent of Code solutions."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run and time solutions")
+    run_parser.add_argument("year", type=int)
+    run_parser.add_argument("days", type=int, nargs="*", help="default: all days")
+    run_parser.add_argument(
+        "--part", type=int, choices=PARTS, action="append", dest="parts"
+    )
+    run_parser.add_argument("--input", help="input filepath for a single day")
+    run_parser.add_argument("--data-dir", default=DATA_DIRPATH)
+    run_parser.add_argument("--workers", type=int, help="default: CPU count")
+    run_parser.add_argument(
+        "--backend",
+        type=Backend,
+        choices=list(Backend),
+        help=f"worker threads or processes, default: {PARALLEL_BACKEND_ENV} or auto",
+    )
+    run_parser.add_argument("--json", action="store_true", help="print JSON report")
+    run_parser.add_argument(
+        "--parse-cache", action="store_true", help="cache parsed inputs on disk"
+    )
+    run_parser.add_argument(
+        "--no-cache", action="store_true", help="recompute stored answers"
+    )
+    run_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_ANSWER_STORE_SIZE,
+        help="maximum number of stored answers",
+    )
+    run_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="profile parsing and solving, writing stats to DIR (implies --no-cache)",
+    )
+    run_parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_PROFILE_TOP,
+        help="functions in each profile summary",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace peak memory and allocations (implies --no-cache)",
+    )
+    run_parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=DEFAULT_MEMORY_TOP,
+        help="allocation sites and object types in each memory report",
+    )
+    run_parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="report solver event counters (implies --no-cache)",
+    )
+    run_parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="write timed phases to FILE as a Chrome/Perfetto trace "
+        "(implies --no-cache)",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve many inputs for one day, printing JSON lines"
+    )
+    batch_parser.add_argument("year", type=int)
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("inputs", help="input directory or glob pattern")
+    batch_parser.add_argument("--workers", type=int, help="default: CPU count")
+    batch_parser.add_argument(
+        "--backend",
+        type=Backend,
+        choices=list(Backend),
+        help=f"worker threads or processes, default: {PARALLEL_BACKEND_ENV} or auto",
+    )
+    batch_parser.add_argument("--chunksize", type=int, help="inputs per dispatch")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="solve inputs sent over a socket, keeping solvers warm"
+    )
+    address_group = serve_parser.add_mutually_exclusive_group()
+    address_group.add_argument(
+        "--socket", help="Unix socket path (default: .cache/daemon.sock)"
+    )
+    address_group.add_argument(
+        "--port", type=int, help="listen on localhost instead of a Unix socket"
+    )
+    serve_parser.add_argument("--workers", type=int, help="default: CPU count")
+
+    stress_parser = subparsers.add_parser(
+        "stress",
+        help="check solutions against reference solvers on generated inputs, "
+        "printing shrunk mismatches as JSON lines",
+    )
+    stress_parser.add_argument("year", type=int)
+    stress_parser.add_argument("days", type=int, nargs="*", help="default: all days")
+    stress_parser.add_argument(
+        "--seeds", type=int, default=10, help="inputs per day, seeded 0 upwards"
+    )
+    stress_parser.add_argument(
+        "--scale", type=float, default=0.1, help="input size relative to a real one"
+    )
+    return parser
+
+
+def _get_tasks(parser: ArgumentParser, args: Namespace) -> list[Task]:
+    available_days = discover_days(args.year)
+    if not available_days:
+        parser.error(f"no solutions found for {args.year}")
+    days = [day for day in available_days if not args.days or day.day in args.days]
+    missing_days = set(args.days) - {day.day for day in days}
+    if missing_days:
+        parser.error(f"no solutions found for days {sorted(missing_days)}")
+    if args.input and len(days) != 1:
+        parser.error("--input requires exactly one day")
+    return [
+        Task(day, part, args.input or day.get_input_filepath(args.data_dir))
+        for day in days
+        for part in args.parts or PARTS
+    ]
+
+
+def _format_result(result: PartResult) -> str:
+    return (
+        f"{result.year} day {result.day:02} part {result.part}: "
+        f"{result.answer!s:>20} {result.seconds:>10.3f}s"
+        f"{' (cached)' if result.cached else ''}"
+    )
+
+
+def _format_memory(memory: MemoryReport) -> str:
+    lines = [f"  peak memory: {memory.peak_size / 2**20:.1f} MiB"]
+    lines.extend(
+        f"  {allocation.size / 2**10:>10.1f} KiB {allocation.count:>8} blocks"
+        f"  {allocation.location}"
+        for allocation in memory.allocations
+    )
+    lines.extend(
+        f"  {count:>10} {type_name} objects"
+        for type_name, count in memory.object_counts.items()
+    )
+    return "\n".join(lines)
+
+
+def _run(tasks: list[Task], args: Namespace) -> None:
+    if args.parse_cache:
+        os.environ[PARSE_CACHE_ENV] = "1"
+    answer_store = (
+        None
+        if args.no_cache or args.profile or args.memory or args.counters or args.trace
+        else AnswerStore.open_default(args.cache_size)
+    )
+    options = RunOptions(
+        args.profile,
+        args.profile_top,
+        args.memory,
+        args.memory_top,
+        args.counters,
+        trace=args.trace is not None,
+    )
+    start = perf_counter()
+    results = []
+    with nullcontext() if answer_store is None else closing(answer_store):
+        for result in run_tasks(
+            tasks, args.workers, answer_store, options, args.backend
+        ):
+            results.append(result)
+            if not args.json:
+                print(_format_result(result))
+                for profile in result.profiles:
+                    print(profile.summary)
+                if result.memory is not None:
+                    print(_format_memory(result.memory))
+                for name, count in result.counters.items():
+                    print(f"  {name}: {count:,}")
+    seconds = perf_counter() - start
+    if args.trace:
+        spans.write_trace(
+            (span for result in results for span in result.spans), args.trace
+        )
+    if args.json:
+        report = {
+            "seconds": seconds,
+            "parts": [
+                result.to_dict()
+                for result in sorted(results, key=lambda r: (r.year, r.day, r.part))
+            ],
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Total: {seconds:.3f}s")
+
+
+def _batch(parser: ArgumentParser, args: Namespace) -> None:
+    day = Day(args.year, args.day)
+    if day not in discover_days(args.year):
+        parser.error(f"no solution found for {day}")
+    filepaths = batch.find_inputs(args.inputs)
+    if not filepaths:
+        parser.error(f"no inputs found for {args.inputs}")
+    for result in batch.run_batch(
+        day, filepaths, args.workers, args.chunksize, args.backend
+    ):
+        print(json.dumps(result.to_dict()), flush=True)
+
+
+def _serve(args: Namespace) -> None:
+    # Port 0 asks the OS for a free port, which the daemon reports once bound.
+    address = (
+        args.port
+        if args.port is not None
+        else args.socket or daemon.get_default_socket_path()
+    )
+    daemon.run_daemon(address, args.workers)
+
+
+def _stress(parser: ArgumentParser, args: Namespace) -> None:
+    available_days = differential.get_reference_days(args.year)
+    if not available_days:
+        parser.error(f"no reference solutions found for {args.year}")
+    days = [day for day in available_days if not args.days or day.day in args.days]
+    missing_days = set(args.days) - {day.day for day in days}
+    if missing_days:
+        parser.error(f"no reference solutions found for days {sorted(missing_days)}")
+    mismatch_count = 0
+    for mismatch in differential.run_differential(days, range(args.seeds), args.scale):
+        print(json.dumps(mismatch.to_dict()), flush=True)
+        mismatch_count += 1
+    if mismatch_count:
+        raise SystemExit(1)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        _run(_get_tasks(parser, args), args)
+    elif args.command == "batch":
+        _batch(parser, args)
+    elif args.command == "serve":
+        _serve(args)
+    elif args.command == "stress":
+        _stress(parser, args)
@@ -0,0 +1,38 @@
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class Counters:
+    """Named event counts that solvers bump and the runner reports.
+
+    Counting is off unless a collect() block is active, and incrementing is then a
+    single attribute check. Hot loops should tally locally and increment once.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] | None = None
+        # Without the GIL, threads could interleave an increment's read and write.
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.counts is not None
+
+    def increment(self, name: str, value: int = 1) -> None:
+        if self.counts is not None:
+            with self._lock:
+                self.counts[name] += value
+
+    @contextmanager
+    def collect(self) -> Iterator[Counter[str]]:
+        previous_counts = self.counts
+        self.counts = Counter()
+        try:
+            yield self.counts
+        finally:
+            self.counts = previous_counts
+
+
+counters = Counters()
@@ -0,0 +1,84 @@
+from collections.abc import Callable, Iterable
+from math import gcd
+from typing import NamedTuple
+
+
+class Cycle(NamedTuple):
+    # Steps taken before the first state of the cycle, and steps around it.
+    start: int
+    length: int
+
+
+def find_cycle_length[S](state: S, step: Callable[[S], S | None]) -> int | None:
+    """Return the length of the cycle that stepping from state ends in.
+
+    step returns None when the walk ends, in which case there is no cycle. Uses
+    Brent's algorithm, which keeps only the current state and one saved at each
+    power of two steps, so states need only be comparable and memory stays
+    constant however long the walk.
+    """
+    power = length = 1
+    saved = state
+    next_state = step(state)
+    while next_state is not None and next_state != saved:
+        if power == length:
+            saved = next_state
+            power *= 2
+            length = 0
+        next_state = step(next_state)
+        length += 1
+    return None if next_state is None else length
+
+
+def find_cycle[S](state: S, step: Callable[[S], S | None]) -> Cycle | None:
+    """Return where the cycle that stepping from state ends in starts and its length.
+
+    This walks up to twice more than find_cycle_length, so use that when the start
+    does not matter.
+    """
+    length = find_cycle_length(state, step)
+    if length is None:
+        return None
+
+    def advance(state: S) -> S:
+        next_state = step(state)
+        if next_state is None:
+            raise ValueError
+        return next_state
+
+    # Walkers a cycle length apart meet at the first state of the cycle.
+    tortoise = hare = state
+    for _ in range(length):
+        hare = advance(hare)
+    start = 0
+    while tortoise != hare:
+        tortoise, hare = advance(tortoise), advance(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def combine_periods(periods: Iterable[tuple[int, int]]) -> tuple[int, int] | None:
+    """Combine (offset, period) pairs into the one pair that satisfies them all.
+
+    Each pair stands for the steps t with t % period == offset, such as the steps
+    at which one axis of a simulation is in some state. The result is the first
+    such step for every pair at once and the period of the combined state, by the
+    Chinese remainder theorem, or None if no step satisfies them all. Periods need
+    not be coprime.
+    """
+    offset, period = 0, 1
+    for next_offset, next_period in periods:
+        divisor = gcd(period, next_period)
+        if (next_offset - offset) % divisor:
+            return None
+        # Find how many periods to add to the offset to also meet next_offset.
+        reduced_period = next_period // divisor
+        periods_to_add = (
+            (next_offset - offset)
+            // divisor
+            * pow(period // divisor, -1, reduced_period)
+            % reduced_period
+        )
+        offset += periods_to_add * period
+        period *= reduced_period
+    return offset, period
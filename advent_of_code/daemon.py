@@ -0,0 +1,223 @@
+import asyncio
+import json
+import os
+import socket
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from importlib import import_module
+from itertools import count
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from advent_of_code.cache import Answer, get_cache_dirpath
+from advent_of_code.memo import Scope, memo_scope
+from advent_of_code.parallel import limit_workers
+from advent_of_code.runner import PARTS, Day, discover_days
+
+SOCKET_FILENAME = "daemon.sock"
+LOCALHOST = "127.0.0.1"
+
+# A Unix socket path, or a port on localhost.
+type Address = str | int
+
+
+def get_default_socket_path() -> str:
+    return str(get_cache_dirpath() / SOCKET_FILENAME)
+
+
+def _init_worker(module_names: list[str]) -> None:
+    limit_workers()
+    for module_name in module_names:
+        import_module(module_name)
+
+
+def _solve_part(module_name: str, part: int, filepath: str) -> tuple[Answer, float]:
+    module = import_module(module_name)
+    start = perf_counter()
+    with memo_scope(Scope.RUN):
+        answer = getattr(module, f"solve_part{part}")(module.parse(filepath))
+    return answer, perf_counter() - start
+
+
+class DaemonMetrics:
+    """Request counts and latencies since the daemon started.
+
+    Queue time is everything a request spends outside its solver: waiting for a
+    free worker and passing the request and answer between processes.
+    """
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+        self.solve_seconds = 0.0
+        self.day_requests: Counter[str] = Counter()
+
+    def record(self, day: Day, queue_seconds: float, solve_seconds: float) -> None:
+        self.requests += 1
+        self.day_requests[str(day)] += 1
+        self.queue_seconds += queue_seconds
+        self.max_queue_seconds = max(self.max_queue_seconds, queue_seconds)
+        self.solve_seconds += solve_seconds
+
+    def to_dict(self) -> dict[str, object]:
+        uptime = perf_counter() - self.start
+        solved = max(self.requests, 1)
+        return {
+            "uptime_seconds": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "mean_queue_seconds": self.queue_seconds / solved,
+            "max_queue_seconds": self.max_queue_seconds,
+            "mean_solve_seconds": self.solve_seconds / solved,
+            "requests_per_second": self.requests / uptime,
+            "day_requests": dict(sorted(self.day_requests.items())),
+        }
+
+
+class SolverDaemon:
+    """Solve parts of inputs sent over a socket, keeping the solvers warm.
+
+    Each request is a JSON header line, {"year", "day", "part", "size"}, followed
+    by size bytes of input, and gets one JSON line back. {"command": "metrics"}
+    gets the metrics instead. Solving happens in long-lived worker processes, so
+    imports, compiled patterns and caches kept by the days survive between
+    requests.
+    """
+
+    def __init__(self, executor: Executor, input_dirpath: Path) -> None:
+        self.executor = executor
+        self.input_dirpath = input_dirpath
+        self.days = set(discover_days())
+        self.metrics = DaemonMetrics()
+        self._input_ids = count()
+
+    async def start(self, address: Address) -> asyncio.Server:
+        if isinstance(address, int):
+            return await asyncio.start_server(self.handle, LOCALHOST, address)
+        return await asyncio.start_unix_server(self.handle, address)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while header := await reader.readline():
+                try:
+                    request = json.loads(header)
+                    if request.get("command") == "metrics":
+                        response = self.metrics.to_dict()
+                    else:
+                        data = await reader.readexactly(int(request["size"]))
+                        response = await self.solve(request, data)
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # The rest of the stream cannot be framed, so drop it.
+                    writer.write(b'{"error": "invalid request"}\n')
+                    break
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def solve(self, request: dict[str, object], data: bytes) -> dict[str, object]:
+        start = perf_counter()
+        day = Day(int(str(request["year"])), int(str(request["day"])))
+        part = int(str(request["part"]))
+        if day not in self.days or part not in PARTS:
+            self.metrics.errors += 1
+            return {"error": f"no solution found for {day} part {part}"}
+        filepath = self.input_dirpath / str(next(self._input_ids))
+        filepath.write_bytes(data)
+        self.metrics.in_flight += 1
+        try:
+            answer, seconds = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _solve_part, day.module_name, part, str(filepath)
+            )
+        except Exception as error:  # noqa: BLE001
+            self.metrics.errors += 1
+            return {"error": repr(error)}
+        finally:
+            self.metrics.in_flight -= 1
+            filepath.unlink()
+        queue_seconds = perf_counter() - start - seconds
+        self.metrics.record(day, queue_seconds, seconds)
+        return {
+            "year": day.year,
+            "day": day.day,
+            "part": part,
+            "answer": answer,
+            "seconds": seconds,
+            "queue_seconds": queue_seconds,
+        }
+
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    """Start worker processes with every day imported.
+
+    Workers are spawned because forking the running event loop's process leaves
+    copies of its sockets in the children.
+    """
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=([day.module_name for day in discover_days()],),
+    )
+
+
+def get_server_address(server: asyncio.Server) -> Address:
+    """Return the socket path or port a server is bound to."""
+    name = server.sockets[0].getsockname()
+    return int(name[1]) if isinstance(name, tuple) else str(name)
+
+
+async def _serve(address: Address, workers: int) -> None:
+    with (
+        create_executor(workers) as executor,
+        TemporaryDirectory() as input_dirpath,
+    ):
+        daemon = SolverDaemon(executor, Path(input_dirpath))
+        async with await daemon.start(address) as server:
+            print(f"Serving on {get_server_address(server)}", flush=True)
+            await server.serve_forever()
+
+
+def run_daemon(address: Address, workers: int | None = None) -> None:
+    if isinstance(address, str):
+        Path(address).parent.mkdir(parents=True, exist_ok=True)
+    asyncio.run(_serve(address, workers or os.cpu_count() or 1))
+
+
+def _request(
+    address: Address, header: Mapping[str, object], data: bytes = b""
+) -> dict[str, object]:
+    if isinstance(address, int):
+        connection = socket.create_connection((LOCALHOST, address))
+    else:
+        connection = socket.socket(socket.AF_UNIX)
+        connection.connect(address)
+    with connection, connection.makefile("rwb") as file:
+        file.write(json.dumps(header).encode() + b"\n" + data)
+        file.flush()
+        response: dict[str, object] = json.loads(file.readline())
+    return response
+
+
+def solve_remote(
+    address: Address, day: Day, part: int, data: bytes
+) -> dict[str, object]:
+    """Ask a running daemon to solve a part of an input."""
+    header = {"year": day.year, "day": day.day, "part": part, "size": len(data)}
+    return _request(address, header, data)
+
+
+def get_metrics(address: Address) -> dict[str, object]:
+    return _request(address, {"command": "metrics"})
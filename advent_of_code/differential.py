@@ -0,0 +1,187 @@
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from advent_of_code.cache import Answer
+from advent_of_code.memo import Scope, memo_scope
+from advent_of_code.runner import Day
+
+DEFAULT_SCALE = 0.1
+
+# Answers, or the name of the exception raised instead.
+type Outcome = tuple[Answer, ...] | str
+# The exception a day raised, or the parts it got wrong.
+type FailureKind = tuple[int, ...] | str
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    year: int
+    day: int
+    seed: int
+    scale: float
+    data: str
+    solve_kwargs: dict[str, int]
+    expected: tuple[Answer, ...]
+    actual: Outcome
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "year": self.year,
+            "day": self.day,
+            "seed": self.seed,
+            "scale": self.scale,
+            "data": self.data,
+            "solve_kwargs": self.solve_kwargs,
+            "expected": self.expected,
+            "actual": self.actual,
+        }
+
+
+def _get_outcome(solve: Callable[..., Any], *args: object, **kwargs: object) -> Outcome:
+    try:
+        return tuple(solve(*args, **kwargs))
+    except Exception as error:  # noqa: BLE001
+        return type(error).__name__
+
+
+def solve_text(day: Day, data: str, solve_kwargs: dict[str, int]) -> Outcome:
+    """Solve an input held in memory with a day's own solver."""
+    with TemporaryDirectory() as dirpath:
+        filepath = Path(dirpath) / "input"
+        filepath.write_text(data)
+        with memo_scope(Scope.RUN):
+            return _get_outcome(day.load().solve, str(filepath), **solve_kwargs)
+
+
+def compare(
+    day: Day, data: str, solve_kwargs: dict[str, int]
+) -> tuple[tuple[Answer, ...], Outcome] | None:
+    """Return the reference's and the day's answers to an input if they differ.
+
+    Inputs the reference rejects are outside the puzzle, so never differ.
+    """
+    reference = import_module(f"advent_of_code.year_{day.year}.reference")
+    expected = _get_outcome(reference.REFERENCES[day.day], data, **solve_kwargs)
+    if isinstance(expected, str):
+        return None
+    actual = solve_text(day, data, solve_kwargs)
+    return None if actual == expected else (expected, actual)
+
+
+def get_failure_kind(expected: tuple[Answer, ...], actual: Outcome) -> FailureKind:
+    if isinstance(actual, str):
+        return actual
+    return tuple(
+        part
+        for part, (answer, actual_answer) in enumerate(
+            zip(expected, actual, strict=False), 1
+        )
+        if answer != actual_answer
+    )
+
+
+def _iter_removals[T](items: list[T]) -> Iterator[list[T]]:
+    """Yield items with a run of them removed, from the longest runs."""
+    size = len(items)
+    while size:
+        for start in range(0, len(items), size):
+            yield items[:start] + items[start + size :]
+        size //= 2
+
+
+def _split_tokens(line: str) -> list[str]:
+    # Each token keeps the separators after it, so removing one keeps the rest.
+    return re.findall(r"[^ ,]+[ ,]*|[ ,]+", line)
+
+
+def _iter_paragraph_candidates(paragraph: str) -> Iterator[str]:
+    lines = paragraph.split("\n")
+    for kept_lines in _iter_removals(lines):
+        yield "\n".join(kept_lines)
+    # Grids shrink by columns too, which for a single line are its characters.
+    if len({len(line) for line in lines}) == 1:
+        for kept_columns in _iter_removals(list(zip(*lines, strict=True))):
+            yield "\n".join(map("".join, zip(*kept_columns, strict=True)))
+    for i, line in enumerate(lines):
+        tokens = _split_tokens(line)
+        if len(tokens) > 1:
+            for kept_tokens in _iter_removals(tokens):
+                kept_line = "".join(kept_tokens).rstrip(" ,")
+                yield "\n".join([*lines[:i], kept_line, *lines[i + 1 :]])
+
+
+def _iter_candidates(data: str) -> Iterator[str]:
+    """Yield smaller versions of an input, from the most removed."""
+    paragraphs = data.split("\n\n")
+    if len(paragraphs) > 1:
+        for kept_paragraphs in _iter_removals(paragraphs):
+            yield "\n\n".join(kept_paragraphs)
+    for i, paragraph in enumerate(paragraphs):
+        for candidate in _iter_paragraph_candidates(paragraph):
+            yield "\n\n".join([*paragraphs[:i], candidate, *paragraphs[i + 1 :]])
+
+
+def shrink(data: str, is_failing: Callable[[str], bool]) -> str:
+    """Return a version of a failing input that no removal keeps failing.
+
+    Removes paragraphs, lines, grid columns and the tokens of lines, trying the
+    largest removals first and starting over from each smaller input that fails.
+    """
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for candidate in _iter_candidates(data):
+            if candidate != data and is_failing(candidate):
+                data = candidate
+                shrunk = True
+                break
+    return data
+
+
+def check_seed(day: Day, seed: int, scale: float = DEFAULT_SCALE) -> Mismatch | None:
+    """Check a day against its reference on a generated input, shrinking a mismatch.
+
+    The shrunk input fails in the same way as the generated one, raising the same
+    exception or getting the same parts wrong.
+    """
+    generators = import_module(f"advent_of_code.year_{day.year}.generators")
+    synthetic_input = generators.generate_input(day.day, scale, seed)
+    solve_kwargs = synthetic_input.solve_kwargs
+    difference = compare(day, synthetic_input.data, solve_kwargs)
+    if difference is None:
+        return None
+    failure_kind = get_failure_kind(*difference)
+
+    def is_failing(data: str) -> bool:
+        difference = compare(day, data, solve_kwargs)
+        return difference is not None and get_failure_kind(*difference) == failure_kind
+
+    data = shrink(synthetic_input.data, is_failing)
+    expected, actual = compare(day, data, solve_kwargs) or difference
+    return Mismatch(
+        day.year, day.day, seed, scale, data, solve_kwargs, expected, actual
+    )
+
+
+def get_reference_days(year: int) -> list[Day]:
+    try:
+        reference = import_module(f"advent_of_code.year_{year}.reference")
+    except ModuleNotFoundError:
+        return []
+    return [Day(year, day) for day in sorted(reference.REFERENCES)]
+
+
+def run_differential(
+    days: Iterable[Day], seeds: Iterable[int], scale: float = DEFAULT_SCALE
+) -> Iterator[Mismatch]:
+    seeds = list(seeds)
+    for day in days:
+        for seed in seeds:
+            mismatch = check_seed(day, seed, scale)
+            if mismatch is not None:
+                yield mismatch
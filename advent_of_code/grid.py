@@ -0,0 +1,103 @@
+from collections.abc import Buffer, Iterator
+from typing import Self
+
+from advent_of_code.inputs import NEWLINE, strip_newlines
+
+BORDER = 0
+
+
+class Grid:
+    """Row-major cells in one bytearray, surrounded by BORDER sentinels.
+
+    Each row is followed by a border cell, so a neighbour is always one offset away
+    and stepping off the grid lands on a border cell instead of out of range.
+    """
+
+    __slots__ = ("cells", "diagonal_offsets", "height", "offsets", "stride", "width")
+
+    def __init__(self, cells: bytearray, width: int, height: int) -> None:
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+        # Up, right, down, left: turning clockwise is (i + 1) % 4.
+        self.offsets = (-self.stride, 1, self.stride, -1)
+        self.diagonal_offsets = (
+            -self.stride - 1,
+            -self.stride + 1,
+            self.stride + 1,
+            self.stride - 1,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (
+            other.width,
+            other.height,
+            other.cells,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.width, self.height, bytes(self.cells)))
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[self.index(0, y) : self.index(self.width, y)].decode()
+            for y in range(self.height)
+        )
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> Self:
+        # Copy the rows once and turn their newlines into borders in place.
+        cells = bytearray(strip_newlines(data))
+        width = cells.find(NEWLINE)
+        if width == -1:
+            width = len(cells)
+        height = (len(cells) + 1) // (width + 1)
+        cells[width :: width + 1] = bytes([BORDER]) * (height - 1)
+        padding = bytes([BORDER]) * (width + 2)
+        cells[:0] = padding
+        cells += padding
+        return cls(cells, width, height)
+
+    @classmethod
+    def from_str(cls, data: str) -> Self:
+        return cls.from_bytes(data.encode())
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: int) -> Self:
+        return cls.from_bytes(b"\n".join([bytes([value]) * width] * height))
+
+    def copy(self) -> Self:
+        return type(self)(self.cells.copy(), self.width, self.height)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i - 1, self.stride)
+        return x, y - 1
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.width > x >= 0 and self.height > y >= 0
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.stride + dx
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: int) -> int:
+        return self.cells.index(value)
+
+    def find_all(self, value: int) -> list[int]:
+        return [i for i in self.indices() if self.cells[i] == value]
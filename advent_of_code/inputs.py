@@ -0,0 +1,92 @@
+import mmap
+import os
+from array import array
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from itertools import batched
+from pathlib import Path
+
+from advent_of_code.lazy import LazyPattern
+from advent_of_code.spans import spans
+
+NEWLINE = ord("\n")
+SPACE = ord(" ")
+INT_BYTES = b"-0123456789"
+# Keeps digits and minus signs and blanks everything else.
+INT_TABLE = bytes(byte if byte in INT_BYTES else SPACE for byte in range(256))
+INT_PATTERN = LazyPattern(rb"-?[0-9]+")
+# Numbers are parsed from copies of this many bytes at a time, rounded up to whole
+# lines, so a mapped input is never copied onto the heap in full.
+CHUNK_SIZE = 1 << 16
+
+
+@spans.traced("read")
+def map_bytes(filepath: str) -> memoryview:
+    """Return a read-only view of a file mapped into memory.
+
+    Pages are read on demand and shared with the page cache, so scanning a large
+    input never copies it onto the heap. The mapping closes with its last view.
+    """
+    with Path(filepath).open("rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def strip_newlines(data: Buffer) -> memoryview:
+    view = memoryview(data)
+    end = len(view)
+    while end and view[end - 1] == NEWLINE:
+        end -= 1
+    return view[:end]
+
+
+def iter_chunks(data: Buffer) -> Iterator[bytes]:
+    """Yield copies of the data in chunks of about CHUNK_SIZE bytes of whole lines."""
+    view = memoryview(data)
+    start = 0
+    while start < len(view):
+        end = min(start + CHUNK_SIZE, len(view))
+        while end < len(view) and view[end - 1] != NEWLINE:
+            end += 1
+        yield bytes(view[start:end])
+        start = end
+
+
+def _parse_ints[T](data: bytes, collect: Callable[[Iterable[int]], T]) -> T:
+    # Blanking everything but the numbers lets bytes.split and int do the scanning
+    # in C. A stray minus sign makes int fail, and the numbers are then found by
+    # regex.
+    try:
+        return collect(map(int, data.translate(INT_TABLE).split()))
+    except ValueError:
+        return collect(map(int, INT_PATTERN.compiled.findall(data)))
+
+
+def _to_array(ints: Iterable[int]) -> array[int]:
+    return array("q", ints)
+
+
+def extract_ints(data: Buffer) -> array[int]:
+    """Return every signed integer in the data, in order, in one pass.
+
+    Raises OverflowError for numbers that do not fit in 64 bits.
+    """
+    ints = array("q")
+    for chunk in iter_chunks(data):
+        ints += _parse_ints(chunk, _to_array)
+    return ints
+
+
+def extract_records(data: Buffer, width: int) -> Iterator[tuple[int, ...]]:
+    """Yield the signed integers in the data in groups of width."""
+    return batched(extract_ints(data), width, strict=True)
+
+
+def extract_int_lines(data: Buffer) -> list[list[int]]:
+    """Return the signed integers of any size on each line of the data that has any."""
+    return [
+        ints
+        for chunk in iter_chunks(data)
+        for line in chunk.splitlines()
+        if (ints := _parse_ints(line, list))
+    ]
@@ -0,0 +1,80 @@
+import re
+import sys
+from functools import cached_property
+from importlib import import_module
+from importlib.util import LazyLoader, find_spec, module_from_spec
+from types import ModuleType
+
+
+class _SubmoduleProxy(ModuleType):
+    """Stands in for a submodule whose package would be imported to find it."""
+
+    def __getattr__(self, attr: str) -> object:
+        return getattr(import_module(self.__name__), attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is only executed on its first attribute access.
+
+    Import the module again under TYPE_CHECKING so that its name keeps its types.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    package_name, _, child_name = name.rpartition(".")
+    # Finding a submodule executes its package, even one returned lazily here.
+    if package_name and type(sys.modules.get(package_name)) is not ModuleType:
+        return _SubmoduleProxy(name)
+    spec = find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(name=name)
+    loader = LazyLoader(spec.loader)
+    spec.loader = loader
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    # Bind a submodule on its package, as the import system does when loading it.
+    if package_name:
+        setattr(sys.modules[package_name], child_name, module)
+    return module
+
+
+class _MissingModule(ModuleType):
+    """Stands in for an optional module that is not installed."""
+
+    def __getattr__(self, attr: str) -> object:
+        raise ModuleNotFoundError(name=self.__name__)
+
+
+def optional_import(name: str) -> ModuleType:
+    """Return lazy_import(name), or a stand-in if the module is not installed.
+
+    The stand-in raises ModuleNotFoundError on its first attribute access, so code
+    that only uses an optional dependency when it is installed can import it
+    unconditionally.
+    """
+    try:
+        return lazy_import(name)
+    except ModuleNotFoundError:
+        return _MissingModule(name)
+
+
+def is_installed(module: ModuleType) -> bool:
+    """Return whether a module from optional_import is installed, without loading it."""
+    return type(module) is not _MissingModule
+
+
+def is_loaded(module: ModuleType) -> bool:
+    """Return whether a module from lazy_import has been executed."""
+    return type(module) is ModuleType
+
+
+class LazyPattern[T: (str, bytes)]:
+    """A regular expression compiled on first use rather than at import."""
+
+    def __init__(self, pattern: T) -> None:
+        self.pattern: T = pattern
+
+    @cached_property
+    def compiled(self) -> re.Pattern[T]:
+        return re.compile(self.pattern)
@@ -0,0 +1,218 @@
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from enum import IntEnum
+from functools import lru_cache, partial, update_wrapper
+from threading import Lock
+from typing import Any, NamedTuple, Protocol, cast
+from weakref import WeakSet
+
+from advent_of_code.cache import on_parse
+
+# Bytes an entry costs beyond its key and value, for its place in the dict.
+ENTRY_OVERHEAD = 100
+
+
+class Scope(IntEnum):
+    """How long a memo's entries may live, from shortest to longest.
+
+    INPUT entries are dropped whenever a day parses an input, RUN entries after
+    each part the runner, batch or daemon solves and GLOBAL entries only when
+    evicted.
+    """
+
+    INPUT = 0
+    RUN = 1
+    GLOBAL = 2
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class Memo(ABC):
+    """The limits, statistics and scope behind a memoized function."""
+
+    def __init__(
+        self, max_size: int | None, max_bytes: int | None, scope: Scope
+    ) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.scope = scope
+
+    @abstractmethod
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]: ...
+
+    @abstractmethod
+    def info(self) -> MemoInfo: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class _CountedMemo(Memo):
+    # Bounded by entry count only, so functools does the caching in C.
+
+    def __init__(self, max_size: int | None, scope: Scope) -> None:
+        super().__init__(max_size, None, scope)
+        self.cached: Any = None
+        self.stored = 0
+        self.evictions = 0
+        # Clearing also resets the statistics of functools, so keep them here.
+        self.cleared_hits = 0
+        self.cleared_misses = 0
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        if self.max_size:
+            func = self._count_evictions(func, self.max_size)
+        self.cached = lru_cache(maxsize=self.max_size)(func)
+        return cast("Callable[..., Any]", self.cached)
+
+    def _count_evictions(
+        self, func: Callable[..., Any], max_size: int
+    ) -> Callable[..., Any]:
+        # Only misses reach func, and functools stores the result of each, evicting
+        # the least recently used result once the cache is full.
+        def wrapper(*args: object, **kwargs: object) -> object:
+            value = func(*args, **kwargs)
+            if self.stored < max_size:
+                self.stored += 1
+            else:
+                self.evictions += 1
+            return value
+
+        return update_wrapper(wrapper, func)
+
+    def info(self) -> MemoInfo:
+        hits, misses, _, size = self.cached.cache_info()
+        hits += self.cleared_hits
+        misses += self.cleared_misses
+        return MemoInfo(hits, misses, self.evictions, size)
+
+    def clear(self) -> None:
+        hits, misses, _, _ = self.cached.cache_info()
+        self.cleared_hits += hits
+        self.cleared_misses += misses
+        self.stored = 0
+        self.cached.cache_clear()
+
+
+def _get_entry_size(key: object, value: object) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value) + ENTRY_OVERHEAD
+
+
+class _SizedMemo(Memo):
+    # Bounded by the shallow sizes of its keys and values as well. The lock guards
+    # the entries and counters but is not held while func runs, so recursive and
+    # concurrent calls may compute the same result.
+
+    def __init__(self, max_size: int | None, max_bytes: int, scope: Scope) -> None:
+        super().__init__(max_size, max_bytes, scope)
+        self.lock = Lock()
+        self.entries: OrderedDict[Hashable, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.byte_size = 0
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        entries = self.entries
+        lock = self.lock
+
+        def wrapper(*args: object, **kwargs: object) -> object:
+            key = (args, tuple(kwargs.items())) if kwargs else args
+            with lock:
+                if key in entries:
+                    self.hits += 1
+                    entries.move_to_end(key)
+                    return entries[key]
+                self.misses += 1
+            value = func(*args, **kwargs)
+            with lock:
+                self._store(key, value)
+            return value
+
+        return update_wrapper(wrapper, func)
+
+    def _store(self, key: Hashable, value: object) -> None:
+        # A recursive call may have stored the key already.
+        if key in self.entries:
+            return
+        self.entries[key] = value
+        self.byte_size += _get_entry_size(key, value)
+        while self.entries and (
+            len(self.entries) > (self.max_size or sys.maxsize)
+            or self.byte_size > (self.max_bytes or 0)
+        ):
+            evicted_key, evicted_value = self.entries.popitem(last=False)
+            self.evictions += 1
+            self.byte_size -= _get_entry_size(evicted_key, evicted_value)
+
+    def info(self) -> MemoInfo:
+        with self.lock:
+            return MemoInfo(self.hits, self.misses, self.evictions, len(self.entries))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.byte_size = 0
+
+
+class Memoized[**P, R](Protocol):
+    memo: Memo
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+
+
+_memos: WeakSet[Memo] = WeakSet()
+
+
+def memoize[**P, R](
+    max_size: int | None = None,
+    max_bytes: int | None = None,
+    scope: Scope = Scope.GLOBAL,
+) -> Callable[[Callable[P, R]], Memoized[P, R]]:
+    """Memoize a function, evicting its least recently used results.
+
+    Results are limited to max_size entries and, if max_bytes is set, to about
+    that many bytes of keys and values, measured shallowly. The function's memo
+    attribute has its statistics. Arguments must be hashable.
+    """
+
+    def decorator(func: Callable[P, R]) -> Memoized[P, R]:
+        memo: Memo = (
+            _CountedMemo(max_size, scope)
+            if max_bytes is None
+            else _SizedMemo(max_size, max_bytes, scope)
+        )
+        memoized = cast("Memoized[P, R]", memo.wrap(func))
+        memoized.memo = memo
+        _memos.add(memo)
+        return memoized
+
+    return decorator
+
+
+def clear_memos(scope: Scope) -> None:
+    """Drop the results of every memo whose scope ends with the given one."""
+    for memo in list(_memos):
+        if memo.scope <= scope:
+            memo.clear()
+
+
+# cached_parse cannot import this, as every day imports it and few memoize.
+on_parse(partial(clear_memos, Scope.INPUT))
+
+
+@contextmanager
+def memo_scope(scope: Scope) -> Iterator[None]:
+    """Clear the memos of a scope when the block exits."""
+    try:
+        yield
+    finally:
+        clear_memos(scope)
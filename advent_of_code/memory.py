@@ -0,0 +1,83 @@
+import gc
+from collections import Counter
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from advent_of_code.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import tracemalloc
+else:
+    tracemalloc = lazy_import("tracemalloc")
+
+DEFAULT_MEMORY_TOP = 10
+
+
+@dataclass(frozen=True)
+class Allocation:
+    location: str
+    size: int
+    count: int
+
+    def to_dict(self) -> dict[str, object]:
+        return {"location": self.location, "size": self.size, "count": self.count}
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    peak_size: int
+    allocations: tuple[Allocation, ...]
+    object_counts: dict[str, int]
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "peak_size": self.peak_size,
+            "allocations": [allocation.to_dict() for allocation in self.allocations],
+            "object_counts": self.object_counts,
+        }
+
+
+def _count_objects() -> Counter[str]:
+    return Counter(type(obj).__qualname__ for obj in gc.get_objects())
+
+
+class MemoryTracer:
+    """Trace allocations made inside a with block.
+
+    The report lists the allocation sites still holding memory and the gc-tracked
+    objects created since the block was entered, so it should be taken while the
+    interesting state is alive.
+    """
+
+    def __init__(self) -> None:
+        self.object_counts: Counter[str] = Counter()
+
+    def __enter__(self) -> Self:
+        gc.collect()
+        self.object_counts = _count_objects()
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        tracemalloc.stop()
+
+    def report(self, top: int = DEFAULT_MEMORY_TOP) -> MemoryReport:
+        _, peak_size = tracemalloc.get_traced_memory()
+        object_counts = _count_objects() - self.object_counts
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+        )
+        allocations = tuple(
+            Allocation(str(statistic.traceback), statistic.size, statistic.count)
+            for statistic in snapshot.statistics("lineno")[:top]
+        )
+        return MemoryReport(
+            peak_size, allocations, dict(object_counts.most_common(top))
+        )
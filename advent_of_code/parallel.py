@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+import threading
+from collections.abc import Buffer
+from contextlib import ExitStack, contextmanager, nullcontext
+from enum import StrEnum
+from typing import TYPE_CHECKING, NamedTuple
+
+from advent_of_code.counters import counters
+from advent_of_code.lazy import lazy_import
+from advent_of_code.spans import Span, spans
+
+if TYPE_CHECKING:
+    import multiprocessing
+    from collections import Counter
+    from collections.abc import Callable, Iterator, Sequence
+    from concurrent import futures
+    from multiprocessing import shared_memory
+else:
+    multiprocessing = lazy_import("multiprocessing")
+    futures = lazy_import("concurrent.futures")
+    shared_memory = lazy_import("multiprocessing.shared_memory")
+
+PARALLEL_WORKERS_ENV = "AOC_WORKERS"
+PARALLEL_BACKEND_ENV = "AOC_BACKEND"
+DEFAULT_MIN_ITEMS = 64
+# Each chunk takes this share of the remaining items per worker, so chunks shrink
+# towards the end and uneven items still finish together.
+CHUNK_FRACTION = 2
+
+# Pools are kept between maps, one per backend and worker count, as starting
+# processes takes longer than many maps.
+_executors: dict[tuple[Backend, int], futures.Executor] = {}
+_executors_lock = threading.Lock()
+_map_ids = itertools.count()
+# The map whose args a process worker holds, attached once for all its chunks.
+_worker_map_id: int | None = None
+_worker_args: tuple[object, ...] = ()
+_worker_shared_memory: list[shared_memory.SharedMemory] = []
+# Set in pool workers, which already run one per CPU.
+_limits = threading.local()
+
+
+class Backend(StrEnum):
+    AUTO = "auto"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def is_free_threaded() -> bool:
+    """Return whether this interpreter is running without the GIL."""
+    return not sys._is_gil_enabled()  # noqa: SLF001
+
+
+def get_backend(backend: Backend | None = None) -> Backend:
+    """Resolve a backend, by default from AOC_BACKEND.
+
+    auto picks threads when the interpreter is free-threaded and processes
+    otherwise, as threads holding the GIL would take turns.
+    """
+    backend = backend or Backend(os.environ.get(PARALLEL_BACKEND_ENV, Backend.AUTO))
+    if backend is Backend.AUTO:
+        return Backend.THREAD if is_free_threaded() else Backend.PROCESS
+    return backend
+
+
+def _get_buffer(memory: shared_memory.SharedMemory) -> memoryview:
+    if memory.buf is None:
+        raise ValueError
+    return memory.buf
+
+
+class SharedBuffer(NamedTuple):
+    """The name of a buffer placed in shared memory, which workers attach to.
+
+    A named tuple rather than a dataclass, so days can import this cheaply.
+    """
+
+    name: str
+    size: int
+    format: str
+
+    def attach(self) -> memoryview:
+        memory = shared_memory.SharedMemory(self.name, track=False)
+        _worker_shared_memory.append(memory)
+        view: memoryview = _get_buffer(memory)[: self.size].cast(
+            self.format  # type: ignore[call-overload]
+        )
+        return view.toreadonly()
+
+
+def get_workers() -> int:
+    """Return how many workers a parallel map may use.
+
+    Workers limited by limit_workers and daemonic pool workers, which cannot start
+    processes of their own, always map in-process. Otherwise AOC_WORKERS overrides
+    the CPU count.
+    """
+    if getattr(_limits, "limited", False) or multiprocessing.current_process().daemon:
+        return 1
+    workers = os.environ.get(PARALLEL_WORKERS_ENV)
+    if workers is not None:
+        return max(1, int(workers))
+    return os.process_cpu_count() or 1
+
+
+def limit_workers() -> None:
+    """Keep maps in-process in a pool that already runs a worker per CPU.
+
+    This applies to the calling thread, which in a pool is the one running tasks.
+    """
+    _limits.limited = True
+
+
+@contextmanager
+def limited_workers() -> Iterator[None]:
+    """Keep maps in the calling thread in-process until the block exits."""
+    limited = getattr(_limits, "limited", False)
+    _limits.limited = True
+    try:
+        yield
+    finally:
+        _limits.limited = limited
+
+
+def get_chunks(item_count: int, workers: int) -> Iterator[range]:
+    start = 0
+    while start < item_count:
+        size = max(1, (item_count - start) // (workers * CHUNK_FRACTION))
+        yield range(start, min(start + size, item_count))
+        start += size
+
+
+def _share(stack: ExitStack, arg: object) -> object:
+    if not isinstance(arg, Buffer) or isinstance(arg, str):
+        return arg
+    view = memoryview(arg)
+    memory = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+    stack.callback(memory.unlink)
+    stack.callback(memory.close)
+    _get_buffer(memory)[: view.nbytes] = view.cast("B")
+    return SharedBuffer(memory.name, view.nbytes, view.format)
+
+
+def _get_executor(backend: Backend, workers: int) -> futures.Executor:
+    with _executors_lock:
+        executor = _executors.get((backend, workers))
+        if executor is None:
+            executor_type = (
+                futures.ThreadPoolExecutor
+                if backend is Backend.THREAD
+                else futures.ProcessPoolExecutor
+            )
+            executor = executor_type(workers, initializer=limit_workers)
+            _executors[backend, workers] = executor
+        return executor
+
+
+def shutdown_executors() -> None:
+    """Shut down the pools kept between maps."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
+
+def _forget_executors() -> None:
+    # A forked child has the pools' handles but not their threads.
+    global _executors_lock  # noqa: PLW0603
+    _executors.clear()
+    _executors_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_executors)
+
+
+class _Map(NamedTuple):
+    id: int
+    func: Callable[..., object]
+    args: tuple[object, ...]
+
+
+def _attach_args(map_: _Map) -> tuple[object, ...]:
+    global _worker_map_id, _worker_args  # noqa: PLW0603
+    if map_.id != _worker_map_id:
+        # Release the previous map's buffers, which its process has unlinked.
+        _worker_args = ()
+        while _worker_shared_memory:
+            _worker_shared_memory.pop().close()
+        _worker_args = tuple(
+            arg.attach() if isinstance(arg, SharedBuffer) else arg for arg in map_.args
+        )
+        _worker_map_id = map_.id
+    return _worker_args
+
+
+def _map_items[T, R, *Ts](
+    func: Callable[[T, *Ts], R], items: Sequence[T], args: tuple[*Ts]
+) -> list[R]:
+    with spans.span("parallel_map.chunk"):
+        return [func(item, *args) for item in items]
+
+
+def _map_chunk(
+    map_: _Map, items: Sequence[object], *, count: bool, trace: bool
+) -> tuple[list[object], Counter[str] | None, list[Span] | None]:
+    with (
+        counters.collect() if count else nullcontext() as counts,
+        spans.collect() if trace else nullcontext() as chunk_spans,
+    ):
+        results = _map_items(map_.func, items, _attach_args(map_))
+    return results, counts, chunk_spans
+
+
+def _get_results[R](
+    executor_key: tuple[Backend, int], item_futures: list[futures.Future[R]]
+) -> Iterator[R]:
+    try:
+        for future in item_futures:
+            yield future.result()
+    except futures.BrokenExecutor:
+        # A pool whose worker died cannot run anything else, so start a new one.
+        with _executors_lock:
+            _executors.pop(executor_key, None)
+        raise
+
+
+@spans.traced("parallel_map")
+def parallel_map[T, R, *Ts](
+    func: Callable[[T, *Ts], R],
+    items: Sequence[T],
+    *args: *Ts,
+    workers: int | None = None,
+    min_items: int = DEFAULT_MIN_ITEMS,
+) -> list[R]:
+    """Return func(item, *args) for each item, using a pool of workers.
+
+    func must be importable and should not mutate its arguments. Items go out in
+    chunks that shrink as the map nears its end. Small maps run in-process.
+
+    Workers are threads or processes, as get_backend picks, from a pool that is
+    kept for later maps with the same backend and worker count. Threads share the
+    args as they are. Processes get them with each chunk, with buffers such as
+    bytearrays and arrays placed in shared memory, attached once per worker and
+    passed to func as read-only memoryviews.
+    """
+    workers = min(workers or get_workers(), len(items))
+    if workers <= 1 or len(items) < min_items:
+        return _map_items(func, items, args)
+    chunks = list(get_chunks(len(items), workers))
+    executor_key = (get_backend(), workers)
+    executor = _get_executor(*executor_key)
+    if executor_key[0] is Backend.THREAD:
+        item_futures = [
+            executor.submit(_map_items, func, items[chunk.start : chunk.stop], args)
+            for chunk in chunks
+        ]
+        return [
+            result
+            for chunk_results in _get_results(executor_key, item_futures)
+            for result in chunk_results
+        ]
+    results: list[R] = []
+    with ExitStack() as stack:
+        map_ = _Map(next(_map_ids), func, tuple(_share(stack, arg) for arg in args))
+        chunk_futures = [
+            executor.submit(
+                _map_chunk,
+                map_,
+                items[chunk.start : chunk.stop],
+                count=counters.enabled,
+                trace=spans.enabled,
+            )
+            for chunk in chunks
+        ]
+        for chunk_results, counts, chunk_spans in _get_results(
+            executor_key, chunk_futures
+        ):
+            results.extend(chunk_results)  # type: ignore[arg-type]
+            for name, value in (counts or {}).items():
+                counters.increment(name, value)
+            spans.add(*chunk_spans or ())
+    return results
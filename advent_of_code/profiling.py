@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from advent_of_code.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+    from collections.abc import Callable
+else:
+    cProfile = lazy_import("cProfile")  # noqa: N816
+    pstats = lazy_import("pstats")
+
+DEFAULT_PROFILE_TOP = 20
+# Stacks under this share of the profile's total time are dropped, as are frames
+# below this depth, which bounds the stacks to about depth / share however the
+# call graph branches.
+MIN_COLLAPSED_SHARE = 1e-3
+MAX_COLLAPSED_DEPTH = 64
+
+type Function = tuple[str, int, str]
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    phase: str
+    pstats_filepath: str
+    collapsed_filepath: str
+    summary: str
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "phase": self.phase,
+            "pstats_filepath": self.pstats_filepath,
+            "collapsed_filepath": self.collapsed_filepath,
+            "summary": self.summary,
+        }
+
+
+def profile_call[**P, T](
+    function: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> tuple[T, cProfile.Profile]:
+    profile = cProfile.Profile()
+    result = profile.runcall(function, *args, **kwargs)
+    return result, profile
+
+
+def _format_function(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{Path(filename).stem}:{line}({name})"
+
+
+def collapse_stats(stats: pstats.Stats) -> list[str]:
+    """Approximate the stacks of a profile in flamegraph collapsed format.
+
+    cProfile only records callers, so each function's time is shared between its
+    callers in proportion to the cumulative time spent on each call edge. Stacks
+    with under MIN_COLLAPSED_SHARE of the total time or deeper than
+    MAX_COLLAPSED_DEPTH are left out.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    min_seconds = stats.total_tt * MIN_COLLAPSED_SHARE  # type: ignore[attr-defined]
+    children: dict[Function, list[tuple[Function, float]]] = defaultdict(list)
+    for function, entry in entries.items():
+        for caller, caller_entry in entry[4].items():
+            children[caller].append((function, caller_entry[3]))
+    seconds: dict[str, float] = defaultdict(float)
+
+    def visit(
+        function: Function, stack: tuple[Function, ...], name: str, share: float
+    ) -> None:
+        stack = (*stack, function)
+        name = (
+            f"{name};{_format_function(function)}"
+            if name
+            else _format_function(function)
+        )
+        seconds[name] += entries[function][2] * share
+        for child, edge_cumtime in children[function]:
+            cumtime = entries[child][3]
+            if child in stack or not cumtime or len(stack) >= MAX_COLLAPSED_DEPTH:
+                continue
+            child_share = share * edge_cumtime / cumtime
+            if cumtime * child_share >= min_seconds:
+                visit(child, stack, name, child_share)
+
+    for function, entry in entries.items():
+        if not entry[4]:
+            visit(function, (), "", 1.0)
+    microseconds = {stack: round(value * 1e6) for stack, value in seconds.items()}
+    return [f"{stack} {value}" for stack, value in microseconds.items() if value]
+
+
+def write_profile(
+    profile: cProfile.Profile,
+    filepath_stem: Path,
+    phase: str,
+    top: int = DEFAULT_PROFILE_TOP,
+) -> ProfileReport:
+    filepath_stem.parent.mkdir(parents=True, exist_ok=True)
+    pstats_filepath = filepath_stem.with_name(f"{filepath_stem.name}_{phase}.pstats")
+    collapsed_filepath = pstats_filepath.with_suffix(".collapsed")
+    profile.dump_stats(pstats_filepath)
+    stream = StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    collapsed_filepath.write_text("\n".join(collapse_stats(stats)) + "\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return ProfileReport(
+        phase, str(pstats_filepath), str(collapsed_filepath), stream.getvalue()
+    )
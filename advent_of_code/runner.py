@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import os
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import cached_property
+from importlib import import_module
+from pathlib import Path
+from pkgutil import iter_modules
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from advent_of_code.cache import Answer, AnswerStore, file_digest, module_digest
+from advent_of_code.counters import counters
+from advent_of_code.lazy import LazyPattern, lazy_import
+from advent_of_code.memo import Scope, memo_scope
+from advent_of_code.memory import DEFAULT_MEMORY_TOP, MemoryReport, MemoryTracer
+from advent_of_code.parallel import (
+    Backend,
+    get_backend,
+    limit_workers,
+    limited_workers,
+)
+from advent_of_code.profiling import (
+    DEFAULT_PROFILE_TOP,
+    ProfileReport,
+    profile_call,
+    write_profile,
+)
+from advent_of_code.spans import Span, spans
+
+if TYPE_CHECKING:
+    import hashlib
+    from collections.abc import Iterable, Iterator
+    from concurrent import futures
+    from cProfile import Profile
+    from types import ModuleType
+else:
+    hashlib = lazy_import("hashlib")
+    futures = lazy_import("concurrent.futures")
+
+PACKAGE_PATH = Path(__file__).parent
+DATA_DIRPATH = "data"
+PARTS = (1, 2)
+
+YEAR_PACKAGE_PATTERN = LazyPattern(r"year_([0-9]{4})")
+DAY_MODULE_PATTERN = LazyPattern(r"day_([0-9]{2})")
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day:02}"
+
+    @property
+    def module_name(self) -> str:
+        return f"advent_of_code.year_{self.year}.day_{self.day:02}"
+
+    def get_input_filepath(self, data_dirpath: str = DATA_DIRPATH) -> str:
+        return f"{data_dirpath}/{self.year}_{self.day:02}"
+
+    def load(self) -> ModuleType:
+        return import_module(self.module_name)
+
+
+@dataclass(frozen=True)
+class Task:
+    day: Day
+    part: int
+    filepath: str
+
+    @cached_property
+    def answer_key(self) -> str:
+        key = (
+            f"{self.day.module_name}:{self.part}"
+            f":{file_digest(self.filepath)}:{module_digest(self.day.module_name)}"
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    profile_dirpath: str | None = None
+    profile_top: int = DEFAULT_PROFILE_TOP
+    trace_memory: bool = False
+    memory_top: int = DEFAULT_MEMORY_TOP
+    count: bool = False
+    trace: bool = False
+
+    @property
+    def is_in_process(self) -> bool:
+        # Profiles and memory traces only see the process they run in, so the
+        # work they measure must not go out to a pool.
+        return self.profile_dirpath is not None or self.trace_memory
+
+    @property
+    def is_instrumented(self) -> bool:
+        # Each of these watches its whole process, so it cannot share one.
+        return (
+            self.profile_dirpath is not None
+            or self.trace_memory
+            or self.count
+            or self.trace
+        )
+
+
+@dataclass(frozen=True)
+class PartResult:
+    year: int
+    day: int
+    part: int
+    answer: Answer
+    seconds: float
+    cached: bool = False
+    profiles: tuple[ProfileReport, ...] = ()
+    memory: MemoryReport | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+    spans: tuple[Span, ...] = ()
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "year": self.year,
+            "day": self.day,
+            "part": self.part,
+            "answer": self.answer,
+            "seconds": self.seconds,
+            "cached": self.cached,
+            "profiles": [profile.to_dict() for profile in self.profiles],
+            "memory": None if self.memory is None else self.memory.to_dict(),
+            "counters": self.counters,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+def discover_days(year: int | None = None) -> list[Day]:
+    days = []
+    for year_package in iter_modules([str(PACKAGE_PATH)]):
+        year_match = YEAR_PACKAGE_PATTERN.compiled.fullmatch(year_package.name)
+        if not year_package.ispkg or year_match is None:
+            continue
+        if year is not None and int(year_match[1]) != year:
+            continue
+        for day_module in iter_modules([str(PACKAGE_PATH / year_package.name)]):
+            day_match = DAY_MODULE_PATTERN.compiled.fullmatch(day_module.name)
+            if day_match is not None:
+                days.append(Day(int(year_match[1]), int(day_match[1])))
+    return sorted(days)
+
+
+def _write_profiles(
+    task: Task, options: RunOptions, profiles: dict[str, Profile]
+) -> tuple[ProfileReport, ...]:
+    filepath_stem = (
+        Path(str(options.profile_dirpath))
+        / f"{task.day.year}_{task.day.day:02}_part{task.part}"
+    )
+    return tuple(
+        write_profile(profile, filepath_stem, phase, options.profile_top)
+        for phase, profile in profiles.items()
+    )
+
+
+def run_task(task: Task, options: RunOptions | None = None) -> PartResult:
+    options = options or RunOptions()
+    module = task.day.load()
+    solver = getattr(module, f"solve_part{task.part}")
+    profiles: dict[str, Profile] = {}
+    with (
+        memo_scope(Scope.RUN),
+        limited_workers() if options.is_in_process else nullcontext(),
+        MemoryTracer() if options.trace_memory else nullcontext() as tracer,
+        counters.collect() if options.count else nullcontext() as counts,
+        spans.collect() if options.trace else nullcontext() as task_spans,
+        spans.span(f"{task.day} part {task.part}"),
+    ):
+        start = perf_counter()
+        if options.profile_dirpath is None:
+            with spans.span("parse"):
+                data = module.parse(task.filepath)
+            with spans.span("solve"):
+                answer = solver(data)
+        else:
+            with spans.span("parse"):
+                data, profiles["parse"] = profile_call(module.parse, task.filepath)
+            with spans.span("solve"):
+                answer, profiles["solve"] = profile_call(solver, data)
+        seconds = perf_counter() - start
+        # Report while the parsed input and anything cached on it are alive.
+        memory = tracer.report(options.memory_top) if tracer else None
+    return PartResult(
+        task.day.year,
+        task.day.day,
+        task.part,
+        answer,
+        seconds,
+        profiles=_write_profiles(task, options, profiles),
+        memory=memory,
+        counters=dict(sorted(counts.items())) if counts is not None else {},
+        spans=tuple(task_spans or ()),
+    )
+
+
+def _create_executor(
+    workers: int, options: RunOptions | None, backend: Backend | None
+) -> futures.Executor:
+    if get_backend(backend) is Backend.THREAD and not (
+        options and options.is_instrumented
+    ):
+        return futures.ThreadPoolExecutor(workers, initializer=limit_workers)
+    return futures.ProcessPoolExecutor(workers, initializer=limit_workers)
+
+
+def _execute_tasks(
+    tasks: list[Task],
+    workers: int | None = None,
+    options: RunOptions | None = None,
+    backend: Backend | None = None,
+) -> Iterator[tuple[Task, PartResult]]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        yield from ((task, run_task(task, options)) for task in tasks)
+        return
+    with _create_executor(workers, options, backend) as executor:
+        future_tasks = {
+            executor.submit(run_task, task, options): task for task in tasks
+        }
+        yield from (
+            (future_tasks[future], future.result())
+            for future in futures.as_completed(future_tasks)
+        )
+
+
+def run_tasks(
+    tasks: Iterable[Task],
+    workers: int | None = None,
+    answer_store: AnswerStore | None = None,
+    options: RunOptions | None = None,
+    backend: Backend | None = None,
+) -> Iterator[PartResult]:
+    if answer_store is None:
+        yield from (
+            result
+            for _, result in _execute_tasks(list(tasks), workers, options, backend)
+        )
+        return
+    pending_tasks = []
+    for task in tasks:
+        answer = answer_store.get(task.answer_key)
+        if answer is None:
+            pending_tasks.append(task)
+        else:
+            yield PartResult(
+                task.day.year, task.day.day, task.part, answer, 0.0, cached=True
+            )
+    for task, result in _execute_tasks(pending_tasks, workers, options, backend):
+        answer_store.set(task.answer_key, result.answer)
+        yield result
@@ -0,0 +1,115 @@
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
+from heapq import heappop, heappush
+
+from advent_of_code.counters import counters
+from advent_of_code.spans import spans
+
+type Neighbours = Callable[[int], Iterable[int]]
+type WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+type Heuristic = Callable[[int], int]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Distances from the start states and every predecessor on a shortest path.
+
+    States are ints; the predecessors of a start state are empty.
+    """
+
+    distances: dict[int, int]
+    predecessors: dict[int, list[int]]
+
+    def path_to(self, state: int) -> list[int]:
+        path = [state]
+        while predecessors := self.predecessors[path[-1]]:
+            path.append(predecessors[0])
+        path.reverse()
+        return path
+
+    def states_on_paths_to(self, states: Iterable[int]) -> set[int]:
+        on_paths = set(states)
+        pending = list(on_paths)
+        while pending:
+            for predecessor in self.predecessors[pending.pop()]:
+                if predecessor not in on_paths:
+                    on_paths.add(predecessor)
+                    pending.append(predecessor)
+        return on_paths
+
+
+@spans.traced("search.bfs")
+def bfs(
+    starts: Iterable[int], neighbours: Neighbours, goals: Collection[int] = ()
+) -> SearchResult:
+    distances = dict.fromkeys(starts, 0)
+    predecessors: dict[int, list[int]] = {state: [] for state in distances}
+    frontier = list(distances)
+    distance = 0
+    expanded = 0
+    # Finish the level a goal is found on so that all its predecessors are known.
+    while frontier and not any(state in goals for state in frontier):
+        distance += 1
+        next_frontier = []
+        expanded += len(frontier)
+        for state in frontier:
+            for next_state in neighbours(state):
+                next_distance = distances.get(next_state)
+                if next_distance is None:
+                    distances[next_state] = distance
+                    predecessors[next_state] = [state]
+                    next_frontier.append(next_state)
+                elif next_distance == distance:
+                    predecessors[next_state].append(state)
+        frontier = next_frontier
+    counters.increment("search.bfs.expanded", expanded)
+    return SearchResult(distances, predecessors)
+
+
+@spans.traced("search.a_star")
+def a_star(
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    goals: Collection[int] = (),
+    heuristic: Heuristic | None = None,
+) -> SearchResult:
+    """Search until every goal state at the lowest distance is settled.
+
+    The heuristic must be consistent, and goal states are not expanded.
+    """
+    distances = dict.fromkeys(starts, 0)
+    predecessors: dict[int, list[int]] = {state: [] for state in distances}
+    heap = [(heuristic(state) if heuristic else 0, 0, state) for state in distances]
+    heap.sort()
+    best = None
+    expanded = 0
+    while heap:
+        priority, distance, state = heappop(heap)
+        if best is not None and priority > best:
+            break
+        if distance > distances[state]:
+            continue
+        if state in goals:
+            best = distance
+            continue
+        expanded += 1
+        for next_state, cost in neighbours(state):
+            next_distance = distance + cost
+            known_distance = distances.get(next_state)
+            if known_distance is None or next_distance < known_distance:
+                distances[next_state] = next_distance
+                predecessors[next_state] = [state]
+                next_priority = next_distance
+                if heuristic:
+                    next_priority += heuristic(next_state)
+                heappush(heap, (next_priority, next_distance, next_state))
+            elif next_distance == known_distance:
+                predecessors[next_state].append(state)
+    counters.increment("search.a_star.expanded", expanded)
+    return SearchResult(distances, predecessors)
+
+
+def dijkstra(
+    starts: Iterable[int], neighbours: WeightedNeighbours, goals: Collection[int] = ()
+) -> SearchResult:
+    return a_star(starts, neighbours, goals)
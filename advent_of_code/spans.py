@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from advent_of_code.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import json
+    from collections.abc import Callable, Iterable, Iterator
+else:
+    json = lazy_import("json")
+
+
+class Span(NamedTuple):
+    """A named phase and when it ran, in perf_counter seconds.
+
+    A named tuple rather than a dataclass, so days can import this cheaply.
+    """
+
+    name: str
+    start: float
+    seconds: float
+    process_id: int
+    thread_id: int
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "start": self.start,
+            "seconds": self.seconds,
+            "process_id": self.process_id,
+            "thread_id": self.thread_id,
+        }
+
+    def to_trace_event(self, origin: float) -> dict[str, object]:
+        # A complete event, timed in microseconds since origin.
+        return {
+            "name": self.name,
+            "ph": "X",
+            "ts": (self.start - origin) * 1e6,
+            "dur": self.seconds * 1e6,
+            "pid": self.process_id,
+            "tid": self.thread_id,
+        }
+
+
+class Spans:
+    """Timed phases, such as reading, parsing and searching, that the runner traces.
+
+    Recording is off unless a collect() block is active, and a span then reads the
+    clock as it opens and closes. Spans nest by time within a thread, so mark
+    phases rather than the steps of hot loops.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] | None = None
+        # Without the GIL, threads could interleave their appends.
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.spans is not None
+
+    def add(self, *spans: Span) -> None:
+        if self.spans is not None:
+            with self._lock:
+                self.spans.extend(spans)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if self.spans is None:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(
+                Span(
+                    name,
+                    start,
+                    perf_counter() - start,
+                    os.getpid(),
+                    threading.get_native_id(),
+                )
+            )
+
+    def traced[**P, R](self, name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Record each call of a function as a span."""
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if self.spans is None:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def collect(self) -> Iterator[list[Span]]:
+        previous_spans = self.spans
+        self.spans = []
+        try:
+            yield self.spans
+        finally:
+            self.spans = previous_spans
+
+
+spans = Spans()
+
+
+def to_trace(recorded: Iterable[Span]) -> dict[str, object]:
+    """Return spans as Chrome trace events, which Perfetto and chrome://tracing open.
+
+    Each process gets a group of tracks, named for whether it is this one or a
+    worker, and each of its threads a track.
+    """
+    recorded = list(recorded)
+    origin = min((span.start for span in recorded), default=0.0)
+    main_process_id = os.getpid()
+    events: list[dict[str, object]] = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": process_id,
+            "args": {
+                "name": "main"
+                if process_id == main_process_id
+                else f"worker {process_id}"
+            },
+        }
+        for process_id in sorted({span.process_id for span in recorded})
+    ]
+    events.extend(span.to_trace_event(origin) for span in recorded)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_trace(recorded: Iterable[Span], filepath: str) -> None:
+    Path(filepath).write_text(json.dumps(to_trace(recorded)))
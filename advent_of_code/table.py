@@ -1,10 +1,99 @@
-from typing import Any
+from array import array
+from collections.abc import Buffer, Iterable, Iterator, Sequence
+from typing import Any, Self
 
+from advent_of_code.inputs import iter_chunks, strip_newlines
+
+type Column = list[Any] | array[Any]
+
+# Types whose columns are stored unboxed in an array with this typecode.
+TYPECODES: dict[type, str] = {int: "q", float: "d"}
+
+
+def _make_column(values: Iterable[Any], type_: type) -> Column:
+    typecode = TYPECODES.get(type_)
+    if typecode is None:
+        return [type_(value) for value in values]
+    return array(typecode, map(type_, values))
+
+
+def _get_ragged_row_error(n: int, field_count: int, width: int) -> ValueError:
+    return ValueError(f"row {n} has {field_count} fields, expected {width}")
+
+
+class Table:
+    """Rows of whitespace separated fields, stored column by column.
+
+    Columns cast to int or float are held in arrays, so a million-row column of
+    numbers takes 8 MB rather than a list of boxed values.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]] = ()) -> None:
+        rows = list(rows)
+        width = len(rows[0]) if rows else 0
+        for n, row in enumerate(rows):
+            if len(row) != width:
+                raise _get_ragged_row_error(n, len(row), width)
+        self.columns: list[Column] = [
+            list(column) for column in zip(*rows, strict=True)
+        ]
+
+    @classmethod
+    def from_bytes(cls, data: Buffer, types: Sequence[type] = ()) -> Self:
+        """Parse a table, building each column from all of its fields at once.
+
+        Columns without a type in types are decoded to str. The fields are split
+        from a chunk of lines at a time, so a mapped file is never copied in full.
+        """
+        columns: list[list[bytes]] = []
+        width = None
+        row_count = 0
+        for chunk in iter_chunks(strip_newlines(data)):
+            # Per line, as ragged lines can still add up to whole rows.
+            lines = chunk.removesuffix(b"\n").split(b"\n")
+            field_counts = list(map(len, map(bytes.split, lines)))
+            if width is None:
+                width = field_counts[0]
+                columns = [[] for _ in range(width)]
+            if field_counts.count(width) != len(lines):
+                for n, field_count in enumerate(field_counts, row_count):
+                    if field_count != width:
+                        raise _get_ragged_row_error(n, field_count, width)
+            fields = chunk.split()
+            for i, column in enumerate(columns):
+                column.extend(fields[i::width])
+            row_count += len(lines)
+        table = cls()
+        table.columns = [
+            _make_column(column, types[i])
+            if i < len(types)
+            else [field.decode() for field in column]
+            for i, column in enumerate(columns)
+        ]
+        return table
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        return (list(row) for row in zip(*self.columns, strict=True))
+
+    def __getitem__(self, i: int) -> list[Any]:
+        return [column[i] for column in self.columns]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Table | list):
+            return NotImplemented
+        return list(self) == [list(row) for row in other]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
 
-class Table(list[list[Any]]):
     def cast_column(self, i: int, type_: type) -> None:
-        for row in self:
-            row[i] = type_(row[i])
+        self.columns[i] = _make_column(self.columns[i], type_)
 
-    def get_column(self, i: int) -> list[Any]:
-        return [row[i] for row in self]
+    def get_column(self, i: int) -> Sequence[Any]:
+        """Return a column without copying it."""
+        return self.columns[i]
@@ -0,0 +1,29 @@
+import os
+from typing import TYPE_CHECKING
+
+from advent_of_code.lazy import is_installed, is_loaded, optional_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = optional_import("numpy")
+
+NUMPY_ENV = "AOC_NUMPY"
+
+
+def use_numpy(size: int, min_size: int, cold_min_size: int) -> bool:
+    """Return whether a day should take its NumPy path for an input of size items.
+
+    By default it does if NumPy is installed, from min_size items once NumPy is
+    imported and from cold_min_size items before, as the path must then also pay
+    for importing it. AOC_NUMPY=1 always takes it and AOC_NUMPY=0 never does.
+    """
+    setting = os.environ.get(NUMPY_ENV, "")
+    if setting not in {"", "0", "1"}:
+        msg = f"{NUMPY_ENV} must be unset, empty, 0 or 1, not {setting!r}"
+        raise ValueError(msg)
+    if setting:
+        return setting == "1"
+    if not is_installed(np):
+        return False
+    return size >= (min_size if is_loaded(np) else cold_min_size)
@@ -1,29 +1,65 @@
-from advent_of_code.utils import (
-    calculate_similarity,
-    calculate_total_distance,
-    read_input_file,
-)
+from array import array
+from typing import TYPE_CHECKING
 
-INPUT_FILEPATH = "data/2024_01"
+from advent_of_code.cache import cached_parse
+from advent_of_code.inputs import extract_ints, map_bytes
+from advent_of_code.lazy import optional_import
+from advent_of_code.utils import calculate_similarity, calculate_total_distance
+from advent_of_code.vector import use_numpy
 
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = optional_import("numpy")
 
-def _prepare_lists(filepath: str) -> tuple[list[int], list[int]]:
-    table = read_input_file(filepath)
-    table.cast_column(0, int)
-    table.cast_column(1, int)
-    return table.get_column(0), table.get_column(1)
+# Numbers per list from which NumPy beats sorting and counting in Python, once NumPy
+# is imported and before.
+NUMPY_MIN_SIZES = (100, 100_000)
+
+type Lists = tuple[array[int], array[int]]
+
+
+@cached_parse
+def parse(filepath: str) -> Lists:
+    numbers = extract_ints(map_bytes(filepath))
+    return numbers[0::2], numbers[1::2]
+
+
+def _calculate_total_distance_numpy(list1: array[int], list2: array[int]) -> int:
+    return int(np.abs(np.sort(list1) - np.sort(list2)).sum())
+
+
+def _calculate_similarity_numpy(list1: array[int], list2: array[int]) -> int:
+    values, counts = np.unique(list2, return_counts=True)
+    if not len(values):
+        return 0
+    numbers = np.asarray(list1)
+    # Where each number would be among the values, and so its count if it is there.
+    positions = np.searchsorted(values, numbers).clip(max=len(values) - 1)
+    matches = values[positions] == numbers
+    return int((numbers * counts[positions] * matches).sum())
+
+
+def solve_part1(lists: Lists) -> int:
+    if use_numpy(len(lists[0]), *NUMPY_MIN_SIZES):
+        return _calculate_total_distance_numpy(*lists)
+    return calculate_total_distance(*lists)
+
+
+def solve_part2(lists: Lists) -> int:
+    if use_numpy(len(lists[0]), *NUMPY_MIN_SIZES):
+        return _calculate_similarity_numpy(*lists)
+    return calculate_similarity(*lists)
 
 
 def part1(filepath: str) -> int:
-    list1, list2 = _prepare_lists(filepath)
-    return calculate_total_distance(list1, list2)
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    list1, list2 = _prepare_lists(filepath)
-    return calculate_similarity(list1, list2)
+    return solve_part2(parse(filepath))
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1(INPUT_FILEPATH):>20}")
-    print(f"Part 2: {part2(INPUT_FILEPATH):>20}")
+def solve(filepath: str) -> tuple[int, int]:
+    lists = parse(filepath)
+    return solve_part1(lists), solve_part2(lists)
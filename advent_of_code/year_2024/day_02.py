@@ -1,12 +1,12 @@
 from itertools import combinations
-from pathlib import Path
 
-INPUT_FILEPATH = "data/2024_02"
+from advent_of_code.cache import cached_parse
+from advent_of_code.inputs import extract_int_lines, map_bytes
 
 
-def _prepare_data(filepath: str) -> list[list[int]]:
-    with Path(filepath).open() as file:
-        return [[int(x) for x in line.split()] for line in file]
+@cached_parse
+def parse(filepath: str) -> list[list[int]]:
+    return extract_int_lines(map_bytes(filepath))
 
 
 def _is_safe(row: list[int], *, increasing: bool = True, tolerance: int = 0) -> bool:
@@ -22,21 +22,29 @@ def _is_safe(row: list[int], *, increasing: bool = True, tolerance: int = 0) ->
     return False
 
 
-def part1(filepath: str) -> int:
+def solve_part1(rows: list[list[int]]) -> int:
     return sum(
         _is_safe(row, increasing=True) or _is_safe(row, increasing=False)
-        for row in _prepare_data(filepath)
+        for row in rows
     )
 
 
-def part2(filepath: str) -> int:
+def solve_part2(rows: list[list[int]]) -> int:
     return sum(
         _is_safe(row, increasing=True, tolerance=1)
         or _is_safe(row, increasing=False, tolerance=1)
-        for row in _prepare_data(filepath)
+        for row in rows
     )
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1(INPUT_FILEPATH):>20}")
-    print(f"Part 2: {part2(INPUT_FILEPATH):>20}")
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    rows = parse(filepath)
+    return solve_part1(rows), solve_part2(rows)
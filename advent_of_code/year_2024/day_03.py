@@ -1,40 +1,50 @@
-import re
-from itertools import pairwise
-from pathlib import Path
+from collections.abc import Buffer
 
-INPUT_FILEPATH = "data/2024_03"
+from advent_of_code.inputs import map_bytes
+from advent_of_code.lazy import LazyPattern
 
+DO = b"do()"
+INSTRUCTION_PATTERN = LazyPattern(rb"mul\(([0-9]+),([0-9]+)\)|do\(\)|don't\(\)")
+MUL_PATTERN = LazyPattern(rb"mul\(([0-9]+),([0-9]+)\)")
 
-def _prepare_data(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
 
+def parse(filepath: str) -> memoryview:
+    return map_bytes(filepath)
 
-def _filter_data(data: str) -> str:
-    return "".join(
-        data_section
-        for instruction, data_section in pairwise(
-            re.split(r"(do(?:n't)?\(\))", "do()" + data)
-        )
-        if instruction == "do()"
-    )
+
+def _sum_enabled_muls(data: Buffer) -> int:
+    total = 0
+    enabled = True
+    for match in INSTRUCTION_PATTERN.compiled.finditer(data):
+        if match[1] is None:
+            enabled = match[0] == DO
+        elif enabled:
+            total += int(match[1]) * int(match[2])
+    return total
 
 
-def _sum_muls(data: str) -> int:
+def _sum_muls(data: Buffer) -> int:
     return sum(
-        int(match[1]) * int(match[2])
-        for match in re.finditer(r"mul\(([0-9]+),([0-9]+)\)", data)
+        int(match[1]) * int(match[2]) for match in MUL_PATTERN.compiled.finditer(data)
     )
 
 
+def solve_part1(data: Buffer) -> int:
+    return _sum_muls(data)
+
+
+def solve_part2(data: Buffer) -> int:
+    return _sum_enabled_muls(data)
+
+
 def part1(filepath: str) -> int:
-    return _sum_muls(_prepare_data(filepath))
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    return _sum_muls(_filter_data(_prepare_data(filepath)))
+    return solve_part2(parse(filepath))
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1(INPUT_FILEPATH):>20}")
-    print(f"Part 2: {part2(INPUT_FILEPATH):>20}")
+def solve(filepath: str) -> tuple[int, int]:
+    data = parse(filepath)
+    return solve_part1(data), solve_part2(data)
@@ -1,16 +1,31 @@
-from pathlib import Path
+from functools import cache
+from typing import TYPE_CHECKING
 
-INPUT_FILEPATH = "data/2024_04"
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import Grid
+from advent_of_code.inputs import map_bytes
+from advent_of_code.lazy import optional_import
+from advent_of_code.vector import use_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = optional_import("numpy")
+
+# Grid cells from which comparing every cell at once with NumPy beats the loop, once
+# NumPy is imported and before.
+NUMPY_MIN_SIZES = (100, 25_000)
 
 type Coord = tuple[int, int]
 type Pattern = tuple[Coord, ...]
 
 
-def _read_input(filepath: str) -> list[str]:
-    with Path(filepath).open() as file:
-        return file.read().split("\n")
+@cached_parse
+def parse(filepath: str) -> Grid:
+    return Grid.from_bytes(map_bytes(filepath))
 
 
+@cache
 def _generate_ray_patterns() -> list[Pattern]:
     """
     S  S  S
@@ -25,6 +40,7 @@ def _generate_ray_patterns() -> list[Pattern]:
     return [tuple((i * dx, i * dy) for i in range(4)) for dx, dy in dxys]
 
 
+@cache
 def _generate_x_patterns() -> list[Pattern]:
     """
     M M     S M     S S     M S
@@ -35,31 +51,58 @@ def _generate_x_patterns() -> list[Pattern]:
     return [((0, 0), *(dxys[(i + j) % 4] for i in range(4))) for j in range(4)]
 
 
-def _search_grid(data: list[str], chars: str, patterns: list[Pattern]) -> int:
+def _search_grid_numpy(
+    grid: Grid, codes: bytes, offset_patterns: list[tuple[int, ...]]
+) -> int:
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    total = 0
+    for offsets in offset_patterns:
+        # Only starts whose whole pattern is in range, as any other leaves the grid.
+        start, stop = -min(offsets), len(cells) - max(offsets)
+        matches = np.ones(stop - start, dtype=np.bool)
+        for code, offset in zip(codes, offsets, strict=True):
+            matches &= cells[start + offset : stop + offset] == code
+        total += int(np.count_nonzero(matches))
+    return total
+
+
+def _search_grid(grid: Grid, chars: str, patterns: list[Pattern]) -> int:
+    codes = chars.encode()
+    # Patterns are (row, column) steps, and every pattern leaves the grid through a
+    # border cell, which never matches.
+    offset_patterns = [
+        tuple(grid.offset(dy, dx) for dx, dy in pattern) for pattern in patterns
+    ]
+    if use_numpy(grid.width * grid.height, *NUMPY_MIN_SIZES):
+        return _search_grid_numpy(grid, codes, offset_patterns)
+    cells = grid.cells
     total = 0
-    x_max = len(data)
-    for x, row in enumerate(data):
-        y_max = len(row)
-        for y, _ in enumerate(row):
-            for pattern in patterns:
-                for char, (dx, dy) in zip(chars, pattern, strict=True):
-                    if not (x_max > x + dx >= 0 and y_max > y + dy >= 0):
-                        break
-                    if data[x + dx][y + dy] != char:
-                        break
-                else:
-                    total += 1
+    for i in grid.indices():
+        for offsets in offset_patterns:
+            for code, offset in zip(codes, offsets, strict=True):
+                if cells[i + offset] != code:
+                    break
+            else:
+                total += 1
     return total
 
 
+def solve_part1(grid: Grid) -> int:
+    return _search_grid(grid, "XMAS", _generate_ray_patterns())
+
+
+def solve_part2(grid: Grid) -> int:
+    return _search_grid(grid, "AMMSS", _generate_x_patterns())
+
+
 def part1(filepath: str) -> int:
-    return _search_grid(_read_input(filepath), "XMAS", _generate_ray_patterns())
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    return _search_grid(_read_input(filepath), "AMMSS", _generate_x_patterns())
+    return solve_part2(parse(filepath))
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1(INPUT_FILEPATH):>20}")
-    print(f"Part 2: {part2(INPUT_FILEPATH):>20}")
+def solve(filepath: str) -> tuple[int, int]:
+    grid = parse(filepath)
+    return solve_part1(grid), solve_part2(grid)
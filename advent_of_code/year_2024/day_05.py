@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_05"
+from advent_of_code.cache import cached_parse
 
 
 class PageDict(dict[int, set[int]]):
@@ -75,10 +75,19 @@ class UpdateList(list[Update]):
             update for update in self if update.is_ordered(pages) is ordered
         )
 
+    def partition(self, pages: PageDict) -> tuple[Self, Self]:
+        ordered, unordered = type(self)(), type(self)()
+        for update in self:
+            (ordered if update.is_ordered(pages) else unordered).append(update)
+        return ordered, unordered
+
     def order_all(self, pages: PageDict) -> Self:
         return type(self)(update.order(pages) for update in self)
 
 
+type SafetyManual = tuple[PageDict, UpdateList]
+
+
 def _read_input(filepath: str) -> str:
     with Path(filepath).open() as file:
         return file.read()
@@ -88,22 +97,34 @@ def _split_input(data: str) -> list[str]:
     return data.split("\n\n")
 
 
-def part1(filepath: str) -> int:
-    data = _read_input(filepath)
-    page_order_data, update_data = _split_input(data)
-    pages = PageDict.from_str(page_order_data)
-    updates = UpdateList.from_str(update_data)
+@cached_parse
+def parse(filepath: str) -> SafetyManual:
+    page_order_data, update_data = _split_input(_read_input(filepath))
+    return PageDict.from_str(page_order_data), UpdateList.from_str(update_data)
+
+
+def solve_part1(data: SafetyManual) -> int:
+    pages, updates = data
     return updates.filter(pages, ordered=True).sum_of_middles
 
 
-def part2(filepath: str) -> int:
-    data = _read_input(filepath)
-    page_order_data, update_data = _split_input(data)
-    pages = PageDict.from_str(page_order_data)
-    updates = UpdateList.from_str(update_data)
+def solve_part2(data: SafetyManual) -> int:
+    pages, updates = data
     return updates.filter(pages, ordered=False).order_all(pages).sum_of_middles
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1(INPUT_FILEPATH):>20}")
-    print(f"Part 2: {part2(INPUT_FILEPATH):>20}")
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    pages, updates = parse(filepath)
+    ordered_updates, unordered_updates = updates.partition(pages)
+    return (
+        ordered_updates.sum_of_middles,
+        unordered_updates.order_all(pages).sum_of_middles,
+    )
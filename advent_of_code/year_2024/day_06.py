@@ -1,134 +1,144 @@
-from enum import Enum
-from pathlib import Path
-from time import perf_counter
+from collections.abc import Buffer, Sequence
+from functools import partial
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_06"
+from advent_of_code.cache import cached_parse
+from advent_of_code.counters import counters
+from advent_of_code.cycles import find_cycle_length
+from advent_of_code.grid import BORDER, Grid
+from advent_of_code.inputs import map_bytes
+from advent_of_code.parallel import parallel_map
 
-
-def _read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
-
-
-class XY(tuple[int, int]):
-    __slots__ = ()
-
-    def __new__(cls, x: int, y: int) -> Self:
-        return super().__new__(cls, (x, y))
-
-    @property
-    def x(self) -> int:
-        return self[0]
-
-    @property
-    def y(self) -> int:
-        return self[1]
-
-
-class Direction(XY, Enum):
-    UP = (0, 1)
-    RIGHT = (1, 0)
-    DOWN = (0, -1)
-    LEFT = (-1, 0)
-
-    def rotate_clockwise(self) -> Self:
-        return type(self)(self.y, -self.x)
-
-
-class Coords(XY):
-    def move(self, direction: Direction) -> Self:
-        return type(self)(self.x + direction.x, self.y + direction.y)
+EMPTY = ord(".")
+OBSTACLE = ord("#")
+START = ord("^")
+UP = 0
 
 
 class Map:
-    def __init__(
-        self, width: int, height: int, start: Coords, obstacles: set[Coords]
-    ) -> None:
-        self.width = width
-        self.height = height
+    def __init__(self, grid: Grid, start: int) -> None:
+        self.grid = grid
         self.start = start
         self.position = start
-        self.direction = Direction.UP
-        self.obstacles = obstacles
-        self.previous_states: set[tuple[Coords, Direction]] = set()
+        self.direction = UP
+        # States are encoded as position << 2 | direction.
+        self.previous_states: set[int] = set()
 
     @property
     def is_in_area(self) -> bool:
-        return self.width > self.position.x >= 0 and self.height > self.position.y >= 0
+        return self.grid[self.position] != BORDER
 
     @property
     def is_stuck(self) -> bool:
-        return (self.position, self.direction) in self.previous_states
+        return (self.position << 2 | self.direction) in self.previous_states
 
     @property
-    def visited(self) -> set[Coords]:
-        return {coords for coords, _ in self.previous_states}
+    def visited(self) -> set[int]:
+        return {state >> 2 for state in self.previous_states}
 
     @property
     def total_visited(self) -> int:
         return len(self.visited)
 
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> Self:
+        grid = Grid.from_bytes(data)
+        start = grid.find(START)
+        grid[start] = EMPTY
+        return cls(grid, start)
+
     @classmethod
     def from_str(cls, data: str) -> Self:
-        rows = data.split("\n")[::-1]
-        height = len(rows)
-        width = len(rows[0])
-        obstacles = set()
-        for y, row in enumerate(rows):
-            for x, value in enumerate(row):
-                if value == "#":
-                    obstacles.add(Coords(x, y))
-                elif value == "^":
-                    start = Coords(x, y)
-        return cls(height, width, start, obstacles)
+        return cls.from_bytes(data.encode())
 
     def simulate(self) -> None:
-        while self.is_in_area and not self.is_stuck:
-            self.previous_states.add((self.position, self.direction))
-            next_position = self.position.move(self.direction)
-            if next_position in self.obstacles:
-                self.direction = self.direction.rotate_clockwise()
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+        previous_states = self.previous_states
+        # Every step adds a state, so the steps taken need no counting in the loop.
+        initial_state_count = len(previous_states)
+        position, direction = self.position, self.direction
+        while cells[position] != BORDER:
+            state = position << 2 | direction
+            if state in previous_states:
+                break
+            previous_states.add(state)
+            next_position = position + offsets[direction]
+            if cells[next_position] == OBSTACLE:
+                direction = (direction + 1) % 4
             else:
-                self.position = next_position
+                position = next_position
+        self.position, self.direction = position, direction
+        counters.increment("day_06.steps", len(previous_states) - initial_state_count)
 
     def reset(self) -> None:
         self.position = self.start
-        self.direction = Direction.UP
+        self.direction = UP
         self.previous_states.clear()
 
-
-def part1(filepath: str) -> int:
-    data = _read_input(filepath)
-    map_ = Map.from_str(data)
+    def count_loop_obstacles(self) -> int:
+        grid = self.grid
+        return sum(
+            parallel_map(
+                is_loop_obstacle,
+                sorted(self.visited),
+                grid.cells,
+                grid.width,
+                grid.height,
+                self.start,
+            )
+        )
+
+
+def get_next_turn(cells: bytearray, offsets: Sequence[int], state: int) -> int | None:
+    """Walk from a state to the next obstacle and return the state after turning.
+
+    Return None if the walk leaves the area instead.
+    """
+    direction = state & 3
+    offset = offsets[direction]
+    position = (state >> 2) + offset
+    while (cell := cells[position]) != OBSTACLE:
+        if cell == BORDER:
+            return None
+        position += offset
+    return (position - offset) << 2 | (direction + 1) % 4
+
+
+def is_loop_obstacle(
+    position: int, cells: Buffer, width: int, height: int, start: int
+) -> bool:
+    grid = Grid(bytearray(cells), width, height)
+    grid[position] = OBSTACLE
+    # Only the states at turns are walked between, and only one at a time kept.
+    get_next_state = partial(get_next_turn, grid.cells, grid.offsets)
+    return find_cycle_length(start << 2 | UP, get_next_state) is not None
+
+
+@cached_parse
+def parse(filepath: str) -> Map:
+    return Map.from_bytes(map_bytes(filepath))
+
+
+def solve_part1(map_: Map) -> int:
     map_.simulate()
     return map_.total_visited
 
 
-def part2(filepath: str) -> int:
-    data = _read_input(filepath)
-    map_ = Map.from_str(data)
-    total = 0
+def solve_part2(map_: Map) -> int:
     map_.simulate()
-    for coords in map_.visited:
-        map_.reset()
-        map_.obstacles.add(coords)
-        map_.simulate()
-        total += map_.is_stuck
-        map_.obstacles.remove(coords)
-    return total
-
-
-if __name__ == "__main__":
-    # 0.1s
-    start = perf_counter()
-    part1_result = part1(INPUT_FILEPATH)
-    part1_time = perf_counter() - start
-    print(f"Part 1: {part1_result:>20,} {part1_time:>20.1f}s")
-
-    # 50.5s
-    start = perf_counter()
-    part2_result = part2(INPUT_FILEPATH)
-    part2_time = perf_counter() - start
-    print(f"Part 1: {part1_result:>20,} {part1_time:>20.1f}s")
-    print(f"Part 2: {part2_result:>20,} {part2_time:>20.1f}s")
+    return map_.count_loop_obstacles()
+
+
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    map_ = parse(filepath)
+    total_visited = solve_part1(map_)
+    return total_visited, map_.count_loop_obstacles()
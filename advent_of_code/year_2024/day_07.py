@@ -1,15 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Buffer, Callable
 from itertools import product
-from pathlib import Path
-from time import perf_counter
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_07"
-
-
-def _read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+from advent_of_code.cache import cached_parse
+from advent_of_code.counters import counters
+from advent_of_code.inputs import extract_int_lines, map_bytes
+from advent_of_code.parallel import parallel_map
 
 
 class Operators:
@@ -49,44 +45,70 @@ class Equation:
         return total == self.total
 
     def is_solvable(self, operators: tuple[Callable[[int, int], int], ...]) -> bool:
-        return any(
-            self._check_operator_combination(combination)
-            for combination in product(operators, repeat=self.required_operators)
+        combinations = product(operators, repeat=self.required_operators)
+        for tried, combination in enumerate(combinations, 1):
+            if self._check_operator_combination(combination):
+                counters.increment("day_07.combinations", tried)
+                return True
+        counters.increment(
+            "day_07.combinations", len(operators) ** self.required_operators
         )
+        return False
 
 
 class EquationList(list[Equation]):
     def total_calibration_result(self, *operators: Callable[[int, int], int]) -> int:
         return sum(
-            equation.total for equation in self if equation.is_solvable(operators)
+            equation.total
+            for equation, is_solvable in zip(
+                self, parallel_map(Equation.is_solvable, self, operators), strict=True
+            )
+            if is_solvable
+        )
+
+    def partition(self, *operators: Callable[[int, int], int]) -> tuple[Self, Self]:
+        solvable, unsolvable = type(self)(), type(self)()
+        for equation, is_solvable in zip(
+            self, parallel_map(Equation.is_solvable, self, operators), strict=True
+        ):
+            (solvable if is_solvable else unsolvable).append(equation)
+        return solvable, unsolvable
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> Self:
+        return cls(
+            Equation(total, numbers) for total, *numbers in extract_int_lines(data)
         )
 
     @classmethod
     def from_str(cls, data: str) -> Self:
-        return cls(Equation.from_str(row) for row in data.split("\n"))
+        return cls.from_bytes(data.encode())
 
 
-def part1(filepath: str) -> int:
-    return EquationList.from_str(_read_input(filepath)).total_calibration_result(
-        Operators.add, Operators.multiply
-    )
+@cached_parse
+def parse(filepath: str) -> EquationList:
+    return EquationList.from_bytes(map_bytes(filepath))
 
 
-def part2(filepath: str) -> int:
-    return EquationList.from_str(_read_input(filepath)).total_calibration_result(
+def solve_part1(equations: EquationList) -> int:
+    return equations.total_calibration_result(Operators.add, Operators.multiply)
+
+
+def solve_part2(equations: EquationList) -> int:
+    return equations.total_calibration_result(
         Operators.add, Operators.multiply, Operators.concatenate
     )
 
 
-if __name__ == "__main__":
-    # 1.1s
-    start = perf_counter()
-    part1_result = part1(INPUT_FILEPATH)
-    part1_time = perf_counter() - start
-    print(f"Part 1: {part1_result:>20} {part1_time:>20.1f}s")
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
 
-    # 81.5s
-    start = perf_counter()
-    part2_result = part2(INPUT_FILEPATH)
-    part2_time = perf_counter() - start
-    print(f"Part 2: {part2_result:>20} {part2_time:>20.1f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    solvable, unsolvable = parse(filepath).partition(Operators.add, Operators.multiply)
+    result1 = sum(equation.total for equation in solvable)
+    return result1, result1 + solve_part2(unsolvable)
@@ -1,131 +1,58 @@
 from collections import defaultdict
+from collections.abc import Buffer
 from itertools import combinations
-from pathlib import Path
-from time import perf_counter
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_08"
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import Grid
+from advent_of_code.inputs import map_bytes
 
-
-def _read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
-
-
-class XY:
-    __slots__ = ("x", "y")
-
-    def __init__(self, x: int, y: int) -> None:
-        self.x = x
-        self.y = y
-
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
-
-    def __len__(self) -> int:
-        return 2
-
-    def _check_comparable(self, other: object) -> None:
-        if isinstance(other, type(self)):
-            return
-        if not isinstance(other, tuple):
-            raise NotImplementedError
-        if len(other) != len(self):
-            raise NotImplementedError
-        x, y = other
-        if not (isinstance(x, int) and isinstance(y, int)):
-            raise NotImplementedError
-
-    def __eq__(self, other: object) -> bool:
-        self._check_comparable(other)
-        return self.__hash__() == other.__hash__()
-
-    def __gt__(self, other: tuple[int, int]) -> bool:
-        self._check_comparable(other)
-        return self.x > other[0] and self.y > other[1]
-
-    def __ge__(self, other: tuple[int, int]) -> bool:
-        self._check_comparable(other)
-        return self.x >= other[0] and self.y >= other[1]
-
-    def __lt__(self, other: tuple[int, int]) -> bool:
-        self._check_comparable(other)
-        return self.x < other[0] and self.y < other[1]
-
-    def __le__(self, other: tuple[int, int]) -> bool:
-        self._check_comparable(other)
-        return self.x <= other[0] and self.y <= other[1]
-
-    def __add__(self, other: Self) -> Self:
-        cls = type(self)
-        if not isinstance(other, cls):
-            raise NotImplementedError
-        return cls(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other: Self) -> Self:
-        cls = type(self)
-        if not isinstance(other, cls):
-            raise NotImplementedError
-        return cls(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other: int) -> Self:
-        if not isinstance(other, int):
-            raise NotImplementedError
-        cls = type(self)
-        return cls(other * self.x, other * self.y)
-
-    def is_within(self, x_max: int, y_max: int, x_min: int, y_min: int) -> bool:
-        return x_max > self.x >= x_min and y_max > self.y >= y_min
-
-
-class XYSet(set[XY]):
-    pass
+EMPTY = ord(".")
 
 
 class Map:
-    def __init__(self, width: int, height: int, antennas: dict[str, XYSet]) -> None:
-        self.width = width
-        self.height = height
+    def __init__(self, grid: Grid, antennas: dict[int, list[int]]) -> None:
+        self.grid = grid
         self.antennas = antennas
 
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> Self:
+        grid = Grid.from_bytes(data)
+        antennas: dict[int, list[int]] = defaultdict(list)
+        for i in grid.indices():
+            if grid[i] != EMPTY:
+                antennas[grid[i]].append(i)
+        return cls(grid, antennas)
+
     @classmethod
     def from_str(cls, data: str) -> Self:
-        rows = data.split("\n")[::-1]
-        height = len(rows)
-        width = len(rows[0])
-        antennas: dict[str, XYSet] = defaultdict(XYSet)
-        for y, row in enumerate(rows):
-            for x, value in enumerate(row):
-                if value != ".":
-                    antennas[value].add(XY(x, y))
-        return cls(width, height, antennas)
-
-    def _get_new_antinodes(self, antenna1: XY, antenna2: XY) -> XYSet:
-        dxy = antenna1 - antenna2
-        return XYSet(
-            node
-            for node in (antenna1 + dxy, antenna2 - dxy)
-            if node.is_within(self.width, self.height, 0, 0)
-        )
+        return cls.from_bytes(data.encode())
+
+    def _get_new_antinodes(self, antenna1: int, antenna2: int) -> set[int]:
+        (x1, y1), (x2, y2) = self.grid.coords(antenna1), self.grid.coords(antenna2)
+        return {
+            self.grid.index(x, y)
+            for x, y in ((2 * x1 - x2, 2 * y1 - y2), (2 * x2 - x1, 2 * y2 - y1))
+            if self.grid.contains(x, y)
+        }
 
     def _get_new_antinodes_with_resonant_harmonics(
-        self, antenna1: XY, antenna2: XY
-    ) -> XYSet:
-        antinodes = XYSet()
-        dxy = antenna1 - antenna2
-        while (self.height, self.width) > antenna1 >= (0, 0):
+        self, antenna1: int, antenna2: int
+    ) -> set[int]:
+        antinodes = set()
+        (x1, y1), (x2, y2) = self.grid.coords(antenna1), self.grid.coords(antenna2)
+        dx, dy = x1 - x2, y1 - y2
+        offset = self.grid.offset(dx, dy)
+        while self.grid.contains(x1, y1):
             antinodes.add(antenna1)
-            antenna1 += dxy
-        while (self.height, self.width) > antenna2 >= (0, 0):
+            x1, y1, antenna1 = x1 + dx, y1 + dy, antenna1 + offset
+        while self.grid.contains(x2, y2):
             antinodes.add(antenna2)
-            antenna2 -= dxy
+            x2, y2, antenna2 = x2 - dx, y2 - dy, antenna2 - offset
         return antinodes
 
-    def get_antinodes(self, *, resonant_harmonics: bool = False) -> XYSet:
-        antinodes = XYSet()
+    def get_antinodes(self, *, resonant_harmonics: bool = False) -> set[int]:
+        antinodes: set[int] = set()
         for antennas in self.antennas.values():
             for a1, a2 in combinations(antennas, 2):
                 antinodes |= (
@@ -136,27 +63,27 @@ class Map:
         return antinodes
 
 
-def part1(filepath: str) -> int:
-    data = _read_input(filepath)
-    map_ = Map.from_str(data)
+@cached_parse
+def parse(filepath: str) -> Map:
+    return Map.from_bytes(map_bytes(filepath))
+
+
+def solve_part1(map_: Map) -> int:
     return len(map_.get_antinodes())
 
 
-def part2(filepath: str) -> int:
-    data = _read_input(filepath)
-    map_ = Map.from_str(data)
+def solve_part2(map_: Map) -> int:
     return len(map_.get_antinodes(resonant_harmonics=True))
 
 
-if __name__ == "__main__":
-    # 0.0s
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20,} {seconds:>20.1f}s")
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
 
-    # 0.0s
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20,} {seconds:>20.1f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    map_ = parse(filepath)
+    return solve_part1(map_), solve_part2(map_)
@@ -1,14 +1,10 @@
+from collections.abc import Buffer
 from itertools import chain
-from pathlib import Path
-from time import perf_counter
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_09"
+from advent_of_code.inputs import map_bytes, strip_newlines
 
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+ZERO = ord("0")
 
 
 class FileSystem(list[int | None]):
@@ -21,10 +17,11 @@ class FileSystem(list[int | None]):
         return self
 
     @classmethod
-    def from_str(cls, data: str) -> Self:
+    def from_bytes(cls, data: Buffer) -> Self:
         return cls(
             chain.from_iterable(
-                [None if i % 2 else i // 2] * int(size) for i, size in enumerate(data)
+                [None if i % 2 else i // 2] * (digit - ZERO)
+                for i, digit in enumerate(strip_newlines(data))
             )
         ).trim()
 
@@ -46,12 +43,12 @@ class DiskMap:
         self.free = free
 
     @classmethod
-    def from_str(cls, data: str) -> Self:
+    def from_bytes(cls, data: Buffer) -> Self:
         files = []
         free: set[int] = set()
         block_i = 0
-        for data_i, size_ in enumerate(data):
-            size = int(size_)
+        for data_i, digit in enumerate(strip_newlines(data)):
+            size = digit - ZERO
             if data_i % 2:
                 free.update(range(block_i, block_i + size))
             else:
@@ -84,25 +81,26 @@ class DiskMap:
         )
 
 
+def parse(filepath: str) -> memoryview:
+    return map_bytes(filepath)
+
+
+def solve_part1(data: Buffer) -> int:
+    return FileSystem.from_bytes(data).compact().checksum
+
+
+def solve_part2(data: Buffer) -> int:
+    return DiskMap.from_bytes(data).compact().checksum
+
+
 def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    return FileSystem.from_str(data).compact().checksum
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    return DiskMap.from_str(data).compact().checksum
-
-
-if __name__ == "__main__":
-    # 8.7s
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
-
-    # 68.8s
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    data = parse(filepath)
+    return solve_part1(data), solve_part2(data)
@@ -1,71 +1,88 @@
-from pathlib import Path
-from time import perf_counter
-from typing import Self
-
-INPUT_FILEPATH = "data/2024_10"
-
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
-
-
-class Map(dict[tuple[int, int], int]):
-    MAX_HEIGHT = 9
-    MIN_HEIGHT = 0
-
-    @classmethod
-    def from_str(cls, data: str) -> Self:
-        return cls(
-            ((x, y), int(height))
-            for y, row in enumerate(data.split("\n"))
-            for x, height in enumerate(row)
-        )
-
-    def get_trailtails(self, coords: tuple[int, int]) -> list[tuple[int, int]]:
-        trailtails = []
-        x, y = coords
-        for new_coords in (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1):
-            if new_coords not in self or self[new_coords] != self[coords] + 1:
-                continue
-            if self[new_coords] == self.MAX_HEIGHT:
-                trailtails.append(new_coords)
-            else:
-                trailtails += self.get_trailtails(new_coords)
-        return trailtails
-
-    def sum_trailheads(self) -> int:
-        return sum(
-            len(set(self.get_trailtails(coords)))
-            for coords, height in self.items()
-            if height == self.MIN_HEIGHT
-        )
-
-    def rate_trailheads(self) -> int:
-        return sum(
-            len(self.get_trailtails(coords))
-            for coords, height in self.items()
-            if height == self.MIN_HEIGHT
-        )
+from advent_of_code.bitboard import (
+    add_counts,
+    get_adjacent,
+    get_mask,
+    iter_bits,
+    shift,
+    sum_counts,
+)
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import Grid
+from advent_of_code.inputs import map_bytes
+
+
+class Map(Grid):
+    __slots__ = ()
+
+    MAX_HEIGHT = ord("9")
+    MIN_HEIGHT = ord("0")
+
+    def get_layers(self) -> list[int]:
+        """Return a board of the cells at each height, from the lowest."""
+        return [
+            get_mask(self.cells, height)
+            for height in range(self.MIN_HEIGHT, self.MAX_HEIGHT + 1)
+        ]
+
+    def sum_trailheads(self, layers: list[int] | None = None) -> int:
+        if layers is None:
+            layers = self.get_layers()
+        # Trails stay within reach of their trailhead, so trailheads are followed on
+        # windows of rows cut out of the layers rather than on the whole map.
+        reach = (len(layers) - 1) * self.stride
+        window_size = 4 * reach
+        window = (1 << window_size) - 1
+        start = -window_size
+        window_layers: list[int] = []
+        score = 0
+        for trailhead in iter_bits(layers[0]):
+            if trailhead + reach >= start + window_size:
+                start = max(trailhead - reach, 0)
+                window_layers = [layer >> start & window for layer in layers[1:]]
+            reached = 1 << (trailhead - start)
+            for layer in window_layers:
+                reached = get_adjacent(reached, self.stride) & layer
+            score += reached.bit_count()
+        return score
+
+    def rate_trailheads(self, layers: list[int] | None = None) -> int:
+        if layers is None:
+            layers = self.get_layers()
+        # Count the trails from every cell of a layer down from the top at once.
+        trail_counts = [layers[-1]]
+        for layer in reversed(layers[:-1]):
+            layer_trail_counts: list[int] = []
+            for offset in self.offsets:
+                layer_trail_counts = add_counts(
+                    layer_trail_counts,
+                    [shift(board, -offset) & layer for board in trail_counts],
+                )
+            trail_counts = layer_trail_counts
+        return sum_counts(trail_counts)
+
+
+@cached_parse
+def parse(filepath: str) -> Map:
+    return Map.from_bytes(map_bytes(filepath))
+
+
+def solve_part1(map_: Map) -> int:
+    return map_.sum_trailheads()
+
+
+def solve_part2(map_: Map) -> int:
+    return map_.rate_trailheads()
 
 
 def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    return Map.from_str(data).sum_trailheads()
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    return Map.from_str(data).rate_trailheads()
+    return solve_part2(parse(filepath))
 
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
-
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    map_ = parse(filepath)
+    layers = map_.get_layers()
+    return map_.sum_trailheads(layers), map_.rate_trailheads(layers)
@@ -1,9 +1,9 @@
-from functools import cache
 from pathlib import Path
-from time import perf_counter
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_11"
+from advent_of_code.cache import cached_parse
+from advent_of_code.counters import counters
+from advent_of_code.memo import memoize
 
 
 def read_input(filepath: str) -> str:
@@ -27,12 +27,15 @@ def get_next(number: int) -> list[int]:
     return next_numbers
 
 
-@cache
-def _simulate(number: int, i_max: int, i: int = 0) -> int:
-    next_numbers = get_next(number)
-    if i + 1 >= i_max:
-        return len(next_numbers)
-    return sum(_simulate(next_number, i_max, i + 1) for next_number in next_numbers)
+# Stones evolve the same way in every input, so counts are kept across inputs.
+# Part 2 of a real input needs about 130,000 of them.
+@memoize(max_size=1 << 18)
+def count_stones(number: int, blinks: int) -> int:
+    if blinks == 0:
+        return 1
+    return sum(
+        count_stones(next_number, blinks - 1) for next_number in get_next(number)
+    )
 
 
 class Stones:
@@ -43,27 +46,37 @@ class Stones:
     def from_str(cls, data: str) -> Self:
         return cls([int(n) for n in data.split()])
 
-    def simulate(self, i_max: int) -> int:
-        return sum(_simulate(number, i_max) for number in self.numbers)
+    def simulate(self, blinks: int) -> int:
+        before = count_stones.memo.info()
+        total = sum(count_stones(number, blinks) for number in self.numbers)
+        if counters.enabled:
+            after = count_stones.memo.info()
+            counters.increment("day_11.cache_hits", after.hits - before.hits)
+            counters.increment("day_11.cache_misses", after.misses - before.misses)
+        return total
+
+
+@cached_parse
+def parse(filepath: str) -> Stones:
+    return Stones.from_str(read_input(filepath))
+
+
+def solve_part1(stones: Stones) -> int:
+    return stones.simulate(25)
+
+
+def solve_part2(stones: Stones) -> int:
+    return stones.simulate(75)
 
 
 def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    return Stones.from_str(data).simulate(25)
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    return Stones.from_str(data).simulate(75)
-
+    return solve_part2(parse(filepath))
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
 
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.3f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    stones = parse(filepath)
+    return solve_part1(stones), solve_part2(stones)
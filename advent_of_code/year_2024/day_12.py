@@ -1,95 +1,31 @@
-from itertools import chain
-from pathlib import Path
-from time import perf_counter
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_12"
-
-
-type Plot = tuple[int, int, str]
-
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+from advent_of_code.bitboard import flood_fill, get_mask, shift
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import BORDER, Grid
+from advent_of_code.inputs import map_bytes
 
 
 class Region:
-    ADJACENT_OFFSETS = (1, 0), (-1, 0), (0, 1), (0, -1)
-
-    def __init__(
-        self, plots: list[Plot] | None = None, plant_type: str | None = None
-    ) -> None:
-        self.plots = plots if plots else []
+    def __init__(self, grid: Grid, plots: int, plant_type: int) -> None:
+        self.grid = grid
+        # A board of the region's plots, which may be moved by whole cells.
+        self.plots = plots
         self.plant_type = plant_type
 
-    @classmethod
-    def from_str(cls, data: str) -> Self:
-        return cls(
-            [
-                (x, y, plant_type)
-                for y, line in enumerate(data.split("\n"))
-                for x, plant_type in enumerate(line)
-            ]
-        )
-
-    def take_connected_plots_of_same_type(self, plot: Plot) -> list[Plot]:
-        x, y, plant_type = plot
-        adjacent_plots = []
-        for dx, dy in self.ADJACENT_OFFSETS:
-            adjacent_plot = (x + dx, y + dy, plant_type)
-            if adjacent_plot in self.plots:
-                adjacent_plots.append(adjacent_plot)
-                self.plots.remove(adjacent_plot)
-        return adjacent_plots + list(
-            chain.from_iterable(
-                self.take_connected_plots_of_same_type(plot) for plot in adjacent_plots
-            )
-        )
-
-    def split(self) -> list[Self]:
-        cls = type(self)
-        regions = []
-        while len(self.plots) > 0:
-            plot = self.plots.pop()
-            _, _, plant_type = plot
-            regions.append(
-                cls([plot, *self.take_connected_plots_of_same_type(plot)], plant_type)
-            )
-        return regions
-
-    def get_corners(self, point: tuple[int, int]) -> list[tuple[int, int, bool]]:
-        x, y = point
-        upper_left = (x - 1, y - 1, self.plant_type)
-        upper_right = (x, y - 1, self.plant_type)
-        lower_left = (x - 1, y, self.plant_type)
-        lower_right = (x, y, self.plant_type)
-        adjacent_plots = tuple(
-            plot
-            for plot in (upper_left, upper_right, lower_left, lower_right)
-            if plot in self.plots
-        )
-        adjacent_plot_count = len(adjacent_plots)
-        if adjacent_plot_count in {0, 4}:
-            return []
-        if adjacent_plot_count in {1, 3}:
-            return [(x, y, False)]
-        if adjacent_plots not in {(upper_left, lower_right), (upper_right, lower_left)}:
-            return [(x, y, False), (x, y, True)]
-        return []
+    def get_sides(self) -> list[int]:
+        """Return, for each direction, the plots whose neighbour that way is also in
+        the region.
+        """
+        return [shift(self.plots, -offset) & self.plots for offset in self.grid.offsets]
 
     @property
     def perimeter(self) -> int:
-        return sum(
-            True
-            for x, y, plant_type in self.plots
-            for dx, dy in self.ADJACENT_OFFSETS
-            if (x + dx, y + dy, plant_type) not in self.plots
-        )
+        return 4 * self.area - sum(side.bit_count() for side in self.get_sides())
 
     @property
     def area(self) -> int:
-        return len(self.plots)
+        return self.plots.bit_count()
 
     @property
     def price_to_fence(self) -> int:
@@ -97,15 +33,19 @@ class Region:
 
     @property
     def corners(self) -> int:
-        return len(
-            set(
-                chain.from_iterable(
-                    self.get_corners(point)
-                    for x, y, _ in self.plots
-                    for point in ((x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1))
-                )
-            )
-        )
+        plots = self.plots
+        offsets = self.grid.offsets
+        sides = self.get_sides()
+        corners = 0
+        for i, offset in enumerate(offsets):
+            side = sides[i]
+            next_side = sides[(i + 1) % 4]
+            diagonal = shift(plots, -offset - offsets[(i + 1) % 4])
+            # Outer corners have neither side in the region, inner corners have both
+            # sides but not the diagonal between them.
+            corners += (plots & ~(side | next_side)).bit_count()
+            corners += (side & next_side & ~diagonal).bit_count()
+        return corners
 
     @property
     def discounted_price_to_fence(self) -> int:
@@ -113,9 +53,31 @@ class Region:
 
 
 class RegionList(list[Region]):
+    @classmethod
+    def from_grid(cls, grid: Grid) -> Self:
+        regions = cls()
+        # Boards are kept short by moving them down whenever the low bits run out of
+        # plots to start regions from. Regions do not depend on where they are.
+        near = (1 << (4 * grid.stride)) - 1
+        for plant_type in sorted(set(grid.cells) - {BORDER}):
+            unlabelled = get_mask(grid.cells, plant_type)
+            while unlabelled:
+                candidates = unlabelled & near
+                if not candidates:
+                    seed = (unlabelled & -unlabelled).bit_length() - 1
+                    # Keep a row below the seed, for diagonal moves from plots.
+                    unlabelled >>= seed - grid.stride - 1
+                    candidates = unlabelled & near
+                seed = (candidates & -candidates).bit_length() - 1
+                plots = flood_fill(1 << seed, unlabelled, grid.stride)
+                unlabelled ^= plots
+                plots >>= max(seed - grid.stride - 1, 0)
+                regions.append(Region(grid, plots, plant_type))
+        return regions
+
     @classmethod
     def from_str(cls, data: str) -> Self:
-        return cls(Region.from_str(data).split())
+        return cls.from_grid(Grid.from_str(data))
 
     @property
     def price_to_fence(self) -> int:
@@ -126,23 +88,27 @@ class RegionList(list[Region]):
         return sum(region.discounted_price_to_fence for region in self)
 
 
+@cached_parse
+def parse(filepath: str) -> RegionList:
+    return RegionList.from_grid(Grid.from_bytes(map_bytes(filepath)))
+
+
+def solve_part1(regions: RegionList) -> int:
+    return regions.price_to_fence
+
+
+def solve_part2(regions: RegionList) -> int:
+    return regions.discounted_price_to_fence
+
+
 def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    return RegionList.from_str(data).price_to_fence
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    return RegionList.from_str(data).discounted_price_to_fence
-
+    return solve_part2(parse(filepath))
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
 
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    regions = parse(filepath)
+    return solve_part1(regions), solve_part2(regions)
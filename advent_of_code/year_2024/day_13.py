@@ -1,14 +1,8 @@
-import re
-from pathlib import Path
-from time import perf_counter
+from collections.abc import Buffer
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_13"
-
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+from advent_of_code.cache import cached_parse
+from advent_of_code.inputs import extract_ints, extract_records, map_bytes
 
 
 class ClawMachine:
@@ -32,28 +26,42 @@ class ClawMachine:
     def from_str(
         cls, data: str, max_presses: int | None = None, prize_offset: int = 0
     ) -> Self:
-        a_dxy, b_dxy, prize_xy = (
-            (int(match.group(1)), int(match.group(2)))
-            for match in re.finditer(r"X.([0-9]+), Y.([0-9]+)", data)
-        )
+        a_dx, a_dy, b_dx, b_dy, prize_x, prize_y = extract_ints(data.encode())
         return cls(
-            a_dxy, b_dxy, prize_xy, max_presses=max_presses, prize_offset=prize_offset
+            (a_dx, a_dy),
+            (b_dx, b_dy),
+            (prize_x, prize_y),
+            max_presses=max_presses,
+            prize_offset=prize_offset,
         )
 
     @classmethod
-    def list_from_input(
+    def list_from_bytes(
         cls,
-        data: str,
+        data: Buffer,
         max_presses: int | None = None,
         prize_offset: int = 0,
     ) -> list[Self]:
         return [
-            cls.from_str(
-                claw_machine_data, max_presses=max_presses, prize_offset=prize_offset
+            cls(
+                (a_dx, a_dy),
+                (b_dx, b_dy),
+                (prize_x, prize_y),
+                max_presses=max_presses,
+                prize_offset=prize_offset,
             )
-            for claw_machine_data in data.split("\n\n")
+            for a_dx, a_dy, b_dx, b_dy, prize_x, prize_y in extract_records(data, 6)
         ]
 
+    def with_rules(self, max_presses: int | None = None, prize_offset: int = 0) -> Self:
+        return type(self)(
+            self.a_dxy,
+            self.b_dxy,
+            self.prize_xy,
+            max_presses=max_presses,
+            prize_offset=prize_offset,
+        )
+
     def calculate_presses(
         self, a_dxy: tuple[int, int], b_dxy: tuple[int, int], prize_xy: tuple[int, int]
     ) -> int | None:
@@ -87,31 +95,33 @@ class ClawMachine:
         return self.a_presses * self.A_COST + self.b_presses * self.B_COST
 
 
-def part1(filepath: str) -> int:
-    data = read_input(filepath)
+@cached_parse
+def parse(filepath: str) -> list[ClawMachine]:
+    return ClawMachine.list_from_bytes(map_bytes(filepath))
+
+
+def solve_part1(claw_machines: list[ClawMachine]) -> int:
     return sum(
-        claw_machine.min_cost
-        for claw_machine in ClawMachine.list_from_input(data, max_presses=100)
+        claw_machine.with_rules(max_presses=100).min_cost
+        for claw_machine in claw_machines
     )
 
 
-def part2(filepath: str) -> int:
-    data = read_input(filepath)
+def solve_part2(claw_machines: list[ClawMachine]) -> int:
     return sum(
-        claw_machine.min_cost
-        for claw_machine in ClawMachine.list_from_input(
-            data, prize_offset=10_000_000_000_000
-        )
+        claw_machine.with_rules(prize_offset=10_000_000_000_000).min_cost
+        for claw_machine in claw_machines
     )
 
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
 
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+def solve(filepath: str) -> tuple[int, int]:
+    claw_machines = parse(filepath)
+    return solve_part1(claw_machines), solve_part2(claw_machines)
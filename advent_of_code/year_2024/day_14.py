@@ -1,14 +1,25 @@
-import re
-from pathlib import Path
-from time import perf_counter
-from typing import Self
-
-INPUT_FILEPATH = "data/2024_14"
-
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+import math
+from collections.abc import Buffer
+from functools import cached_property, partial
+from itertools import chain
+from typing import TYPE_CHECKING, Self
+
+from advent_of_code.cache import cached_parse
+from advent_of_code.cycles import combine_periods, find_cycle_length
+from advent_of_code.inputs import extract_records, map_bytes
+from advent_of_code.lazy import optional_import
+from advent_of_code.vector import use_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = optional_import("numpy")
+
+# Robots from which moving them all at once with NumPy beats moving them in Python,
+# once NumPy is imported and before.
+PART1_NUMPY_MIN_SIZES = (100, 1_000_000)
+PART2_NUMPY_MIN_SIZES = (10, 2000)
 
 
 class Map:
@@ -18,22 +29,15 @@ class Map:
         self.height = kwargs.get("height", 103)
 
     @classmethod
-    def from_str(cls, data: str, **kwargs: int) -> Self:
+    def from_bytes(cls, data: Buffer, **kwargs: int) -> Self:
         return cls(
-            [
-                (
-                    int(match.group(1)),
-                    int(match.group(2)),
-                    int(match.group(3)),
-                    int(match.group(4)),
-                )
-                for match in re.finditer(
-                    r"p=(-?[0-9]+),(-?[0-9]+) v=(-?[0-9]+),(-?[0-9]+)", data
-                )
-            ],
-            **kwargs,
+            [(x, y, dx, dy) for x, y, dx, dy in extract_records(data, 4)], **kwargs
         )
 
+    @classmethod
+    def from_str(cls, data: str, **kwargs: int) -> Self:
+        return cls.from_bytes(data.encode(), **kwargs)
+
     def simulate(self, i: int) -> Self:
         cls = type(self)
         return cls(
@@ -45,6 +49,44 @@ class Map:
             height=self.height,
         )
 
+    def find_tightest_step(self, axis: int) -> tuple[int, int]:
+        """Return the step at which robots bunch up most along an axis, 0 for x.
+
+        Each axis repeats on its own, far sooner than both together, so only its
+        period is searched. The step is returned with that period.
+        """
+        size = (self.width, self.height)[axis]
+        positions = tuple(robot[axis] for robot in self.robots)
+        velocities = tuple(robot[axis + 2] for robot in self.robots)
+
+        def step(positions: tuple[int, ...]) -> tuple[int, ...]:
+            return tuple(
+                [
+                    (position + velocity) % size
+                    for position, velocity in zip(positions, velocities, strict=True)
+                ]
+            )
+
+        period = find_cycle_length(positions, step)
+        if period is None:
+            raise ValueError
+        spreads = []
+        for _ in range(period):
+            # The variance of the positions, scaled by the square of their count.
+            spreads.append(
+                len(positions) * sum([position * position for position in positions])
+                - sum(positions) ** 2
+            )
+            positions = step(positions)
+        return spreads.index(min(spreads)), period
+
+    @cached_property
+    def robot_array(self) -> "NDArray[np.int64]":
+        """The robots as rows of x, y, dx and dy, for the NumPy path."""
+        return np.fromiter(
+            chain.from_iterable(self.robots), dtype=np.int64, count=4 * len(self.robots)
+        ).reshape(-1, 4)
+
     @property
     def safety_factor(self) -> int:
         quadrants = [0] * 4
@@ -66,33 +108,65 @@ class Map:
         return "\n".join("".join("#" if n else " " for n in row) for row in grid)
 
 
+def _get_safety_factor_numpy(robot_map: Map, steps: int) -> int:
+    robots = robot_map.robot_array
+    mid_x, mid_y = robot_map.width // 2, robot_map.height // 2
+    xs = (robots[:, 0] + steps * robots[:, 2]) % robot_map.width
+    ys = (robots[:, 1] + steps * robots[:, 3]) % robot_map.height
+    # Quadrants 0 to 3 as in Map.safety_factor, leaving out robots on the middles.
+    quadrants = (xs > mid_x) + 2 * (ys > mid_y)
+    off_middle = (xs != mid_x) & (ys != mid_y)
+    return math.prod(np.bincount(quadrants[off_middle], minlength=4).tolist())
+
+
+def _find_tightest_step_numpy(robot_map: Map, axis: int) -> tuple[int, int]:
+    # As Map.find_tightest_step, but every step up to the size of the axis at once,
+    # after which the positions are sure to repeat.
+    robots = robot_map.robot_array
+    size = (robot_map.width, robot_map.height)[axis]
+    steps = np.arange(size, dtype=np.int64)[:, np.newaxis]
+    positions = (robots[:, axis] + steps * robots[:, axis + 2]) % size
+    repeats = np.flatnonzero((positions[1:] == positions[0]).all(axis=1))
+    period = int(repeats[0]) + 1 if len(repeats) else size
+    positions = positions[:period]
+    spreads = (
+        len(robots) * (positions * positions).sum(axis=1) - positions.sum(axis=1) ** 2
+    )
+    return int(spreads.argmin()), period
+
+
+@cached_parse
+def parse(filepath: str, **kwargs: int) -> Map:
+    return Map.from_bytes(map_bytes(filepath), **kwargs)
+
+
+def solve_part1(robot_map: Map) -> int:
+    if use_numpy(len(robot_map.robots), *PART1_NUMPY_MIN_SIZES):
+        return _get_safety_factor_numpy(robot_map, 100)
+    return robot_map.simulate(100).safety_factor
+
+
+def solve_part2(robot_map: Map) -> int:
+    # The picture is where the robots bunch up along both axes at once.
+    find_tightest_step = (
+        partial(_find_tightest_step_numpy, robot_map)
+        if use_numpy(len(robot_map.robots), *PART2_NUMPY_MIN_SIZES)
+        else robot_map.find_tightest_step
+    )
+    combined = combine_periods(find_tightest_step(axis) for axis in (0, 1))
+    if combined is None:
+        raise ValueError
+    return combined[0]
+
+
 def part1(filepath: str, **kwargs: int) -> int:
-    data = read_input(filepath)
-    return Map.from_str(data, **kwargs).simulate(100).safety_factor
+    return solve_part1(parse(filepath, **kwargs))
 
 
 def part2(filepath: str, **kwargs: int) -> int:
-    data = read_input(filepath)
-    robot_map = Map.from_str(data, **kwargs)
-    safety_factor = robot_map.safety_factor
-    safety_factor_threshold = 120_000_000
-    i = 0
-    while safety_factor > safety_factor_threshold:
-        robot_map = robot_map.simulate(1)
-        i += 1
-        safety_factor = robot_map.safety_factor
-    print(robot_map)
-    print(f"{safety_factor:,}")
-    return i
-
-
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
-
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+    return solve_part2(parse(filepath, **kwargs))
+
+
+def solve(filepath: str, **kwargs: int) -> tuple[int, int]:
+    robot_map = parse(filepath, **kwargs)
+    return solve_part1(robot_map), solve_part2(robot_map)
@@ -1,14 +1,8 @@
-import re
-from pathlib import Path
-from time import perf_counter
+from collections.abc import Buffer
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_17"
-
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+from advent_of_code.cache import cached_parse
+from advent_of_code.inputs import extract_ints, map_bytes
 
 
 class Computer:
@@ -20,19 +14,8 @@ class Computer:
         self.i = 0
         self.output: list[int] = []
 
-    def parse_input(self, data: str) -> Self:
-        self.a, self.b, self.c = [
-            int(match.group(1))
-            for match in (
-                re.search(f"Register {register}: ([0-9]+)", data)
-                for register in ("A", "B", "C")
-            )
-            if match is not None
-        ]
-        program_match = re.search(r"Program: ([0-9,]+)", data)
-        if program_match is None:
-            raise ValueError
-        self.program = [int(n) for n in program_match.group(1).split(",")]
+    def parse_input(self, data: Buffer) -> Self:
+        self.a, self.b, self.c, *self.program = extract_ints(data)
         return self
 
     def combo(self, operand: int) -> int:
@@ -100,24 +83,29 @@ class Computer:
             f"\nA: {self.a:>10,}"
             f"\nB: {self.b:>10,}"
             f"\nC: {self.c:>10,}"
-            f"\n{self.program[self.i: self.i + 2]}"
+            f"\n{self.program[self.i : self.i + 2]}"
             f"\n{self.i}"
             f"\n{self.output}"
         )
 
 
-def part1(filepath: str) -> str:
-    data = read_input(filepath)
-    return Computer().parse_input(data).run_program()
+@cached_parse
+def parse(filepath: str) -> Computer:
+    return Computer().parse_input(map_bytes(filepath))
 
 
-def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    computer = Computer().parse_input(data)
+def solve_part1(computer: Computer) -> str:
+    return computer.run_program()
+
+
+def solve_part2(computer: Computer) -> int:
     a_heads = [0]
     for instruction in computer.program[::-1]:
         new_a_heads = []
         for a in [(a_head << 3) + a_tail for a_head in a_heads for a_tail in range(8)]:
+            # A zero A halts after one output, so it cannot lead a longer output.
+            if not a:
+                continue
             computer.reset(a)
             output = computer.get_first_output()
             if output == instruction:
@@ -126,13 +114,14 @@ def part2(filepath: str) -> int:
     return min(a_heads)
 
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
+def part1(filepath: str) -> str:
+    return solve_part1(parse(filepath))
+
+
+def part2(filepath: str) -> int:
+    return solve_part2(parse(filepath))
+
 
-    start = perf_counter()
-    result2 = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result2:>20} {seconds:>20.1f}s")
+def solve(filepath: str) -> tuple[str, int]:
+    computer = parse(filepath)
+    return solve_part1(computer), solve_part2(computer)
@@ -1,93 +1,95 @@
-from pathlib import Path
-from time import perf_counter
+from collections.abc import Buffer
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_18"
+from advent_of_code.bitboard import flood_fill, get_mask, iter_levels
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import Grid
+from advent_of_code.inputs import extract_records, map_bytes
 
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
+CORRUPTED = ord("#")
+SAFE = ord(".")
 
 
 class MemorySpace:
     def __init__(self, width: int, height: int, byte_count: int) -> None:
-        self.width = width
-        self.height = height
         self.byte_count = byte_count
-        self.xy = 0, 0
-        self.exit = width - 1, height - 1
+        self.grid = Grid.filled(width, height, SAFE)
+        self.start = self.grid.index(0, 0)
+        self.exit = self.grid.index(width - 1, height - 1)
         self.bytes: list[tuple[int, int]] = []
-        self.corrupted_bytes: set[tuple[int, int]] = set()
-        self.path: set[tuple[int, int]] = set()
-
-    def parse_input(self, data: str) -> Self:
-        self.bytes = [
-            (int(x), int(y)) for x, y in (line.split(",") for line in data.split("\n"))
-        ]
-        self.corrupted_bytes = set(self.bytes[: self.byte_count])
+
+    def parse_bytes(self, data: Buffer) -> Self:
+        self.bytes = [(x, y) for x, y in extract_records(data, 2)]
+        for xy in self.bytes[: self.byte_count]:
+            self.grid[self.grid.index(*xy)] = CORRUPTED
         return self
 
     def get_shortest_path(self) -> int | None:
-        paths = [[(0, 0)]]
-        visited = {(0, 0)}
-        while paths:
-            new_paths = []
-            for path in paths:
-                x, y = path[-1]
-                for x_new, y_new in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-                    if (
-                        not self.width > x_new >= 0
-                        or not self.height > y_new >= 0
-                        or (x_new, y_new) in visited | self.corrupted_bytes
-                    ):
-                        continue
-                    if (x_new, y_new) == self.exit:
-                        self.path = {*path, (x_new, y_new)}
-                        return len(self.path) - 1
-                    new_paths.append([*path, (x_new, y_new)])
-                    visited.add((x_new, y_new))
-            paths = new_paths
+        safe = get_mask(self.grid.cells, SAFE)
+        exit_ = 1 << self.exit
+        for steps, level in enumerate(
+            iter_levels(1 << self.start, safe, self.grid.stride)
+        ):
+            if level & exit_:
+                return steps
         return None
 
+    def is_exit_reachable(self, byte_count: int) -> bool:
+        grid = self.grid.copy()
+        for xy in self.bytes[self.byte_count : byte_count]:
+            grid[grid.index(*xy)] = CORRUPTED
+        reachable = flood_fill(1 << self.start, get_mask(grid.cells, SAFE), grid.stride)
+        return reachable >> self.exit & 1 == 1
+
     def get_blocking_byte(self) -> tuple[int, int] | None:
-        self.get_shortest_path()
-        for xy in self.bytes[self.byte_count :]:
-            self.corrupted_bytes.add(xy)
-            if xy in self.path:
-                shortest_path_len = self.get_shortest_path()
-                if shortest_path_len is None:
-                    return xy
-        return None
+        # Bytes only ever cut paths, so search for the first count that cuts them all.
+        low, high = self.byte_count + 1, len(self.bytes)
+        if self.is_exit_reachable(high):
+            return None
+        while low < high:
+            mid = (low + high) // 2
+            if self.is_exit_reachable(mid):
+                low = mid + 1
+            else:
+                high = mid
+        return self.bytes[low - 1]
+
 
+@cached_parse
+def parse(
+    filepath: str, width: int = 71, height: int = 71, byte_count: int = 1024
+) -> MemorySpace:
+    return MemorySpace(width, height, byte_count).parse_bytes(map_bytes(filepath))
 
-def part1(filepath: str, width: int, height: int, byte_count: int) -> int:
-    data = read_input(filepath)
-    shortest_path = (
-        MemorySpace(width, height, byte_count).parse_input(data).get_shortest_path()
-    )
+
+def solve_part1(memory_space: MemorySpace) -> int:
+    shortest_path = memory_space.get_shortest_path()
     if shortest_path is None:
         raise ValueError
     return shortest_path
 
 
-def part2(filepath: str, width: int, height: int, byte_count: int) -> str:
-    data = read_input(filepath)
-    blocking_byte = (
-        MemorySpace(width, height, byte_count).parse_input(data).get_blocking_byte()
-    )
+def solve_part2(memory_space: MemorySpace) -> str:
+    blocking_byte = memory_space.get_blocking_byte()
     if blocking_byte is None:
         raise ValueError
     return ",".join(str(n) for n in blocking_byte)
 
 
-if __name__ == "__main__":
-    start = perf_counter()
-    result1 = part1(INPUT_FILEPATH, 71, 71, 1024)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result1:>20} {seconds:>20.1f}s")
+def part1(
+    filepath: str, width: int = 71, height: int = 71, byte_count: int = 1024
+) -> int:
+    return solve_part1(parse(filepath, width, height, byte_count))
+
+
+def part2(
+    filepath: str, width: int = 71, height: int = 71, byte_count: int = 1024
+) -> str:
+    return solve_part2(parse(filepath, width, height, byte_count))
+
 
-    start = perf_counter()
-    result2 = part2(INPUT_FILEPATH, 71, 71, 1024)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result2:>20} {seconds:>20.1f}s")
+def solve(
+    filepath: str, width: int = 71, height: int = 71, byte_count: int = 1024
+) -> tuple[int, str]:
+    memory_space = parse(filepath, width, height, byte_count)
+    return solve_part1(memory_space), solve_part2(memory_space)
@@ -1,8 +1,9 @@
-from functools import cache
 from pathlib import Path
-from time import perf_counter
 
-INPUT_FILEPATH = "data/2024_19"
+from advent_of_code.cache import cached_parse
+from advent_of_code.counters import counters
+from advent_of_code.memo import Scope, memoize
+from advent_of_code.parallel import parallel_map
 
 
 def read_input(filepath: str) -> str:
@@ -10,7 +11,9 @@ def read_input(filepath: str) -> str:
         return file.read()
 
 
-def is_possible(design: str, patterns: set[str], max_pattern_len: int) -> bool:
+def is_possible(
+    design: str, patterns: frozenset[str] | set[str], max_pattern_len: int
+) -> bool:
     design_len = len(design)
     max_i = min(max_pattern_len, design_len)
     for i in range(max_i, 0, -1):
@@ -21,7 +24,7 @@ def is_possible(design: str, patterns: set[str], max_pattern_len: int) -> bool:
     return False
 
 
-def simplify_patterns(patterns: set[str], max_pattern_len: int) -> set[str]:
+def simplify_patterns(patterns: frozenset[str], max_pattern_len: int) -> set[str]:
     return {
         pattern
         for pattern in patterns
@@ -29,54 +32,68 @@ def simplify_patterns(patterns: set[str], max_pattern_len: int) -> set[str]:
     }
 
 
-def count_combinations(design: str, patterns: set[str], max_pattern_len: int) -> int:
-    @cache
-    def _count_combinations(design: str) -> int:
-        design_len = len(design)
-        max_i = min(max_pattern_len, len(design))
-        combos = 0
-        for i in range(max_i, 0, -1):
-            if design[:i] not in patterns:
-                continue
-            if i == design_len:
-                combos += 1
-            else:
-                combos += _count_combinations(design[i:])
-        return combos
+# Designs of an input share suffixes, so counts are kept for the whole input.
+@memoize(max_size=1 << 16, scope=Scope.INPUT)
+def _count_combinations(
+    design: str, patterns: frozenset[str], max_pattern_len: int
+) -> int:
+    design_len = len(design)
+    max_i = min(max_pattern_len, design_len)
+    combos = 0
+    for i in range(max_i, 0, -1):
+        if design[:i] not in patterns:
+            continue
+        if i == design_len:
+            combos += 1
+        else:
+            combos += _count_combinations(design[i:], patterns, max_pattern_len)
+    return combos
 
-    return _count_combinations(design)
 
+def count_combinations(
+    design: str, patterns: frozenset[str], max_pattern_len: int
+) -> int:
+    before = _count_combinations.memo.info()
+    combinations = _count_combinations(design, patterns, max_pattern_len)
+    if counters.enabled:
+        after = _count_combinations.memo.info()
+        counters.increment("day_19.cache_hits", after.hits - before.hits)
+        counters.increment("day_19.cache_misses", after.misses - before.misses)
+    return combinations
 
-def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    pattern_data, design_data = data.split("\n\n")
-    patterns = set(pattern_data.split(", "))
+
+type Towels = tuple[frozenset[str], list[str]]
+
+
+@cached_parse
+def parse(filepath: str) -> Towels:
+    pattern_data, design_data = read_input(filepath).split("\n\n")
+    return frozenset(pattern_data.split(", ")), design_data.split("\n")
+
+
+def solve_part1(towels: Towels) -> int:
+    patterns, designs = towels
     max_pattern_len = max(len(pattern) for pattern in patterns)
     simplified_patterns = simplify_patterns(patterns, max_pattern_len)
-    return sum(
-        is_possible(design, simplified_patterns, max_pattern_len)
-        for design in design_data.split("\n")
-    )
+    return sum(parallel_map(is_possible, designs, simplified_patterns, max_pattern_len))
+
+
+def solve_part2(towels: Towels) -> int:
+    patterns, designs = towels
+    max_pattern_len = max(len(pattern) for pattern in patterns)
+    return sum(parallel_map(count_combinations, designs, patterns, max_pattern_len))
+
+
+def part1(filepath: str) -> int:
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    pattern_data, design_data = data.split("\n\n")
-    patterns = set(pattern_data.split(", "))
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    patterns, designs = parse(filepath)
     max_pattern_len = max(len(pattern) for pattern in patterns)
-    return sum(
-        count_combinations(design, patterns, max_pattern_len)
-        for design in design_data.split("\n")
-    )
-
-
-if __name__ == "__main__":
-    start = perf_counter()
-    result1 = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result1:>20} {seconds:>20.1f}s")
-
-    start = perf_counter()
-    result2 = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result2:>20} {seconds:>20.1f}s")
+    combinations = parallel_map(count_combinations, designs, patterns, max_pattern_len)
+    return sum(bool(n) for n in combinations), sum(combinations)
@@ -1,84 +1,105 @@
-from collections.abc import Generator
-from pathlib import Path
-from time import perf_counter
+from array import array
+from collections.abc import Buffer, Sequence
 from typing import Self
 
-INPUT_FILEPATH = "data/2024_20"
+from advent_of_code.cache import cached_parse
+from advent_of_code.grid import Grid
+from advent_of_code.inputs import map_bytes
+from advent_of_code.parallel import parallel_map
+from advent_of_code.search import bfs
+from advent_of_code.spans import spans
 
-
-def read_input(filepath: str) -> str:
-    with Path(filepath).open() as file:
-        return file.read()
-
-
-def get_adjacent(xy: tuple[int, int]) -> Generator[tuple[int, int]]:
-    x, y = xy
-    yield from ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1))
+END = ord("E")
+START = ord("S")
+WALL = ord("#")
+# Shorter paths are counted faster than a process pool starts.
+MIN_PARALLEL_PATH_LENGTH = 1000
 
 
 class Map:
-    def __init__(
-        self, start: tuple[int, int], end: tuple[int, int], walls: set[tuple[int, int]]
-    ) -> None:
+    def __init__(self, grid: Grid, start: int, end: int) -> None:
+        self.grid = grid
         self.start = start
         self.end = end
-        self.walls = walls
 
     @classmethod
-    def from_str(cls, string: str) -> Self:
-        walls = set()
-        for y, line in enumerate(string.split("\n")):
-            for x, char in enumerate(line):
-                if char == "#":
-                    walls.add((x, y))
-                elif char == "S":
-                    start = (x, y)
-                elif char == "E":
-                    end = (x, y)
-        return cls(start, end, walls)
+    def from_bytes(cls, data: Buffer) -> Self:
+        grid = Grid.from_bytes(data)
+        return cls(grid, grid.find(START), grid.find(END))
+
+    @classmethod
+    def from_str(cls, data: str) -> Self:
+        return cls.from_bytes(data.encode())
+
+    def get_track_neighbours(self, position: int) -> list[int]:
+        cells = self.grid.cells
+        return [
+            position + offset
+            for offset in self.grid.offsets
+            if cells[position + offset] != WALL
+        ]
 
     def get_path(self) -> list[tuple[int, int]]:
-        previous: tuple[int, int] | None = None
-        path = [self.start]
-        while path[-1] != self.end:
-            for xy in get_adjacent(path[-1]):
-                if xy != previous and xy not in self.walls:
-                    previous = path[-1]
-                    path.append(xy)
-                    break
-        return path
+        result = bfs([self.start], self.get_track_neighbours, {self.end})
+        return [self.grid.coords(position) for position in result.path_to(self.end)]
 
 
-def count_cheats(
-    path: list[tuple[int, int]], cheat_duration: int, min_steps_saved: int
+def count_cheats_from(
+    i: int,
+    xs: Sequence[int],
+    ys: Sequence[int],
+    cheat_duration: int,
+    min_steps_saved: int,
 ) -> int:
+    x1, y1 = xs[i], ys[i]
     total = 0
-    for i, (x1, y1) in enumerate(path):
-        for steps_cut, (x2, y2) in enumerate(path[i + min_steps_saved :]):
-            cheat_steps = abs(x2 - x1) + abs(y2 - y1)
-            if cheat_steps <= cheat_duration and cheat_steps <= steps_cut:
-                total += 1
+    start = i + min_steps_saved
+    steps_cuts = range(len(xs) - start)
+    for steps_cut, x2, y2 in zip(steps_cuts, xs[start:], ys[start:], strict=True):
+        cheat_steps = abs(x2 - x1) + abs(y2 - y1)
+        if cheat_steps <= cheat_duration and cheat_steps <= steps_cut:
+            total += 1
     return total
 
 
+@spans.traced("day_20.count_cheats")
+def count_cheats(
+    path: list[tuple[int, int]], cheat_duration: int, min_steps_saved: int
+) -> int:
+    return sum(
+        parallel_map(
+            count_cheats_from,
+            range(len(path)),
+            array("q", [x for x, _ in path]),
+            array("q", [y for _, y in path]),
+            cheat_duration,
+            min_steps_saved,
+            min_items=MIN_PARALLEL_PATH_LENGTH,
+        )
+    )
+
+
+@cached_parse
+def parse(filepath: str) -> Map:
+    return Map.from_bytes(map_bytes(filepath))
+
+
+def solve_part1(map_: Map) -> int:
+    return count_cheats(map_.get_path(), 2, 100)
+
+
+def solve_part2(map_: Map) -> int:
+    return count_cheats(map_.get_path(), 20, 100)
+
+
 def part1(filepath: str) -> int:
-    data = read_input(filepath)
-    path = Map.from_str(data).get_path()
-    return count_cheats(path, 2, 100)
+    return solve_part1(parse(filepath))
 
 
 def part2(filepath: str) -> int:
-    data = read_input(filepath)
-    path = Map.from_str(data).get_path()
-    return count_cheats(path, 20, 100)
-
-
-if __name__ == "__main__":
-    start = perf_counter()
-    result = part1(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 1: {result:>20} {seconds:>20.1f}s")
-    start = perf_counter()
-    result = part2(INPUT_FILEPATH)
-    seconds = perf_counter() - start
-    print(f"Part 2: {result:>20} {seconds:>20.1f}s")
+    return solve_part2(parse(filepath))
+
+
+def solve(filepath: str) -> tuple[int, int]:
+    path = parse(filepath).get_path()
+    return count_cheats(path, 2, 100), count_cheats(path, 20, 100)
@@ -0,0 +1,441 @@
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import combinations
+from random import Random
+from string import ascii_letters, ascii_uppercase, digits
+
+type Generate = Callable[[Random, int], str]
+type GetSolveKwargs = Callable[[int], dict[str, int]]
+
+DIRECTION_CHARS = "^>v<"
+DIRECTION_DXYS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+TOWEL_COLOURS = "wubrg"
+TOWEL_PATTERN_COUNT = 447
+CORNER_DISTANCE = 3
+DAY_03_CHUNK_KINDS = ("mul", "instruction", "corrupted", "noise")
+DAY_03_CHUNK_WEIGHTS = (50, 5, 10, 35)
+
+
+@dataclass(frozen=True)
+class InputGenerator:
+    """Generates puzzle inputs whose size is measured in one natural unit.
+
+    Scaling multiplies the amount of input, so a grid's side length grows with the
+    square root of the scale.
+    """
+
+    generate: Generate
+    real_size: int
+    dimensions: int = 1
+    get_solve_kwargs: GetSolveKwargs | None = None
+
+    def get_size(self, scale: float) -> int:
+        return max(1, round(self.real_size * math.pow(scale, 1 / self.dimensions)))
+
+
+@dataclass(frozen=True)
+class SyntheticInput:
+    data: str
+    solve_kwargs: dict[str, int] = field(default_factory=dict)
+
+
+GENERATORS: dict[int, InputGenerator] = {}
+
+
+def generator(
+    day: int,
+    real_size: int,
+    dimensions: int = 1,
+    get_solve_kwargs: GetSolveKwargs | None = None,
+) -> Callable[[Generate], Generate]:
+    def decorator(generate: Generate) -> Generate:
+        GENERATORS[day] = InputGenerator(
+            generate, real_size, dimensions, get_solve_kwargs
+        )
+        return generate
+
+    return decorator
+
+
+def generate_input(day: int, scale: float = 1, seed: int = 0) -> SyntheticInput:
+    generator_ = GENERATORS[day]
+    size = generator_.get_size(scale)
+    solve_kwargs = (
+        generator_.get_solve_kwargs(size) if generator_.get_solve_kwargs else {}
+    )
+    return SyntheticInput(generator_.generate(Random(seed), size), solve_kwargs)
+
+
+def _chance(rng: Random, probability: float) -> bool:
+    return rng.random() < probability
+
+
+def _join_grid(rows: list[list[str]]) -> str:
+    return "\n".join("".join(row) for row in rows)
+
+
+def _carve_maze(rng: Random, side: int) -> list[list[str]]:
+    rows = [["#"] * side for _ in range(side)]
+    rows[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        unvisited = [
+            (x + dx, y + dy)
+            for dx, dy in ((2 * dx, 2 * dy) for dx, dy in DIRECTION_DXYS)
+            if side - 1 > x + dx > 0
+            and side - 1 > y + dy > 0
+            and rows[y + dy][x + dx] == "#"
+        ]
+        if not unvisited:
+            stack.pop()
+            continue
+        next_x, next_y = rng.choice(unvisited)
+        rows[(y + next_y) // 2][(x + next_x) // 2] = "."
+        rows[next_y][next_x] = "."
+        stack.append((next_x, next_y))
+    return rows
+
+
+def _find_maze_path(
+    rows: list[list[str]], start: tuple[int, int], end: tuple[int, int]
+) -> list[tuple[int, int]]:
+    previous = {start: start}
+    frontier = [start]
+    while end not in previous:
+        new_frontier = []
+        for x, y in frontier:
+            for xy in ((x + dx, y + dy) for dx, dy in DIRECTION_DXYS):
+                if rows[xy[1]][xy[0]] != "#" and xy not in previous:
+                    previous[xy] = (x, y)
+                    new_frontier.append(xy)
+        frontier = new_frontier
+    path = [end]
+    while path[-1] != start:
+        path.append(previous[path[-1]])
+    return path[::-1]
+
+
+@generator(day=1, real_size=1000)
+def _generate_day_01(rng: Random, size: int) -> str:
+    left = [rng.randint(10_000, 99_999) for _ in range(size)]
+    right = [
+        rng.choice(left) if _chance(rng, 0.3) else rng.randint(10_000, 99_999)
+        for _ in range(size)
+    ]
+    return "\n".join(f"{x}   {y}" for x, y in zip(left, right, strict=True))
+
+
+@generator(day=2, real_size=1000)
+def _generate_day_02(rng: Random, size: int) -> str:
+    reports = []
+    for _ in range(size):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(20, 80)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if _chance(rng, 0.9) else rng.randint(-2, 5)
+            levels.append(levels[-1] + direction * step)
+        reports.append(" ".join(str(level) for level in levels))
+    return "\n".join(reports)
+
+
+@generator(day=3, real_size=18_000)
+def _generate_day_03(rng: Random, size: int) -> str:
+    chunks = []
+    length = 0
+    while length < size:
+        kind = rng.choices(DAY_03_CHUNK_KINDS, DAY_03_CHUNK_WEIGHTS)[0]
+        if kind == "mul":
+            chunk = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif kind == "instruction":
+            chunk = rng.choice(("do()", "don't()"))
+        elif kind == "corrupted":
+            chunk = rng.choice(("mul(4*", "mul(6,9!", "mul ( 2 , 4 )", "?(12,34)"))
+        else:
+            chunk = "".join(rng.choices("%&*+-/<>?@[]^_{}'!#$ how() what()", k=8))
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks)
+
+
+@generator(day=4, real_size=140, dimensions=2)
+def _generate_day_04(rng: Random, size: int) -> str:
+    return _join_grid([rng.choices("XMAS", k=size) for _ in range(size)])
+
+
+@generator(day=5, real_size=200)
+def _generate_day_05(rng: Random, size: int) -> str:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{x}|{y}" for x, y in combinations(pages, 2)]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if _chance(rng, 0.5):
+            update.sort(key=pages.index)
+        updates.append(",".join(str(page) for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+@generator(day=6, real_size=130, dimensions=2)
+def _generate_day_06(rng: Random, size: int) -> str:
+    rows = [["."] * size for _ in range(size)]
+    x = y = size // 2
+    direction, leg, steps = 0, 1, 0
+    visited = {(x, y)}
+    # Turn the guard outwards in a ragged spiral so that it covers much of the lab
+    # before leaving, then add obstacles off its route.
+    while True:
+        dx, dy = DIRECTION_DXYS[direction]
+        if not (size > x + dx >= 0 and size > y + dy >= 0):
+            break
+        if steps == leg:
+            rows[y + dy][x + dx] = "#"
+            direction = (direction + 1) % 4
+            leg += rng.randint(1, 2)
+            steps = 0
+        else:
+            x, y = x + dx, y + dy
+            visited.add((x, y))
+            steps += 1
+    for obstacle_y, row in enumerate(rows):
+        for obstacle_x in range(size):
+            if (obstacle_x, obstacle_y) not in visited and _chance(rng, 0.02):
+                row[obstacle_x] = "#"
+    rows[size // 2][size // 2] = "^"
+    return _join_grid(rows)
+
+
+@generator(day=7, real_size=850)
+def _generate_day_07(rng: Random, size: int) -> str:
+    equations = []
+    for _ in range(size):
+        numbers = [
+            rng.randint(1, 9) if _chance(rng, 0.6) else rng.randint(10, 999)
+            for _ in range(rng.randint(3, 12))
+        ]
+        operators = "+*|" if _chance(rng, 0.5) else "+*"
+        total = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.choice(operators)
+            if operator == "+":
+                total += number
+            elif operator == "*":
+                total *= number
+            else:
+                total = int(f"{total}{number}")
+        if _chance(rng, 0.3):
+            total += 1
+        equations.append(f"{total}: {' '.join(str(n) for n in numbers)}")
+    return "\n".join(equations)
+
+
+@generator(day=8, real_size=50, dimensions=2)
+def _generate_day_08(rng: Random, size: int) -> str:
+    rows = [["."] * size for _ in range(size)]
+    antenna_count = size * size // 12
+    frequencies = rng.sample(digits + ascii_letters, min(62, antenna_count // 4 + 1))
+    for _ in range(antenna_count):
+        rows[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    return _join_grid(rows)
+
+
+@generator(day=9, real_size=19_999)
+def _generate_day_09(rng: Random, size: int) -> str:
+    return "".join(
+        str(rng.randint(0, 9) if i % 2 else rng.randint(1, 9)) for i in range(size | 1)
+    )
+
+
+@generator(day=10, real_size=50, dimensions=2)
+def _generate_day_10(rng: Random, size: int) -> str:
+    # Most heights are one up or down from a neighbour, so trails wind around.
+    rows: list[list[int]] = []
+    for y in range(size):
+        row: list[int] = []
+        for x in range(size):
+            if x and (not y or _chance(rng, 0.5)):
+                row.append((row[-1] + rng.choice((-1, 1))) % 10)
+            elif y:
+                row.append((rows[-1][x] + rng.choice((-1, 1))) % 10)
+            else:
+                row.append(rng.randint(0, 9))
+        rows.append(row)
+    return "\n".join("".join(str(height) for height in row) for row in rows)
+
+
+@generator(day=11, real_size=8)
+def _generate_day_11(rng: Random, size: int) -> str:
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(size))
+
+
+@generator(day=12, real_size=140, dimensions=2)
+def _generate_day_12(rng: Random, size: int) -> str:
+    rows: list[list[str]] = []
+    for y in range(size):
+        row: list[str] = []
+        for x in range(size):
+            if x and _chance(rng, 0.45):
+                row.append(row[-1])
+            elif y and _chance(rng, 0.8):
+                row.append(rows[-1][x])
+            else:
+                row.append(rng.choice(ascii_uppercase))
+        rows.append(row)
+    return _join_grid(rows)
+
+
+@generator(day=13, real_size=320)
+def _generate_day_13(rng: Random, size: int) -> str:
+    machines: list[str] = []
+    while len(machines) < size:
+        a_dx, a_dy, b_dx, b_dy = (rng.randint(10, 99) for _ in range(4))
+        if a_dx * b_dy == a_dy * b_dx:
+            continue
+        if _chance(rng, 0.5):
+            a_presses, b_presses = rng.randint(1, 100), rng.randint(1, 100)
+            prize_x = a_presses * a_dx + b_presses * b_dx
+            prize_y = a_presses * a_dy + b_presses * b_dy
+        else:
+            prize_x, prize_y = rng.randint(1000, 20_000), rng.randint(1000, 20_000)
+        machines.append(
+            f"Button A: X+{a_dx}, Y+{a_dy}\n"
+            f"Button B: X+{b_dx}, Y+{b_dy}\n"
+            f"Prize: X={prize_x}, Y={prize_y}"
+        )
+    return "\n\n".join(machines)
+
+
+@generator(day=14, real_size=500)
+def _generate_day_14(rng: Random, size: int) -> str:
+    width, height = 101, 103
+    # Every robot meets in the top left quadrant at one step, which part 2 finds.
+    step = rng.randrange(1, width * height)
+    robots = []
+    for _ in range(size):
+        x, y = rng.randint(10, 40), rng.randint(10, 40)
+        dx, dy = rng.randint(-100, 100), rng.randint(-100, 100)
+        x, y = (x - step * dx) % width, (y - step * dy) % height
+        robots.append(f"p={x},{y} v={dx},{dy}")
+    return "\n".join(robots)
+
+
+@generator(day=15, real_size=50, dimensions=2)
+def _generate_day_15(rng: Random, size: int) -> str:
+    rows = [
+        [
+            "#"
+            if x in {0, size - 1} or y in {0, size - 1} or _chance(rng, 0.1)
+            else rng.choice("O..")
+            for x in range(size)
+        ]
+        for y in range(size)
+    ]
+    rows[size // 2][size // 2] = "@"
+    instructions = rng.choices(DIRECTION_CHARS, k=8 * size * size)
+    instruction_rows = [
+        "".join(instructions[i : i + 1000]) for i in range(0, len(instructions), 1000)
+    ]
+    return _join_grid(rows) + "\n\n" + "\n".join(instruction_rows)
+
+
+@generator(day=16, real_size=141, dimensions=2)
+def _generate_day_16(rng: Random, size: int) -> str:
+    side = max(size | 1, 5)
+    rows = _carve_maze(rng, side)
+    # Open some more walls so that there are several best paths.
+    for _ in range(side * side // 40):
+        x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (x + y) % 2:
+            rows[y][x] = "."
+    rows[side - 2][1] = "S"
+    rows[1][side - 2] = "E"
+    return _join_grid(rows)
+
+
+def _get_first_output(a: int, x: int, y: int) -> int:
+    b = (a % 8) ^ x
+    return (b ^ y ^ (a >> b)) % 8
+
+
+def _has_quine(program: list[int], x: int, y: int) -> bool:
+    a_heads = [0]
+    for instruction in program[::-1]:
+        a_heads = [
+            a
+            for a_head in a_heads
+            for a in range(a_head << 3, (a_head << 3) + 8)
+            if a and _get_first_output(a, x, y) == instruction
+        ]
+    return bool(a_heads)
+
+
+@generator(day=17, real_size=16)
+def _generate_day_17(rng: Random, size: int) -> str:
+    # The output has one digit per octal digit of A, while the program keeps the
+    # usual shape so that part 2 has an answer.
+    while True:
+        x, y = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+        if _has_quine(program, x, y):
+            break
+    a = rng.randrange(8 ** (size - 1), 8**size)
+    return (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(str(n) for n in program)}"
+    )
+
+
+def _get_day_18_kwargs(size: int) -> dict[str, int]:
+    return {
+        "width": size,
+        "height": size,
+        "byte_count": round(1024 * (size / 71) ** 2),
+    }
+
+
+@generator(day=18, real_size=71, dimensions=2, get_solve_kwargs=_get_day_18_kwargs)
+def _generate_day_18(rng: Random, size: int) -> str:
+    xys = [(x, y) for y in range(size) for x in range(size)][1:-1]
+    rng.shuffle(xys)
+    # Keep the first bytes away from the corners so that part 1 has a path.
+    xys.sort(key=lambda xy: min(sum(xy), 2 * size - 2 - sum(xy)) < CORNER_DISTANCE)
+    return "\n".join(f"{x},{y}" for x, y in xys[: len(xys) * 7 // 10])
+
+
+@generator(day=19, real_size=400)
+def _generate_day_19(rng: Random, size: int) -> str:
+    # Every colour but red is a towel on its own, and red only appears between other
+    # colours, so designs with two reds in a row are impossible.
+    patterns = {colour for colour in TOWEL_COLOURS if colour != "r"}
+    while len(patterns) < TOWEL_PATTERN_COUNT:
+        pattern = "".join(rng.choices(TOWEL_COLOURS, k=rng.randint(2, 8)))
+        if "rr" not in pattern and pattern[0] != "r" and pattern[-1] != "r":
+            patterns.add(pattern)
+    pattern_list = sorted(patterns)
+    designs = []
+    for _ in range(size):
+        length = rng.randint(40, 60)
+        if _chance(rng, 0.5):
+            design = ""
+            while len(design) < length:
+                design += rng.choice(pattern_list)
+        else:
+            design = "".join(rng.choices(TOWEL_COLOURS, k=length))
+        designs.append(design)
+    return ", ".join(pattern_list) + "\n\n" + "\n".join(designs)
+
+
+@generator(day=20, real_size=141, dimensions=2)
+def _generate_day_20(rng: Random, size: int) -> str:
+    side = max(size | 1, 5)
+    maze = _carve_maze(rng, side)
+    path = _find_maze_path(maze, (1, side - 2), (side - 2, 1))
+    rows = [["#"] * side for _ in range(side)]
+    for x, y in path:
+        rows[y][x] = "."
+    (start_x, start_y), (end_x, end_y) = path[0], path[-1]
+    rows[start_y][start_x] = "S"
+    rows[end_y][end_x] = "E"
+    return _join_grid(rows)
@@ -0,0 +1,672 @@
+import heapq
+import re
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterator
+from functools import cmp_to_key
+from itertools import batched, combinations, pairwise
+from math import prod
+
+# Reference solvers, kept as plain as possible so that optimized days can be checked
+# against them (see advent_of_code.differential). They use only the standard library
+# and share no code with the days, so optimizing a day or a package module cannot
+# change them. Do not optimize them.
+#
+# Each takes an input's text and the day's solve keyword arguments and returns both
+# answers. They raise on inputs that break the puzzle's promises, such as a maze
+# that is not walled in, which marks those inputs as invalid rather than failing.
+
+type Answers = tuple[int | str, int | str]
+type Solve = Callable[..., Answers]
+type Coord = tuple[int, int]
+
+REFERENCES: dict[int, Solve] = {}
+
+DXYS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+DIAGONAL_DXYS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+MAX_LEVEL_STEP = 3
+# Instructions a day 17 program may run before it is taken not to halt.
+MAX_INSTRUCTIONS = 100_000
+
+
+def reference(day: int) -> Callable[[Solve], Solve]:
+    def decorator(solve: Solve) -> Solve:
+        REFERENCES[day] = solve
+        return solve
+
+    return decorator
+
+
+def _extract_ints(text: str) -> list[int]:
+    return [int(n) for n in re.findall(r"-?[0-9]+", text)]
+
+
+def _read_grid(text: str) -> dict[Coord, str]:
+    return {
+        (x, y): char
+        for y, line in enumerate(text.splitlines())
+        for x, char in enumerate(line)
+    }
+
+
+def _find(grid: dict[Coord, str], char: str) -> Coord:
+    for xy, grid_char in grid.items():
+        if grid_char == char:
+            return xy
+    raise ValueError
+
+
+def _check_walled(grid: dict[Coord, str]) -> None:
+    width = max(x for x, _ in grid) + 1
+    height = max(y for _, y in grid) + 1
+    for (x, y), char in grid.items():
+        if char != "#" and (x in {0, width - 1} or y in {0, height - 1}):
+            raise ValueError
+
+
+def _add(xy: Coord, dxy: Coord, times: int = 1) -> Coord:
+    return xy[0] + times * dxy[0], xy[1] + times * dxy[1]
+
+
+@reference(day=1)
+def _solve_day_01(data: str) -> tuple[int, int]:
+    numbers = _extract_ints(data)
+    left, right = sorted(numbers[0::2]), sorted(numbers[1::2])
+    distance = sum(abs(x - y) for x, y in zip(left, right, strict=True))
+    return distance, sum(x * right.count(x) for x in left)
+
+
+def _is_safe(levels: list[int]) -> bool:
+    steps = [y - x for x, y in pairwise(levels)]
+    return all(MAX_LEVEL_STEP >= step >= 1 for step in steps) or all(
+        -1 >= step >= -MAX_LEVEL_STEP for step in steps
+    )
+
+
+@reference(day=2)
+def _solve_day_02(data: str) -> tuple[int, int]:
+    reports = [levels for line in data.splitlines() if (levels := _extract_ints(line))]
+    safe = sum(_is_safe(levels) for levels in reports)
+    dampened = sum(
+        any(_is_safe(levels[:i] + levels[i + 1 :]) for i in range(len(levels)))
+        for levels in reports
+    )
+    return safe, dampened
+
+
+@reference(day=3)
+def _solve_day_03(data: str) -> tuple[int, int]:
+    total = enabled_total = 0
+    enabled = True
+    for match in re.finditer(r"mul\(([0-9]+),([0-9]+)\)|do\(\)|don't\(\)", data):
+        if match[0] == "do()":
+            enabled = True
+        elif match[0] == "don't()":
+            enabled = False
+        else:
+            result = int(match[1]) * int(match[2])
+            total += result
+            enabled_total += result if enabled else 0
+    return total, enabled_total
+
+
+@reference(day=4)
+def _solve_day_04(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    xmas = sum(
+        all(grid.get(_add(xy, dxy, i)) == char for i, char in enumerate("XMAS"))
+        for xy in grid
+        for dxy in DIAGONAL_DXYS
+    )
+    x_mas = sum(
+        grid[xy] == "A"
+        and {grid.get(_add(xy, (-1, -1))), grid.get(_add(xy, (1, 1)))} == {"M", "S"}
+        and {grid.get(_add(xy, (1, -1))), grid.get(_add(xy, (-1, 1)))} == {"M", "S"}
+        for xy in grid
+    )
+    return xmas, x_mas
+
+
+@reference(day=5)
+def _solve_day_05(data: str) -> tuple[int, int]:
+    rule_data, update_data = data.split("\n\n")
+    rules = {(x, y) for x, y in batched(_extract_ints(rule_data), 2, strict=True)}
+    updates = [_extract_ints(line) for line in update_data.splitlines()]
+
+    def compare(x: int, y: int) -> int:
+        return -1 if (x, y) in rules else int((y, x) in rules)
+
+    ordered_total = reordered_total = 0
+    for update in updates:
+        ordered = sorted(update, key=cmp_to_key(compare))
+        # Only rules between neighbours fix the one order an update may take.
+        if any((x, y) not in rules for x, y in pairwise(ordered)):
+            raise ValueError
+        if ordered == update:
+            ordered_total += update[len(update) // 2]
+        else:
+            reordered_total += ordered[len(ordered) // 2]
+    return ordered_total, reordered_total
+
+
+def _walk_guard(grid: dict[Coord, str], start: Coord) -> set[Coord] | None:
+    """Return the positions the guard visits, or None if the guard loops."""
+    xy, direction = start, 0
+    states: set[tuple[Coord, int]] = set()
+    while xy in grid:
+        if (xy, direction) in states:
+            return None
+        states.add((xy, direction))
+        next_xy = _add(xy, DXYS[direction])
+        if grid.get(next_xy) == "#":
+            direction = (direction + 1) % 4
+        else:
+            xy = next_xy
+    return {xy for xy, _ in states}
+
+
+@reference(day=6)
+def _solve_day_06(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    start = _find(grid, "^")
+    visited = _walk_guard(grid, start)
+    if visited is None:
+        raise ValueError
+    # The guard would see an obstruction put where it starts.
+    loops = sum(
+        _walk_guard(grid | {xy: "#"}, start) is None for xy in visited - {start}
+    )
+    return len(visited), loops
+
+
+def _concatenate(x: int, y: int) -> int:
+    return int(f"{x}{y}")
+
+
+def _is_solvable(
+    total: int, numbers: list[int], operators: tuple[Callable[[int, int], int], ...]
+) -> bool:
+    # No operator lowers a value, as numbers are positive, so drop values over total.
+    if min(numbers) < 1:
+        raise ValueError
+    values = {numbers[0]}
+    for number in numbers[1:]:
+        values = {
+            value
+            for value in (operator(x, number) for x in values for operator in operators)
+            if value <= total
+        }
+    return total in values
+
+
+@reference(day=7)
+def _solve_day_07(data: str) -> tuple[int, int]:
+    equations = [ints for line in data.splitlines() if (ints := _extract_ints(line))]
+    add, multiply = int.__add__, int.__mul__
+    return (
+        sum(
+            total
+            for total, *numbers in equations
+            if _is_solvable(total, numbers, (add, multiply))
+        ),
+        sum(
+            total
+            for total, *numbers in equations
+            if _is_solvable(total, numbers, (add, multiply, _concatenate))
+        ),
+    )
+
+
+@reference(day=8)
+def _solve_day_08(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    antennas: dict[str, list[Coord]] = defaultdict(list)
+    for xy, char in grid.items():
+        if char != ".":
+            antennas[char].append(xy)
+    antinodes: set[Coord] = set()
+    harmonic_antinodes: set[Coord] = set()
+    for xys in antennas.values():
+        for (x1, y1), (x2, y2) in combinations(xys, 2):
+            dxy = x1 - x2, y1 - y2
+            antinodes |= {_add((x1, y1), dxy), _add((x2, y2), dxy, -1)} & grid.keys()
+            for start, sign in (((x1, y1), 1), ((x2, y2), -1)):
+                xy = start
+                while xy in grid:
+                    harmonic_antinodes.add(xy)
+                    xy = _add(xy, dxy, sign)
+    return len(antinodes), len(harmonic_antinodes)
+
+
+def _compact_blocks(sizes: list[int]) -> int:
+    blocks: list[int | None] = []
+    for i, size in enumerate(sizes):
+        blocks += [None if i % 2 else i // 2] * size
+    left, right = 0, len(blocks) - 1
+    while left < right:
+        if blocks[left] is not None:
+            left += 1
+        elif blocks[right] is None:
+            right -= 1
+        else:
+            blocks[left], blocks[right] = blocks[right], None
+    return sum(i * file_id for i, file_id in enumerate(blocks) if file_id is not None)
+
+
+def _compact_files(sizes: list[int]) -> int:
+    files: list[list[int]] = []
+    spaces: list[list[int]] = []
+    position = 0
+    for i, size in enumerate(sizes):
+        (spaces if i % 2 else files).append([position, size])
+        position += size
+    for file in reversed(files):
+        for space in spaces:
+            if space[0] >= file[0]:
+                break
+            if space[1] >= file[1]:
+                file[0] = space[0]
+                space[0] += file[1]
+                space[1] -= file[1]
+                break
+    return sum(
+        file_id * sum(range(start, start + size))
+        for file_id, (start, size) in enumerate(files)
+    )
+
+
+@reference(day=9)
+def _solve_day_09(data: str) -> tuple[int, int]:
+    sizes = [int(char) for char in data.rstrip("\n")]
+    return _compact_blocks(sizes), _compact_files(sizes)
+
+
+def _iter_trail_ends(heights: dict[Coord, int], xy: Coord) -> Iterator[Coord]:
+    """Yield the end of every trail from a position, once for each trail."""
+    if heights[xy] == 9:  # noqa: PLR2004
+        yield xy
+        return
+    for dxy in DXYS:
+        next_xy = _add(xy, dxy)
+        if heights.get(next_xy) == heights[xy] + 1:
+            yield from _iter_trail_ends(heights, next_xy)
+
+
+@reference(day=10)
+def _solve_day_10(data: str) -> tuple[int, int]:
+    heights = {xy: int(char) for xy, char in _read_grid(data).items() if char.isdigit()}
+    trailheads = [xy for xy, height in heights.items() if height == 0]
+    ends = [list(_iter_trail_ends(heights, xy)) for xy in trailheads]
+    return sum(len(set(xys)) for xys in ends), sum(len(xys) for xys in ends)
+
+
+def _blink(stones: Counter[int]) -> Counter[int]:
+    next_stones: Counter[int] = Counter()
+    for stone, count in stones.items():
+        digits = str(stone)
+        if stone == 0:
+            next_stones[1] += count
+        elif len(digits) % 2:
+            next_stones[stone * 2024] += count
+        else:
+            next_stones[int(digits[: len(digits) // 2])] += count
+            next_stones[int(digits[len(digits) // 2 :])] += count
+    return next_stones
+
+
+@reference(day=11)
+def _solve_day_11(data: str) -> tuple[int, int]:
+    stones = Counter(int(n) for n in data.split())
+    totals = []
+    for _ in range(75):
+        stones = _blink(stones)
+        totals.append(stones.total())
+    return totals[24], totals[74]
+
+
+def _find_region(grid: dict[Coord, str], start: Coord) -> set[Coord]:
+    region = {start}
+    queue = deque([start])
+    while queue:
+        xy = queue.popleft()
+        for dxy in DXYS:
+            next_xy = _add(xy, dxy)
+            if next_xy not in region and grid.get(next_xy) == grid[start]:
+                region.add(next_xy)
+                queue.append(next_xy)
+    return region
+
+
+def _count_sides(region: set[Coord]) -> int:
+    fences = {(xy, dxy) for xy in region for dxy in DXYS if _add(xy, dxy) not in region}
+    # Count each side once, at the fence at one end of it.
+    return sum((_add(xy, (-dxy[1], dxy[0])), dxy) not in fences for xy, dxy in fences)
+
+
+def _count_fences(region: set[Coord]) -> int:
+    return sum(_add(xy, dxy) not in region for xy in region for dxy in DXYS)
+
+
+@reference(day=12)
+def _solve_day_12(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    unlabelled = set(grid)
+    price = discounted_price = 0
+    while unlabelled:
+        region = _find_region(grid, min(unlabelled))
+        unlabelled -= region
+        price += len(region) * _count_fences(region)
+        discounted_price += len(region) * _count_sides(region)
+    return price, discounted_price
+
+
+def _get_min_tokens(machine: tuple[int, ...], max_presses: int) -> int:
+    a_dx, a_dy, b_dx, b_dy, prize_x, prize_y = machine
+    costs = [
+        3 * a + (prize_x - a * a_dx) // b_dx
+        for a in range(max_presses + 1)
+        if (prize_x - a * a_dx) % b_dx == 0
+        and max_presses >= (prize_x - a * a_dx) // b_dx >= 0
+        and a * a_dy + (prize_x - a * a_dx) // b_dx * b_dy == prize_y
+    ]
+    return min(costs, default=0)
+
+
+def _solve_claw_machine(machine: tuple[int, ...], offset: int) -> int:
+    a_dx, a_dy, b_dx, b_dy, prize_x, prize_y = machine
+    prize_x, prize_y = prize_x + offset, prize_y + offset
+    determinant = a_dx * b_dy - a_dy * b_dx
+    if determinant == 0:
+        raise ValueError
+    a, a_remainder = divmod(prize_x * b_dy - prize_y * b_dx, determinant)
+    b, b_remainder = divmod(a_dx * prize_y - a_dy * prize_x, determinant)
+    if a_remainder or b_remainder or a < 0 or b < 0:
+        return 0
+    return 3 * a + b
+
+
+@reference(day=13)
+def _solve_day_13(data: str) -> tuple[int, int]:
+    machines = list(batched(_extract_ints(data), 6, strict=True))
+    return (
+        sum(_get_min_tokens(machine, 100) for machine in machines),
+        sum(_solve_claw_machine(machine, 10_000_000_000_000) for machine in machines),
+    )
+
+
+def _get_spread(positions: list[int]) -> int:
+    return len(positions) * sum(p * p for p in positions) - sum(positions) ** 2
+
+
+@reference(day=14)
+def _solve_day_14(data: str, width: int = 101, height: int = 103) -> tuple[int, int]:
+    robots = list(batched(_extract_ints(data), 4, strict=True))
+
+    def get_xs(step: int) -> list[int]:
+        return [(x + step * dx) % width for x, _, dx, _ in robots]
+
+    def get_ys(step: int) -> list[int]:
+        return [(y + step * dy) % height for _, y, _, dy in robots]
+
+    quadrants = Counter(
+        (x < width // 2, y < height // 2)
+        for x, y in zip(get_xs(100), get_ys(100), strict=True)
+        if x != width // 2 and y != height // 2
+    )
+    safety_factor = prod(
+        quadrants[left, top] for left in (True, False) for top in (True, False)
+    )
+    # The picture is the first step at which the robots are bunched up most along
+    # both axes, each axis being taken where it first bunches up most.
+    tightest_xs = get_xs(min(range(width), key=lambda step: _get_spread(get_xs(step))))
+    tightest_ys = get_ys(min(range(height), key=lambda step: _get_spread(get_ys(step))))
+    for step in range(width * height):
+        if get_xs(step) == tightest_xs and get_ys(step) == tightest_ys:
+            return safety_factor, step
+    raise ValueError
+
+
+def _push(grid: dict[Coord, str], robot: Coord, dxy: Coord) -> Coord:
+    """Move the robot and every box it pushes, if none hits a wall."""
+    moving = [robot]
+    for xy in moving:
+        next_xy = _add(xy, dxy)
+        char = grid.get(next_xy)
+        if char is None:
+            raise ValueError
+        if char == "#":
+            return robot
+        halves = {"O": [next_xy], "[": [next_xy, _add(next_xy, (1, 0))]}.get(char, [])
+        if char == "]":
+            halves = [next_xy, _add(next_xy, (-1, 0))]
+        moving.extend(half for half in halves if half not in moving)
+    chars = {xy: grid[xy] for xy in moving}
+    for xy in moving:
+        grid[xy] = "."
+    for xy in moving:
+        grid[_add(xy, dxy)] = chars[xy]
+    return _add(robot, dxy)
+
+
+def _sum_box_gps(grid_data: str, moves: str) -> int:
+    grid = _read_grid(grid_data)
+    _check_walled(grid)
+    robot = _find(grid, "@")
+    for move in moves:
+        robot = _push(grid, robot, DXYS["^>v<".index(move)])
+    return sum(x + 100 * y for (x, y), char in grid.items() if char in "O[")
+
+
+@reference(day=15)
+def _solve_day_15(data: str) -> tuple[int, int]:
+    grid_data, move_data = data.split("\n\n")
+    moves = move_data.replace("\n", "")
+    wide_grid_data = (
+        grid_data.replace(".", "..")
+        .replace("#", "##")
+        .replace("O", "[]")
+        .replace("@", "@.")
+    )
+    return _sum_box_gps(grid_data, moves), _sum_box_gps(wide_grid_data, moves)
+
+
+type State = tuple[Coord, int]
+
+
+def _get_scores(
+    grid: dict[Coord, str], starts: list[State], *, backwards: bool = False
+) -> dict[State, int]:
+    scores = dict.fromkeys(starts, 0)
+    queue = [(0, state) for state in starts]
+    while queue:
+        score, (xy, direction) = heapq.heappop(queue)
+        if score > scores[xy, direction]:
+            continue
+        step = _add(xy, DXYS[direction], -1 if backwards else 1)
+        next_states = [(xy, (direction + 1) % 4), (xy, (direction + 3) % 4)]
+        next_scores = [score + 1000, score + 1000]
+        if grid[step] != "#":
+            next_states.append((step, direction))
+            next_scores.append(score + 1)
+        for next_state, next_score in zip(next_states, next_scores, strict=True):
+            if next_score < scores.get(next_state, next_score + 1):
+                scores[next_state] = next_score
+                heapq.heappush(queue, (next_score, next_state))
+    return scores
+
+
+@reference(day=16)
+def _solve_day_16(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    _check_walled(grid)
+    start, end = _find(grid, "S"), _find(grid, "E")
+    end_states = [(end, direction) for direction in range(4)]
+    scores = _get_scores(grid, [(start, 1)])
+    best = min(scores[state] for state in end_states if state in scores)
+    scores_to_end = _get_scores(grid, end_states, backwards=True)
+    tiles = {
+        xy
+        for (xy, direction), score in scores.items()
+        if score + scores_to_end.get((xy, direction), best + 1) == best
+    }
+    return best, len(tiles)
+
+
+def _get_combo(operand: int, a: int, b: int, c: int) -> int:
+    # Operand 7 is reserved as a combo operand, but not as a literal one.
+    if operand == 7:  # noqa: PLR2004
+        raise ValueError
+    return (0, 1, 2, 3, a, b, c)[operand]
+
+
+def _execute(opcode: int, operand: int, a: int, b: int, c: int) -> tuple[int, ...]:
+    """Return the registers after an instruction that neither jumps nor outputs."""
+    if opcode == 1:
+        return a, b ^ operand, c
+    if opcode == 4:  # noqa: PLR2004
+        return a, b ^ c, c
+    combo = _get_combo(operand, a, b, c)
+    return (
+        (a >> combo, b, c),
+        (a, b, c),
+        (a, combo % 8, c),
+        (a, b, c),
+        (a, b, c),
+        (a, b, c),
+        (a, a >> combo, c),
+        (a, b, a >> combo),
+    )[opcode]
+
+
+def _run_program(program: list[int], a: int, b: int, c: int) -> list[int]:
+    output: list[int] = []
+    pointer = 0
+    for _ in range(MAX_INSTRUCTIONS):
+        if pointer >= len(program):
+            return output
+        opcode, operand = program[pointer : pointer + 2]
+        pointer += 2
+        if opcode == 3:  # noqa: PLR2004
+            pointer = operand if a else pointer
+        elif opcode == 5:  # noqa: PLR2004
+            output.append(_get_combo(operand, a, b, c) % 8)
+        else:
+            a, b, c = _execute(opcode, operand, a, b, c)
+    raise ValueError
+
+
+def _find_quine(program: list[int], b: int, c: int, a_head: int = 0) -> int | None:
+    """Return the lowest A, from a_head's octal digits, that outputs the program.
+
+    As the program shifts A by one octal digit a loop, each digit added to A adds
+    an output to the front, so digits are added while the outputs end the program.
+    """
+    matched = len(_run_program(program, a_head, b, c)) if a_head else 0
+    if matched == len(program):
+        return a_head
+    for a in range(a_head << 3, (a_head << 3) + 8):
+        if a and _run_program(program, a, b, c) == program[-matched - 1 :]:
+            quine = _find_quine(program, b, c, a)
+            if quine is not None:
+                return quine
+    return None
+
+
+@reference(day=17)
+def _solve_day_17(data: str) -> tuple[str, int]:
+    a, b, c, *program = _extract_ints(data)
+    output = _run_program(program, a, b, c)
+    quine = _find_quine(program, b, c)
+    if quine is None:
+        raise ValueError
+    return ",".join(str(n) for n in output), quine
+
+
+def _find_shortest_path(width: int, height: int, corrupted: set[Coord]) -> int | None:
+    steps = {(0, 0): 0}
+    queue = deque([(0, 0)])
+    while queue:
+        xy = queue.popleft()
+        if xy == (width - 1, height - 1):
+            return steps[xy]
+        for dxy in DXYS:
+            x, y = next_xy = _add(xy, dxy)
+            if (
+                width > x >= 0
+                and height > y >= 0
+                and next_xy not in corrupted
+                and next_xy not in steps
+            ):
+                steps[next_xy] = steps[xy] + 1
+                queue.append(next_xy)
+    return None
+
+
+@reference(day=18)
+def _solve_day_18(
+    data: str, width: int = 71, height: int = 71, byte_count: int = 1024
+) -> tuple[int, str]:
+    xys = [(x, y) for x, y in batched(_extract_ints(data), 2, strict=True)]
+    if (0, 0) in xys[:byte_count]:
+        raise ValueError
+    steps = _find_shortest_path(width, height, set(xys[:byte_count]))
+    if steps is None:
+        raise ValueError
+    for count in range(byte_count + 1, len(xys) + 1):
+        if _find_shortest_path(width, height, set(xys[:count])) is None:
+            x, y = xys[count - 1]
+            return steps, f"{x},{y}"
+    raise ValueError
+
+
+def _count_arrangements(design: str, patterns: list[str]) -> int:
+    # counts[i] is the number of ways to make the first i colours.
+    counts = [1] + [0] * len(design)
+    for i in range(len(design)):
+        for pattern in patterns:
+            if design.startswith(pattern, i):
+                counts[i + len(pattern)] += counts[i]
+    return counts[-1]
+
+
+@reference(day=19)
+def _solve_day_19(data: str) -> tuple[int, int]:
+    pattern_data, design_data = data.split("\n\n")
+    patterns = [pattern for pattern in pattern_data.split(", ") if pattern]
+    designs = design_data.splitlines()
+    if not all(designs):
+        raise ValueError
+    counts = [_count_arrangements(design, patterns) for design in designs]
+    return sum(count > 0 for count in counts), sum(counts)
+
+
+def _follow_track(grid: dict[Coord, str]) -> list[Coord]:
+    track = [_find(grid, "S")]
+    end = _find(grid, "E")
+    while track[-1] != end:
+        next_xys = [
+            next_xy
+            for dxy in DXYS
+            if grid[next_xy := _add(track[-1], dxy)] != "#"
+            and (len(track) == 1 or next_xy != track[-2])
+        ]
+        # The race is on a single track, without branches or dead ends.
+        if len(next_xys) != 1:
+            raise ValueError
+        track.append(next_xys[0])
+    return track
+
+
+def _count_cheats(track: list[Coord], max_cheat: int) -> int:
+    return sum(
+        abs(x2 - x1) + abs(y2 - y1) <= max_cheat
+        and j - i - abs(x2 - x1) - abs(y2 - y1) >= 100  # noqa: PLR2004
+        for (i, (x1, y1)), (j, (x2, y2)) in combinations(enumerate(track), 2)
+    )
+
+
+@reference(day=20)
+def _solve_day_20(data: str) -> tuple[int, int]:
+    grid = _read_grid(data)
+    _check_walled(grid)
+    track = _follow_track(grid)
+    return _count_cheats(track, 2), _count_cheats(track, 20)
@@ -0,0 +1,19 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.cache import CACHE_DIRPATH_ENV
+from advent_of_code.parallel import shutdown_executors
+
+
+@pytest.fixture(autouse=True)
+def _cache_dirpath(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CACHE_DIRPATH_ENV, str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_executors() -> Iterator[None]:
+    # Pools left running would make later tests fork a multi-threaded process.
+    yield
+    shutdown_executors()
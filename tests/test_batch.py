@@ -0,0 +1,58 @@
+import pytest
+
+from advent_of_code.batch import BatchResult, find_inputs, get_chunksize, run_batch
+from advent_of_code.parallel import Backend
+from advent_of_code.runner import Day
+
+
+def test_find_inputs_glob() -> None:
+    assert find_inputs("tests/data/2024_16_*") == [
+        "tests/data/2024_16_1",
+        "tests/data/2024_16_2",
+    ]
+
+
+def test_find_inputs_directory() -> None:
+    filepaths = find_inputs("tests/data")
+    assert "tests/data/2024_01" in filepaths
+    assert filepaths == sorted(filepaths)
+
+
+@pytest.mark.parametrize(
+    argnames=("input_count", "workers", "expected"),
+    argvalues=[
+        pytest.param(1, 4, 1),
+        pytest.param(1000, 4, 62),
+        pytest.param(1000, 1, 250),
+    ],
+)
+def test_get_chunksize(input_count: int, workers: int, expected: int) -> None:
+    assert get_chunksize(input_count, workers) == expected
+
+
+@pytest.mark.parametrize(
+    argnames=("workers", "backend"),
+    argvalues=[(1, None), (2, Backend.PROCESS), (2, Backend.THREAD)],
+)
+def test_run_batch(workers: int, backend: Backend | None) -> None:
+    filepaths = ["tests/data/2024_16_1", "tests/data/2024_16_2"]
+    results = sorted(
+        run_batch(Day(2024, 16), filepaths, workers, backend=backend), key=str
+    )
+    assert [(result.filepath, result.answers) for result in results] == [
+        ("tests/data/2024_16_1", (7036, 45)),
+        ("tests/data/2024_16_2", (11048, 64)),
+    ]
+
+
+def test_run_batch_error() -> None:
+    (result,) = run_batch(Day(2024, 17), ["tests/data/2024_17_2"], 1)
+    assert result.answers is None
+    assert result.error is not None
+    assert result.error.startswith("ValueError")
+
+
+def test_batch_result_to_dict() -> None:
+    result = BatchResult("foo", (1, "2"), 0.5)
+    expected = {"filepath": "foo", "answers": (1, "2"), "seconds": 0.5, "error": None}
+    assert result.to_dict() == expected
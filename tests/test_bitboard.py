@@ -0,0 +1,69 @@
+from advent_of_code.bitboard import (
+    add_counts,
+    flood_fill,
+    get_adjacent,
+    get_mask,
+    iter_bits,
+    iter_levels,
+    shift,
+    sum_counts,
+)
+from advent_of_code.grid import Grid
+
+# Two rooms joined by a door, and one shut off.
+GRID = Grid.from_str("..#.\n.##.\n..#.\n###.")
+OPEN = get_mask(GRID.cells, ord("."))
+
+
+def _board(grid: Grid, *coords: tuple[int, int]) -> int:
+    return sum(1 << grid.index(x, y) for x, y in coords)
+
+
+def test_get_mask() -> None:
+    assert set(iter_bits(OPEN)) == set(GRID.find_all(ord(".")))
+    walls = get_mask(GRID.cells, ord("#"))
+    assert get_mask(GRID.cells, ord("."), ord("#")) == OPEN | walls
+    assert not OPEN & walls
+
+
+def test_shift() -> None:
+    assert shift(0b100, 2) == 0b10000
+    assert shift(0b100, -2) == 0b1
+
+
+def test_get_adjacent() -> None:
+    board = _board(GRID, (0, 0))
+    assert get_adjacent(board, GRID.stride) & OPEN == _board(GRID, (1, 0), (0, 1))
+
+
+def test_iter_levels() -> None:
+    levels = list(iter_levels(_board(GRID, (0, 0)), OPEN, GRID.stride))
+    assert levels == [
+        _board(GRID, (0, 0)),
+        _board(GRID, (1, 0), (0, 1)),
+        _board(GRID, (0, 2)),
+        _board(GRID, (1, 2)),
+    ]
+
+
+def test_flood_fill() -> None:
+    assert flood_fill(_board(GRID, (3, 0)), OPEN, GRID.stride) == _board(
+        GRID, (3, 0), (3, 1), (3, 2), (3, 3)
+    )
+    assert flood_fill(0, OPEN, GRID.stride) == 0
+
+
+def test_iter_bits() -> None:
+    assert list(iter_bits(0b10110)) == [1, 2, 4]
+    assert list(iter_bits(0)) == []
+
+
+def test_add_counts() -> None:
+    # Cells 0 to 3 count 1, 2, 3 and 0, then 3, 2, 1 and 1.
+    counts = add_counts([0b0101, 0b0110], [0b1101, 0b0011])
+    assert [
+        sum((board >> i & 1) << n for n, board in enumerate(counts)) for i in range(4)
+    ] == [4, 4, 4, 1]
+    assert sum_counts(counts) == 13
+    assert sum_counts(counts, 0b0011) == 8
+    assert add_counts([], [0b1]) == [0b1]
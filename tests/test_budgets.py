@@ -0,0 +1,65 @@
+import pytest
+
+from advent_of_code.budgets import (
+    BUDGETS,
+    MIB,
+    Budget,
+    ImportTime,
+    Measurement,
+    calibrate,
+    can_measure,
+    check_budget,
+    check_startup,
+    measure,
+    measure_import_times,
+    measure_startup,
+)
+from advent_of_code.runner import Day
+from advent_of_code.year_2024.generators import GENERATORS
+
+PARSE_KWARGS = {"width": 7, "height": 7, "byte_count": 12}
+
+
+def test_budgets_cover_every_part() -> None:
+    assert set(BUDGETS) == {(2024, day, part) for day in GENERATORS for part in (1, 2)}
+
+
+def test_calibrate() -> None:
+    assert calibrate(rounds=1) > 0
+
+
+@pytest.mark.skipif(not can_measure(), reason="needs resource")
+def test_measure() -> None:
+    measurement = measure(Day(2024, 18), 1, "tests/data/2024_18", PARSE_KWARGS)
+    assert measurement.seconds > 0
+    assert measurement.peak_size >= 0
+
+
+def test_check_budget() -> None:
+    assert BUDGETS[2024, 1, 1] == Budget(0.1, 16 * MIB)
+    assert check_budget((2024, 1, 1), Measurement(0.1, 16 * MIB), 1) is None
+    assert check_budget((2024, 1, 1), Measurement(0.3, 20 * MIB), 2) == (
+        "2024 day 01 part 1 took 0.300s, over its 0.200s limit (0.1s budget x 2.00 "
+        "machine factor) and peaked at 20,971,520 B, over its 16,777,216 B limit"
+    )
+
+
+def test_measure_startup() -> None:
+    assert measure_startup("-c", "pass", rounds=1) > 0
+
+
+def test_measure_import_times() -> None:
+    import_times = measure_import_times("-c", "import json")
+    json_time = next(time for time in import_times if time.module == "json")
+    assert 0 < json_time.seconds <= json_time.cumulative_seconds
+    assert import_times[0].seconds >= import_times[-1].seconds
+
+
+def test_check_startup() -> None:
+    import_times = [ImportTime("json", 0.002, 0.0025), ImportTime("re", 0.001, 0.004)]
+    assert check_startup(0.05, 0.05, 1, import_times) is None
+    assert check_startup(0.12, 0.05, 2, import_times, top=1) == (
+        "startup took 0.120s, over its 0.100s limit (0.05s budget x 2.00 machine "
+        "factor); slowest imports:\n"
+        "      2.0 ms     2.5 ms cumulative  json"
+    )
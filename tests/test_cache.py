@@ -0,0 +1,151 @@
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.cache import (
+    CACHE_DIRPATH_ENV,
+    PARSE_CACHE_ENV,
+    AnswerStore,
+    _find_package_imports,
+    cached_parse,
+    file_digest,
+    module_digest,
+)
+from advent_of_code.year_2024 import day_06
+
+calls: list[str] = []
+
+
+@cached_parse
+def _parse(filepath: str, scale: int = 1) -> list[int]:
+    calls.append(filepath)
+    return [int(n) * scale for n in Path(filepath).read_text().split()]
+
+
+@pytest.fixture
+def cache_dirpath(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    calls.clear()
+    monkeypatch.setenv(CACHE_DIRPATH_ENV, str(tmp_path / "cache"))
+    monkeypatch.setenv(PARSE_CACHE_ENV, "1")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def input_filepath(tmp_path: Path) -> str:
+    filepath = tmp_path / "input"
+    filepath.write_text("1 2 3")
+    return str(filepath)
+
+
+def _get_entries(cache_dirpath: Path) -> list[Path]:
+    return list(cache_dirpath.glob("parsed/*/*.pickle"))
+
+
+def test_file_digest(input_filepath: str) -> None:
+    assert file_digest(input_filepath) == file_digest(Path(input_filepath))
+    assert len(file_digest(input_filepath)) == 64
+
+
+def test_cached_parse_disabled(
+    input_filepath: str, cache_dirpath: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(PARSE_CACHE_ENV)
+    assert _parse(input_filepath) == [1, 2, 3]
+    assert _parse(input_filepath) == [1, 2, 3]
+    assert len(calls) == 2
+    assert not cache_dirpath.exists()
+
+
+def test_cached_parse_hit(input_filepath: str, cache_dirpath: Path) -> None:
+    assert _parse(input_filepath) == [1, 2, 3]
+    assert _parse(input_filepath) == [1, 2, 3]
+    assert len(calls) == 1
+    assert len(_get_entries(cache_dirpath)) == 1
+
+
+def test_cached_parse_arguments(input_filepath: str, cache_dirpath: Path) -> None:
+    assert _parse(input_filepath) == [1, 2, 3]
+    assert _parse(input_filepath, scale=2) == [2, 4, 6]
+    assert len(calls) == 2
+    assert len(_get_entries(cache_dirpath)) == 2
+
+
+def test_cached_parse_evicts_stale_input(
+    input_filepath: str, cache_dirpath: Path
+) -> None:
+    _parse(input_filepath)
+    (entry,) = _get_entries(cache_dirpath)
+    Path(input_filepath).write_text("4 5")
+    assert _parse(input_filepath) == [4, 5]
+    assert len(calls) == 2
+    assert entry not in _get_entries(cache_dirpath)
+    assert len(_get_entries(cache_dirpath)) == 1
+
+
+def test_cached_parse_evicts_stale_source(
+    input_filepath: str, cache_dirpath: Path
+) -> None:
+    _parse(input_filepath)
+    (entry,) = _get_entries(cache_dirpath)
+    call, input_, _ = entry.stem.split("-")
+    stale_entry = entry.with_name(f"{call}0-{input_}-{'0' * 64}.pickle")
+    entry.rename(stale_entry)
+    _parse(input_filepath)
+    assert len(calls) == 2
+    assert _get_entries(cache_dirpath) == [entry]
+
+
+@pytest.mark.usefixtures("cache_dirpath")
+def test_cached_parse_day() -> None:
+    expected = day_06.parse("tests/data/2024_06")
+    actual = day_06.parse("tests/data/2024_06")
+    assert actual.grid == expected.grid
+    assert actual.start == expected.start
+
+
+def test_module_digest() -> None:
+    digest = module_digest("advent_of_code.year_2024.day_01")
+    assert digest == module_digest("advent_of_code.year_2024.day_01")
+    assert digest != module_digest("advent_of_code.year_2024.day_02")
+
+
+def test_find_package_imports() -> None:
+    filepath = Path("advent_of_code/year_2024/day_01.py")
+    imports = _find_package_imports(filepath)
+    assert "advent_of_code.utils" in imports
+    assert "advent_of_code.cache" in imports
+    assert not any(name.startswith("itertools") for name in imports)
+
+
+class TestAnswerStore:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> Iterator[AnswerStore]:
+        store = AnswerStore(tmp_path / "answers.sqlite3", max_size=2)
+        yield store
+        store.close()
+
+    def test_get_missing(self, store: AnswerStore) -> None:
+        assert store.get("foo") is None
+
+    @pytest.mark.parametrize("answer", [0, 123, "6,1"])
+    def test_set(self, store: AnswerStore, answer: int | str) -> None:
+        store.set("foo", answer)
+        assert store.get("foo") == answer
+
+    def test_persistence(self, store: AnswerStore) -> None:
+        store.set("foo", 1)
+        store.close()
+        with closing(AnswerStore(store.filepath)) as reopened_store:
+            assert reopened_store.get("foo") == 1
+
+    def test_eviction(self, store: AnswerStore) -> None:
+        store.set("foo", 1)
+        store.set("bar", 2)
+        store.get("foo")
+        store.set("baz", 3)
+        assert len(store) == 2
+        assert store.get("bar") is None
+        assert store.get("foo") == 1
+        assert store.get("baz") == 3
@@ -0,0 +1,190 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.cache import CACHE_DIRPATH_ENV, PARSE_CACHE_ENV
+from advent_of_code.cli import main
+from advent_of_code.year_2024 import day_01
+
+
+def test_run_json(capsys: pytest.CaptureFixture[str]) -> None:
+    main(
+        [
+            "run",
+            "2024",
+            "1",
+            "--input",
+            "tests/data/2024_01",
+            "--workers",
+            "1",
+            "--json",
+        ]
+    )
+    report = json.loads(capsys.readouterr().out)
+    assert [(part["part"], part["answer"]) for part in report["parts"]] == [
+        (1, 11),
+        (2, 31),
+    ]
+    assert report["seconds"] >= 0
+
+
+def test_run_table(capsys: pytest.CaptureFixture[str]) -> None:
+    main(
+        [
+            "run",
+            "2024",
+            "2",
+            "--part",
+            "1",
+            "--data-dir",
+            "tests/data",
+            "--workers",
+            "1",
+        ]
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("2024 day 02 part 1:")
+    assert lines[0].split()[5] == "2"
+    assert lines[1].startswith("Total:")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        pytest.param(["run", "1999"], id="unknown year"),
+        pytest.param(["run", "2024", "26"], id="unknown day"),
+        pytest.param(["run", "2024", "--input", "foo"], id="input for many days"),
+    ],
+)
+def test_run_invalid(argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(argv)
+
+
+def test_run_parse_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv(CACHE_DIRPATH_ENV, str(tmp_path))
+    monkeypatch.setenv(PARSE_CACHE_ENV, "0")
+    argv = ["run", "2024", "1", "--input", "tests/data/2024_01", "--workers", "1"]
+    main([*argv, "--parse-cache"])
+    assert list(tmp_path.glob("parsed/*/*.pickle"))
+    assert capsys.readouterr().out.splitlines()[0].split()[5] == "11"
+
+
+def test_run_answer_store(capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["run", "2024", "1", "--input", "tests/data/2024_01", "--workers", "1"]
+    main(argv)
+    assert "(cached)" not in capsys.readouterr().out
+    main(argv)
+    assert capsys.readouterr().out.count("(cached)") == 2
+    main([*argv, "--no-cache"])
+    assert "(cached)" not in capsys.readouterr().out
+
+
+def test_run_profile(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["run", "2024", "1", "--input", "tests/data/2024_01", "--workers", "1"]
+    main([*argv, "--profile", str(tmp_path), "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert all(len(part["profiles"]) == 2 for part in report["parts"])
+    assert len(list(tmp_path.glob("*.pstats"))) == 4
+
+
+def test_run_memory(capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["run", "2024", "1", "--input", "tests/data/2024_01", "--workers", "1"]
+    main([*argv, "--part", "1", "--memory", "--memory-top", "2"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].startswith("  peak memory:")
+
+
+def test_run_counters(capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["run", "2024", "7", "--input", "tests/data/2024_07", "--workers", "1"]
+    main([*argv, "--counters", "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert [part["counters"] for part in report["parts"]] == [
+        {"day_07.combinations": 35},
+        {"day_07.combinations": 74},
+    ]
+
+
+def test_run_trace(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    filepath = tmp_path / "trace.json"
+    argv = ["run", "2024", "16", "--input", "tests/data/2024_16_1", "--workers", "1"]
+    main([*argv, "--trace", str(filepath), "--json"])
+    report = json.loads(capsys.readouterr().out)
+    trace = json.loads(filepath.read_text())
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in events] == [
+        span["name"] for part in report["parts"] for span in part["spans"]
+    ]
+    assert {"2024 day 16 part 1", "2024 day 16 part 2"} <= {
+        event["name"] for event in events
+    }
+
+
+def test_batch(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["batch", "2024", "16", "tests/data/2024_16_*", "--workers", "1"])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result["answers"] for result in results] == [[7036, 45], [11048, 64]]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        pytest.param(["batch", "2024", "26", "tests/data"], id="unknown day"),
+        pytest.param(["batch", "2024", "16", "tests/data/foo*"], id="no inputs"),
+    ],
+)
+def test_batch_invalid(argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(argv)
+
+
+def test_stress(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["stress", "2024", "1", "2", "--seeds", "2", "--scale", "0.01"])
+    assert capsys.readouterr().out == ""
+
+
+def test_stress_mismatch(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(day_01, "solve_part1", lambda _: -1)
+    with pytest.raises(SystemExit, match="1"):
+        main(["stress", "2024", "1", "--seeds", "1", "--scale", "0.01"])
+    mismatches = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [mismatch["actual"][0] for mismatch in mismatches] == [-1]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        pytest.param(["stress", "1999"], id="unknown year"),
+        pytest.param(["stress", "2024", "26"], id="unknown day"),
+    ],
+)
+def test_stress_invalid(argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(argv)
+
+
+@pytest.mark.parametrize(
+    argnames=("argv", "expected"),
+    argvalues=[
+        (["--port", "0"], 0),
+        (["--port", "8000"], 8000),
+        (["--socket", "daemon.sock"], "daemon.sock"),
+    ],
+)
+def test_serve_address(
+    monkeypatch: pytest.MonkeyPatch, argv: list[str], expected: str | int
+) -> None:
+    addresses = []
+    monkeypatch.setattr(
+        "advent_of_code.daemon.run_daemon",
+        lambda address, _: addresses.append(address),
+    )
+    main(["serve", *argv])
+    assert addresses == [expected]
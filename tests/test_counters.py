@@ -0,0 +1,20 @@
+from advent_of_code.counters import Counters
+
+
+def test_counters_disabled() -> None:
+    counters = Counters()
+    counters.increment("events")
+    assert not counters.enabled
+    assert counters.counts is None
+
+
+def test_counters_collect() -> None:
+    counters = Counters()
+    with counters.collect() as outer_counts:
+        counters.increment("events")
+        with counters.collect() as inner_counts:
+            counters.increment("events", 2)
+        counters.increment("other")
+    assert not counters.enabled
+    assert outer_counts == {"events": 1, "other": 1}
+    assert inner_counts == {"events": 2}
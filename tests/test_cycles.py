@@ -0,0 +1,56 @@
+import pytest
+
+from advent_of_code.cycles import (
+    Cycle,
+    combine_periods,
+    find_cycle,
+    find_cycle_length,
+)
+
+
+def _step_mod(state: int) -> int:
+    # 0, 1, 2, 3, 4, 5, 6, then 3 again.
+    return 3 if state == 6 else state + 1
+
+
+def _step_until(state: int) -> int | None:
+    return None if state == 100 else state + 1
+
+
+def test_find_cycle_length() -> None:
+    assert find_cycle_length(0, _step_mod) == 4
+    assert find_cycle_length(0, _step_until) is None
+
+
+@pytest.mark.parametrize(
+    argnames=("state", "expected"),
+    argvalues=[
+        pytest.param(0, Cycle(3, 4)),
+        pytest.param(4, Cycle(0, 4)),
+        pytest.param(6, Cycle(0, 4)),
+    ],
+)
+def test_find_cycle(state: int, expected: Cycle) -> None:
+    assert find_cycle(state, _step_mod) == expected
+
+
+def test_find_cycle_self_loop() -> None:
+    assert find_cycle(5, lambda _: 7) == Cycle(1, 1)
+    assert find_cycle(0, _step_until) is None
+
+
+@pytest.mark.parametrize(
+    argnames=("periods", "expected"),
+    argvalues=[
+        pytest.param([], (0, 1)),
+        pytest.param([(5, 7)], (5, 7)),
+        pytest.param([(2, 3), (3, 5), (2, 7)], (23, 105)),
+        pytest.param([(1, 4), (3, 6)], (9, 12)),
+        pytest.param([(1, 4), (2, 6)], None),
+        pytest.param([(6312 % 101, 101), (6312 % 103, 103)], (6312, 10403)),
+    ],
+)
+def test_combine_periods(
+    periods: list[tuple[int, int]], expected: tuple[int, int] | None
+) -> None:
+    assert combine_periods(periods) == expected
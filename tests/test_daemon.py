@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.daemon import (
+    DaemonMetrics,
+    SolverDaemon,
+    create_executor,
+    get_metrics,
+    get_server_address,
+    solve_remote,
+)
+from advent_of_code.runner import Day
+
+
+async def _serve_and_request(
+    tmp_path: Path, requests: list[tuple[Day, int, bytes]]
+) -> tuple[list[dict[str, object]], dict[str, object]]:
+    address = str(tmp_path / "daemon.sock")
+    with create_executor(1) as executor:
+        daemon = SolverDaemon(executor, tmp_path)
+        async with await daemon.start(address):
+            responses = [
+                await asyncio.to_thread(solve_remote, address, day, part, data)
+                for day, part, data in requests
+            ]
+            metrics = await asyncio.to_thread(get_metrics, address)
+    return responses, metrics
+
+
+def test_solver_daemon(tmp_path: Path) -> None:
+    data = Path("tests/data/2024_01").read_bytes()
+    responses, metrics = asyncio.run(
+        _serve_and_request(
+            tmp_path,
+            [
+                (Day(2024, 1), 1, data),
+                (Day(2024, 1), 2, data),
+                (Day(2024, 1), 3, data),
+                (Day(2024, 17), 2, b"Register A: 1"),
+            ],
+        )
+    )
+    assert [response.get("answer") for response in responses] == [11, 31, None, None]
+    assert responses[2] == {"error": "no solution found for 2024 day 01 part 3"}
+    assert str(responses[3]["error"]).startswith("ValueError")
+    assert metrics["requests"] == 2
+    assert metrics["errors"] == 2
+    assert metrics["in_flight"] == 0
+    assert metrics["day_requests"] == {"2024 day 01": 2}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_solver_daemon_free_port(tmp_path: Path) -> None:
+    data = Path("tests/data/2024_01").read_bytes()
+
+    async def solve_on_free_port() -> dict[str, object]:
+        with create_executor(1) as executor:
+            daemon = SolverDaemon(executor, tmp_path)
+            async with await daemon.start(0) as server:
+                port = get_server_address(server)
+                assert isinstance(port, int)
+                assert port > 0
+                return await asyncio.to_thread(
+                    solve_remote, port, Day(2024, 1), 1, data
+                )
+
+    assert asyncio.run(solve_on_free_port())["answer"] == 11
+
+
+def test_solver_daemon_invalid_request(tmp_path: Path) -> None:
+    async def send_invalid_request() -> bytes:
+        address = str(tmp_path / "daemon.sock")
+        with create_executor(1) as executor:
+            daemon = SolverDaemon(executor, tmp_path)
+            async with await daemon.start(address):
+                reader, writer = await asyncio.open_unix_connection(address)
+                writer.write(b"not json\n")
+                response = await reader.read()
+                writer.close()
+        return response
+
+    assert asyncio.run(send_invalid_request()) == b'{"error": "invalid request"}\n'
+
+
+def test_daemon_metrics() -> None:
+    metrics = DaemonMetrics()
+    metrics.record(Day(2024, 1), 0.5, 1.0)
+    metrics.record(Day(2024, 1), 0.1, 2.0)
+    report = metrics.to_dict()
+    assert report["requests"] == 2
+    assert report["mean_queue_seconds"] == pytest.approx(0.3)
+    assert report["max_queue_seconds"] == pytest.approx(0.5)
+    assert report["mean_solve_seconds"] == pytest.approx(1.5)
+    assert report["day_requests"] == {"2024 day 01": 2}
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.differential import (
+    Mismatch,
+    check_seed,
+    compare,
+    get_failure_kind,
+    get_reference_days,
+    run_differential,
+    shrink,
+    solve_text,
+)
+from advent_of_code.runner import Day
+from advent_of_code.year_2024 import day_01
+
+
+@pytest.mark.parametrize(
+    argnames=("data", "expected"),
+    argvalues=[
+        pytest.param("1\n2\n3\n4\n5", "3", id="lines"),
+        pytest.param("...\n.3.\n...", "3", id="columns"),
+        pytest.param("1 2 3,4\n\n5 6", "3", id="tokens"),
+        pytest.param("3 1\n\n2 3", "3\n\n3", id="paragraphs"),
+    ],
+)
+def test_shrink(data: str, expected: str) -> None:
+    assert shrink(data, lambda data: data.count("3") == expected.count("3")) == (
+        expected
+    )
+
+
+def test_shrink_keeps_passing_input() -> None:
+    assert shrink("1\n2", lambda data: data == "1\n2") == "1\n2"
+
+
+def test_get_failure_kind() -> None:
+    assert get_failure_kind((1, 2), (1, 3)) == (2,)
+    assert get_failure_kind((1, 2), (0, 0)) == (1, 2)
+    assert get_failure_kind((1, 2), "ValueError") == "ValueError"
+
+
+def test_solve_text() -> None:
+    data = Path("tests/data/2024_01").read_text()
+    assert solve_text(Day(2024, 1), data, {}) == (11, 31)
+    assert solve_text(Day(2024, 1), "1 2 3", {}) == "ValueError"
+
+
+def test_compare() -> None:
+    data = Path("tests/data/2024_01").read_text()
+    assert compare(Day(2024, 1), data, {}) is None
+    # The reference rejects a list with no partner, so the day cannot be wrong.
+    assert compare(Day(2024, 1), "1 2 3", {}) is None
+
+
+def test_check_seed_shrinks_mismatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(day_01, "solve_part2", lambda _: 0)
+    mismatch = check_seed(Day(2024, 1), seed=0, scale=0.01)
+    assert mismatch is not None
+    assert (mismatch.day, mismatch.seed, mismatch.scale) == (1, 0, 0.01)
+    # A left number must also be on the right, which it never is on one line.
+    assert len(mismatch.data.splitlines()) == 2
+    assert mismatch.expected[1] != 0
+    assert mismatch.actual == (mismatch.expected[0], 0)
+    assert mismatch.to_dict()["actual"] == mismatch.actual
+
+
+def test_run_differential(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(day_01, "solve_part1", lambda _: -1)
+    mismatches = list(run_differential([Day(2024, 1), Day(2024, 2)], range(2), 0.01))
+    assert [mismatch.seed for mismatch in mismatches] == [0, 1]
+    assert all(isinstance(mismatch, Mismatch) for mismatch in mismatches)
+    assert {mismatch.actual[0] for mismatch in mismatches} == {-1}
+
+
+def test_get_reference_days() -> None:
+    assert get_reference_days(2024) == [Day(2024, day) for day in range(1, 21)]
+    assert get_reference_days(1999) == []
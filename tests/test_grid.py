@@ -0,0 +1,51 @@
+import pytest
+
+from advent_of_code.grid import BORDER, Grid
+
+DATA = "ab\ncd\nef\n"
+
+
+@pytest.fixture
+def grid() -> Grid:
+    return Grid.from_str(DATA)
+
+
+def test_from_str(grid: Grid) -> None:
+    assert (grid.width, grid.height) == (2, 3)
+    assert str(grid) == DATA.rstrip("\n")
+
+
+def test_from_bytes(grid: Grid) -> None:
+    assert Grid.from_bytes(memoryview(DATA.encode())) == grid
+    assert Grid.from_bytes(b"").cells == bytearray(4)
+
+
+@pytest.mark.parametrize(("x", "y"), [(0, 0), (1, 0), (0, 2), (1, 2)])
+def test_index_coords(grid: Grid, x: int, y: int) -> None:
+    assert grid.coords(grid.index(x, y)) == (x, y)
+    assert grid[grid.index(x, y)] == ord(DATA.split("\n")[y][x])
+
+
+def test_neighbours_of_edges_are_border(grid: Grid) -> None:
+    for i in (grid.index(0, 0), grid.index(1, 2)):
+        neighbours = [i + offset for offset in grid.offsets + grid.diagonal_offsets]
+        assert any(grid[j] == BORDER for j in neighbours)
+        assert all(0 <= j < len(grid.cells) for j in neighbours)
+
+
+def test_find(grid: Grid) -> None:
+    assert grid.coords(grid.find(ord("d"))) == (1, 1)
+    assert grid.find_all(ord("z")) == []
+
+
+def test_filled() -> None:
+    grid = Grid.filled(3, 2, ord("."))
+    assert str(grid) == "...\n..."
+    assert list(grid.indices()) == grid.find_all(ord("."))
+
+
+def test_copy(grid: Grid) -> None:
+    copy = grid.copy()
+    assert copy == grid
+    copy[copy.index(0, 0)] = ord("z")
+    assert copy != grid
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from advent_of_code import inputs
+from advent_of_code.inputs import (
+    extract_int_lines,
+    extract_ints,
+    extract_records,
+    map_bytes,
+    strip_newlines,
+)
+
+
+def test_map_bytes(tmp_path: Path) -> None:
+    filepath = tmp_path / "input"
+    filepath.write_bytes(b"ab\ncd\n")
+    view = map_bytes(str(filepath))
+    assert view.readonly
+    assert bytes(view) == b"ab\ncd\n"
+    filepath.write_bytes(b"")
+    assert bytes(map_bytes(str(filepath))) == b""
+
+
+def test_strip_newlines() -> None:
+    assert bytes(strip_newlines(b"ab\ncd\n\n")) == b"ab\ncd"
+    assert bytes(strip_newlines(b"\n")) == b""
+
+
+def test_extract_ints() -> None:
+    assert extract_ints(b"p=0,4 v=3,-3\n").tolist() == [0, 4, 3, -3]
+    assert extract_ints(b"Button A: X+94, Y+34").tolist() == [94, 34]
+    assert extract_ints(b"no numbers").tolist() == []
+
+
+def test_extract_ints_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inputs, "CHUNK_SIZE", 4)
+    data = b"12 345 -6789\n1\n\n23 4\n"
+    assert extract_ints(data).tolist() == [12, 345, -6789, 1, 23, 4]
+    assert extract_int_lines(data) == [[12, 345, -6789], [1], [23, 4]]
+
+
+def test_extract_ints_stray_minus() -> None:
+    assert extract_ints(b"- 1-2 --3 -").tolist() == [1, -2, -3]
+
+
+def test_extract_records() -> None:
+    assert list(extract_records(b"1,2\n3,4\n", 2)) == [(1, 2), (3, 4)]
+    with pytest.raises(ValueError, match="incomplete batch"):
+        list(extract_records(b"1,2,3", 2))
+
+
+def test_extract_int_lines() -> None:
+    assert extract_int_lines(b"7 6 4\n\n1 -2\n") == [[7, 6, 4], [1, -2]]
+    assert extract_int_lines(b"1 - 2: 99999999999999999999") == [
+        [1, 2, 99999999999999999999]
+    ]
+
+
+def test_extract_ints_overflow() -> None:
+    with pytest.raises(OverflowError):
+        extract_ints(b"99999999999999999999")
@@ -0,0 +1,91 @@
+import json
+import sys
+from types import ModuleType
+
+import pytest
+
+from advent_of_code.budgets import measure_import_times
+from advent_of_code.lazy import (
+    LazyPattern,
+    is_installed,
+    is_loaded,
+    lazy_import,
+    optional_import,
+)
+
+
+def test_lazy_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = lazy_import("colorsys")
+    assert type(colorsys) is not ModuleType
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert type(colorsys) is ModuleType
+    assert lazy_import("colorsys") is colorsys
+
+
+def test_lazy_import_submodule(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+    monkeypatch.delattr(json, "tool", raising=False)
+    tool = lazy_import("json.tool")
+    assert vars(json)["tool"] is tool
+
+
+def test_lazy_import_submodule_of_unimported_package(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delitem(sys.modules, "xmlrpc", raising=False)
+    monkeypatch.delitem(sys.modules, "xmlrpc.client", raising=False)
+    client = lazy_import("xmlrpc.client")
+    assert "xmlrpc" not in sys.modules
+    assert client.escape("<") == "&lt;"
+    assert "xmlrpc.client" in sys.modules
+
+
+def test_lazy_import_missing() -> None:
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("advent_of_code.missing")
+
+
+def test_optional_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = optional_import("colorsys")
+    assert is_installed(colorsys)
+    assert not is_loaded(colorsys)
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert is_loaded(colorsys)
+
+
+def test_optional_import_missing() -> None:
+    missing = optional_import("advent_of_code.missing")
+    assert not is_installed(missing)
+    assert not is_loaded(missing)
+    with pytest.raises(ModuleNotFoundError):
+        _ = missing.anything
+
+
+def test_lazy_pattern() -> None:
+    pattern = LazyPattern(r"([0-9]+)")
+    assert "compiled" not in vars(pattern)
+    assert pattern.compiled.findall("1 22") == ["1", "22"]
+    assert pattern.compiled is pattern.compiled
+
+
+def test_day_imports_are_lazy() -> None:
+    import_times = measure_import_times("-c", "import advent_of_code.year_2024.day_13")
+    modules = {import_time.module for import_time in import_times}
+    assert "advent_of_code.year_2024.day_13" in modules
+    assert not modules & {"pickle", "sqlite3", "tempfile", "concurrent.futures"}
+
+
+def test_numpy_day_imports_are_lazy() -> None:
+    import_times = measure_import_times("-c", "import advent_of_code.year_2024.day_14")
+    modules = {import_time.module for import_time in import_times}
+    assert "advent_of_code.vector" in modules
+    assert "numpy" not in modules
+
+
+def test_parallel_day_imports_are_lazy() -> None:
+    import_times = measure_import_times("-c", "import advent_of_code.year_2024.day_20")
+    modules = {import_time.module for import_time in import_times}
+    assert "advent_of_code.parallel" in modules
+    assert not modules & {"multiprocessing", "concurrent.futures"}
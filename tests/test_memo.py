@@ -0,0 +1,121 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from advent_of_code.cache import cached_parse
+from advent_of_code.memo import (
+    ENTRY_OVERHEAD,
+    Memo,
+    MemoInfo,
+    Scope,
+    clear_memos,
+    memo_scope,
+    memoize,
+)
+
+
+def _double(n: int) -> int:
+    return n * 2
+
+
+@pytest.mark.parametrize("max_bytes", [None, 1 << 20])
+def test_memoize_evicts_least_recently_used(max_bytes: int | None) -> None:
+    calls = []
+
+    @memoize(max_size=2, max_bytes=max_bytes)
+    def double(n: int) -> int:
+        calls.append(n)
+        return n * 2
+
+    assert [double(n) for n in [1, 2, 1, 3, 1, 2]] == [2, 4, 2, 6, 2, 4]
+    assert calls == [1, 2, 3, 2]
+    assert double.memo.info() == MemoInfo(hits=2, misses=4, evictions=2, size=2)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 1 << 20])
+def test_memoize_counts_evictions_across_clears(max_bytes: int | None) -> None:
+    double = memoize(max_size=1, max_bytes=max_bytes)(_double)
+    double(1)
+    double(2)
+    double.memo.clear()
+    double(1)
+    double(2)
+    assert double.memo.info() == MemoInfo(hits=0, misses=4, evictions=2, size=1)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 1 << 20])
+def test_memoize_errors_are_not_evictions(max_bytes: int | None) -> None:
+    @memoize(max_size=1, max_bytes=max_bytes)
+    def invert(n: int) -> float:
+        return 1 / n
+
+    invert(1)
+    with pytest.raises(ZeroDivisionError):
+        invert(0)
+    assert invert.memo.info() == MemoInfo(hits=0, misses=2, evictions=0, size=1)
+
+
+def test_memoize_threads() -> None:
+    double = memoize(max_size=8, max_bytes=1 << 20)(_double)
+    numbers = [n % 16 for n in range(10_000)]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(double, numbers)) == [n * 2 for n in numbers]
+    info = double.memo.info()
+    assert info.hits + info.misses == len(numbers)
+    assert info.size == 8
+
+
+def test_memo_is_abstract() -> None:
+    with pytest.raises(TypeError, match="abstract"):
+        Memo(None, None, Scope.GLOBAL)  # type: ignore[abstract]
+
+
+def test_memoize_max_bytes() -> None:
+    entry_size = sys.getsizeof((1,)) + sys.getsizeof(2) + ENTRY_OVERHEAD
+    double = memoize(max_bytes=3 * entry_size)(_double)
+    for n in range(1, 6):
+        double(n)
+    assert double.memo.info() == MemoInfo(hits=0, misses=5, evictions=2, size=3)
+    double(5)
+    double(1)
+    assert double.memo.info() == MemoInfo(hits=1, misses=6, evictions=3, size=3)
+
+
+def test_memoize_keyword_arguments() -> None:
+    @memoize(max_bytes=1 << 20)
+    def subtract(a: int, b: int) -> int:
+        return a - b
+
+    assert subtract(3, b=1) == 2
+    assert subtract(3, b=1) == 2
+    assert subtract(3, 1) == 2
+    assert subtract.memo.info() == MemoInfo(hits=1, misses=2, evictions=0, size=2)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 1 << 20])
+def test_clear_memos(max_bytes: int | None) -> None:
+    memos = {
+        scope: memoize(max_bytes=max_bytes, scope=scope)(_double) for scope in Scope
+    }
+    for memoized in memos.values():
+        memoized(1)
+    clear_memos(Scope.RUN)
+    assert [memoized.memo.info().size for memoized in memos.values()] == [0, 0, 1]
+    assert [memoized.memo.info().misses for memoized in memos.values()] == [1, 1, 1]
+    assert [memoized.memo.info().evictions for memoized in memos.values()] == [0, 0, 0]
+
+
+def test_memo_scope() -> None:
+    double = memoize(scope=Scope.RUN)(_double)
+    with memo_scope(Scope.RUN):
+        double(1)
+        assert double.memo.info().size == 1
+    assert double.memo.info().size == 0
+
+
+def test_parse_clears_input_memos() -> None:
+    double = memoize(scope=Scope.INPUT)(_double)
+    double(1)
+    cached_parse(str)("input")
+    assert double.memo.info().size == 0
@@ -0,0 +1,19 @@
+import tracemalloc
+
+from advent_of_code.memory import MemoryTracer
+
+
+class Node:
+    pass
+
+
+def test_memory_tracer() -> None:
+    with MemoryTracer() as tracer:
+        nodes = [Node() for _ in range(1000)]
+        report = tracer.report(top=2)
+    assert not tracemalloc.is_tracing()
+    assert report.peak_size > 0
+    assert len(report.allocations) == 2
+    assert "test_memory.py" in report.allocations[0].location
+    assert report.object_counts["Node"] == len(nodes)
+    assert report.to_dict()["peak_size"] == report.peak_size
@@ -0,0 +1,140 @@
+import os
+import threading
+from array import array
+from collections.abc import Sequence
+
+import pytest
+
+from advent_of_code.counters import counters
+from advent_of_code.parallel import (
+    PARALLEL_BACKEND_ENV,
+    PARALLEL_WORKERS_ENV,
+    Backend,
+    get_backend,
+    get_chunks,
+    get_workers,
+    is_free_threaded,
+    limited_workers,
+    parallel_map,
+)
+from advent_of_code.spans import spans
+
+
+def _weigh(i: int, weights: Sequence[int], offset: int) -> int:
+    counters.increment("weighed")
+    return weights[i] + offset
+
+
+def _get_workers(_: int) -> int:
+    return get_workers()
+
+
+def _get_worker_id(_: int) -> tuple[int, int]:
+    return os.getpid(), threading.get_ident()
+
+
+def _is_readonly(_: int, data: bytearray) -> bool:
+    return memoryview(data).readonly
+
+
+def test_get_chunks() -> None:
+    chunks = list(get_chunks(20, 2))
+    assert [len(chunk) for chunk in chunks] == [5, 3, 3, 2, 1, 1, 1, 1, 1, 1, 1]
+    assert [i for chunk in chunks for i in chunk] == list(range(20))
+
+
+def test_get_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PARALLEL_WORKERS_ENV, "3")
+    assert get_workers() == 3
+    monkeypatch.setenv(PARALLEL_WORKERS_ENV, "0")
+    assert get_workers() == 1
+
+
+@pytest.mark.parametrize("workers_env", [None, "3"])
+def test_limit_workers(
+    monkeypatch: pytest.MonkeyPatch, workers_env: str | None
+) -> None:
+    if workers_env is None:
+        monkeypatch.delenv(PARALLEL_WORKERS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(PARALLEL_WORKERS_ENV, workers_env)
+    assert parallel_map(_get_workers, range(2), workers=2, min_items=1) == [1, 1]
+
+
+def test_limited_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PARALLEL_WORKERS_ENV, "3")
+    with limited_workers():
+        assert get_workers() == 1
+        assert (
+            parallel_map(_get_worker_id, range(2), min_items=1)
+            == [_get_worker_id(0)] * 2
+        )
+    assert get_workers() == 3
+
+
+@pytest.mark.parametrize("backend", [Backend.THREAD, Backend.PROCESS])
+def test_parallel_map_reuses_pool(
+    monkeypatch: pytest.MonkeyPatch, backend: Backend
+) -> None:
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, backend)
+    worker_ids = {
+        worker_id
+        for _ in range(3)
+        for worker_id in parallel_map(_get_worker_id, range(20), workers=2, min_items=1)
+    }
+    assert len(worker_ids) <= 2
+    assert _get_worker_id(0) not in worker_ids
+
+
+def test_get_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_backend(Backend.THREAD) is Backend.THREAD
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, "process")
+    assert get_backend() is Backend.PROCESS
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, "auto")
+    expected = Backend.THREAD if is_free_threaded() else Backend.PROCESS
+    assert get_backend() is expected
+
+
+@pytest.mark.parametrize("backend", list(Backend))
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_map(
+    monkeypatch: pytest.MonkeyPatch, workers: int, backend: Backend
+) -> None:
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, backend)
+    weights = array("q", range(100, 200))
+    with counters.collect() as counts:
+        results = parallel_map(
+            _weigh, range(100), weights, 5, workers=workers, min_items=1
+        )
+    assert results == list(range(105, 205))
+    assert counts == {"weighed": 100}
+
+
+def test_parallel_map_spans(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, Backend.PROCESS)
+    weights = array("q", range(100))
+    with spans.collect() as recorded:
+        parallel_map(_weigh, range(100), weights, 0, workers=2, min_items=1)
+    chunk_spans = [span for span in recorded if span.name == "parallel_map.chunk"]
+    assert len(chunk_spans) == len(list(get_chunks(100, 2)))
+    assert os.getpid() not in {span.process_id for span in chunk_spans}
+    assert [span.name for span in recorded][-1] == "parallel_map"
+
+
+def test_parallel_map_shares_buffers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, Backend.PROCESS)
+    data = bytearray(b"grid")
+    assert parallel_map(_is_readonly, [0, 1], data, min_items=1) == [False, False]
+    assert parallel_map(_is_readonly, [0, 1], data, workers=2, min_items=1) == [
+        True,
+        True,
+    ]
+
+
+def test_parallel_map_reattaches_buffers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, Backend.PROCESS)
+    for offset in range(3):
+        weights = array("q", range(offset, offset + 100))
+        assert parallel_map(
+            _weigh, range(100), weights, 0, workers=2, min_items=1
+        ) == list(weights)
@@ -0,0 +1,72 @@
+from pathlib import Path
+from pstats import Stats
+from time import perf_counter
+
+from advent_of_code.profiling import (
+    MAX_COLLAPSED_DEPTH,
+    MIN_COLLAPSED_SHARE,
+    collapse_stats,
+    profile_call,
+    write_profile,
+)
+
+
+def _inner(n: int) -> int:
+    return sum(range(n))
+
+
+def _outer(n: int) -> int:
+    return _inner(n) + _inner(n)
+
+
+def test_profile_call() -> None:
+    result, profile = profile_call(_outer, 1000)
+    assert result == 2 * sum(range(1000))
+    functions = {name for _, _, name in Stats(profile).stats}  # type: ignore[attr-defined]
+    assert {"_outer", "_inner"} <= functions
+
+
+def test_collapse_stats() -> None:
+    _, profile = profile_call(_outer, 100_000)
+    lines = collapse_stats(Stats(profile))
+    stacks = {line.rsplit(" ", 1)[0] for line in lines}
+    assert any("_outer" in stack and "_inner" in stack for stack in stacks)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+def _get_diamond_stats(depth: int) -> Stats:
+    # Two functions per level, each called by both on the level above, so the
+    # graph has 2 ** depth paths.
+    levels = [[("~", 0, "root")]] + [
+        [("diamond.py", level, name) for name in ("a", "b")]
+        for level in range(1, depth + 1)
+    ]
+    stats = Stats()
+    entries = stats.stats  # type: ignore[attr-defined]
+    for level, functions in enumerate(levels):
+        callers = {
+            caller: (1, 1, 0.001, 1 / len(levels[level - 1]))
+            for caller in (levels[level - 1] if level else [])
+        }
+        for function in functions:
+            entries[function] = (1, 1, 0.001, 1.0, callers)
+    stats.get_top_level_stats()
+    return stats
+
+
+def test_collapse_stats_bounded() -> None:
+    stats = _get_diamond_stats(200)
+    start = perf_counter()
+    lines = collapse_stats(stats)
+    assert perf_counter() - start < 2
+    assert 0 < len(lines) <= MAX_COLLAPSED_DEPTH / MIN_COLLAPSED_SHARE
+    assert max(line.count(";") for line in lines) < MAX_COLLAPSED_DEPTH
+
+
+def test_write_profile(tmp_path: Path) -> None:
+    _, profile = profile_call(_outer, 100_000)
+    report = write_profile(profile, tmp_path / "profiles" / "example", "solve", top=2)
+    assert Path(report.pstats_filepath).name == "example_solve.pstats"
+    assert Stats(report.pstats_filepath).total_calls > 0  # type: ignore[attr-defined]
+    assert Path(report.collapsed_filepath).read_text()
+    assert "_outer" in report.summary
@@ -0,0 +1,175 @@
+import sys
+from contextlib import closing
+from pathlib import Path
+from pstats import Stats
+
+import pytest
+
+from advent_of_code.cache import AnswerStore
+from advent_of_code.parallel import (
+    PARALLEL_BACKEND_ENV,
+    PARALLEL_WORKERS_ENV,
+    Backend,
+    get_workers,
+)
+from advent_of_code.runner import (
+    Day,
+    PartResult,
+    RunOptions,
+    Task,
+    discover_days,
+    run_task,
+    run_tasks,
+)
+from advent_of_code.year_2024.generators import generate_input
+
+
+def test_discover_days() -> None:
+    days = discover_days(2024)
+    assert days[0] == Day(2024, 1)
+    assert days == sorted(days)
+    assert Day(2024, 20) in days
+
+
+def test_discover_days_does_not_import() -> None:
+    modules = set(sys.modules)
+    discover_days()
+    assert set(sys.modules) == modules
+
+
+def test_discover_days_unknown_year() -> None:
+    assert discover_days(1999) == []
+
+
+class TestDay:
+    def test_module_name(self) -> None:
+        assert Day(2024, 1).module_name == "advent_of_code.year_2024.day_01"
+
+    def test_get_input_filepath(self) -> None:
+        assert Day(2024, 1).get_input_filepath("tests/data") == "tests/data/2024_01"
+
+
+@pytest.mark.parametrize(
+    argnames=("workers", "backend"),
+    argvalues=[(1, None), (2, Backend.PROCESS), (2, Backend.THREAD)],
+)
+def test_run_tasks(workers: int, backend: Backend | None) -> None:
+    tasks = [
+        Task(Day(2024, 1), 1, "tests/data/2024_01"),
+        Task(Day(2024, 1), 2, "tests/data/2024_01"),
+        Task(Day(2024, 2), 1, "tests/data/2024_02"),
+    ]
+    results = sorted(
+        run_tasks(tasks, workers, backend=backend), key=lambda r: (r.day, r.part)
+    )
+    assert [(r.day, r.part, r.answer) for r in results] == [
+        (1, 1, 11),
+        (1, 2, 31),
+        (2, 1, 2),
+    ]
+    assert all(result.seconds >= 0 for result in results)
+
+
+def test_run_tasks_answer_store(tmp_path: Path) -> None:
+    tasks = [Task(Day(2024, 1), part, "tests/data/2024_01") for part in (1, 2)]
+    with closing(AnswerStore(tmp_path / "answers.sqlite3")) as answer_store:
+        results = list(run_tasks(tasks, 1, answer_store))
+        cached_results = list(run_tasks(tasks, 1, answer_store))
+    assert not any(result.cached for result in results)
+    assert all(result.cached for result in cached_results)
+    assert [r.answer for r in cached_results] == [r.answer for r in results]
+
+
+def test_task_answer_key(tmp_path: Path) -> None:
+    filepath = tmp_path / "input"
+    filepath.write_text("1 2")
+    task = Task(Day(2024, 1), 1, str(filepath))
+    key = task.answer_key
+    assert key != Task(Day(2024, 1), 2, str(filepath)).answer_key
+    filepath.write_text("1 3")
+    assert key == task.answer_key
+    assert key != Task(Day(2024, 1), 1, str(filepath)).answer_key
+
+
+def test_part_result_to_dict() -> None:
+    result = PartResult(2024, 1, 2, 31, 0.5)
+    expected = {
+        "year": 2024,
+        "day": 1,
+        "part": 2,
+        "answer": 31,
+        "seconds": 0.5,
+        "cached": False,
+        "profiles": [],
+        "memory": None,
+        "counters": {},
+        "spans": [],
+    }
+    assert result.to_dict() == expected
+
+
+def test_run_task_profile(tmp_path: Path) -> None:
+    task = Task(Day(2024, 1), 2, "tests/data/2024_01")
+    result = run_task(task, RunOptions(str(tmp_path), profile_top=3))
+    assert result.answer == 31
+    assert [profile.phase for profile in result.profiles] == ["parse", "solve"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "2024_01_part2_parse.collapsed",
+        "2024_01_part2_parse.pstats",
+        "2024_01_part2_solve.collapsed",
+        "2024_01_part2_solve.pstats",
+    ]
+
+
+@pytest.mark.parametrize("backend", [Backend.THREAD, Backend.PROCESS])
+def test_run_task_profile_parallel_day(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, backend: Backend
+) -> None:
+    monkeypatch.setenv(PARALLEL_WORKERS_ENV, "2")
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, backend)
+    filepath = tmp_path / "input"
+    filepath.write_text(generate_input(6, 0.05).data)
+    task = Task(Day(2024, 6), 2, str(filepath))
+    result = run_task(task, RunOptions(str(tmp_path / "profiles")))
+    solve_profile = result.profiles[1]
+    functions = Stats(solve_profile.pstats_filepath).stats  # type: ignore[attr-defined]
+    assert "is_loop_obstacle" in {name for _, _, name in functions}
+    assert get_workers() == 2
+
+
+def test_run_task_memory() -> None:
+    task = Task(Day(2024, 16), 2, "tests/data/2024_16_1")
+    result = run_task(task, RunOptions(trace_memory=True, memory_top=3))
+    assert result.answer == 45
+    assert result.memory is not None
+    assert result.memory.peak_size > 0
+    assert 0 < len(result.memory.allocations) <= 3
+    assert result.memory.object_counts
+
+
+def test_run_task_counters() -> None:
+    task = Task(Day(2024, 16), 1, "tests/data/2024_16_1")
+    result = run_task(task, RunOptions(count=True))
+    assert result.answer == 7036
+    assert result.counters["search.a_star.expanded"] > 0
+    assert not run_task(task).counters
+
+
+def test_run_task_spans() -> None:
+    task = Task(Day(2024, 16), 1, "tests/data/2024_16_1")
+    result = run_task(task, RunOptions(trace=True))
+    assert result.answer == 7036
+    assert [span.name for span in result.spans] == [
+        "read",
+        "parse",
+        "search.a_star",
+        "solve",
+        "2024 day 16 part 1",
+    ]
+    part_span = result.spans[-1]
+    assert all(
+        part_span.start <= span.start
+        and span.start + span.seconds <= part_span.start + part_span.seconds
+        for span in result.spans
+    )
+    assert not run_task(task).spans
@@ -0,0 +1,38 @@
+from advent_of_code.search import a_star, bfs, dijkstra
+
+
+def _line_neighbours(state: int) -> list[int]:
+    return [next_state for next_state in (state - 1, state + 1) if 0 <= next_state < 10]
+
+
+def _diamond_neighbours(state: int) -> list[tuple[int, int]]:
+    # 0 -> 1 -> 3 and 0 -> 2 -> 3 cost the same, 0 -> 3 costs more.
+    return {0: [(1, 1), (2, 2), (3, 5)], 1: [(3, 2)], 2: [(3, 1)]}.get(state, [])
+
+
+def test_bfs() -> None:
+    result = bfs([3], _line_neighbours)
+    assert result.distances == {state: abs(state - 3) for state in range(10)}
+    assert result.path_to(0) == [3, 2, 1, 0]
+
+
+def test_bfs_goal_stops_search() -> None:
+    result = bfs([0], _line_neighbours, {2})
+    assert result.distances == {0: 0, 1: 1, 2: 2}
+
+
+def test_bfs_unreachable_goal() -> None:
+    assert 10 not in bfs([0], _line_neighbours, {10}).distances
+
+
+def test_dijkstra() -> None:
+    result = dijkstra([0], _diamond_neighbours, {3})
+    assert result.distances[3] == 3
+    assert sorted(result.predecessors[3]) == [1, 2]
+    assert result.states_on_paths_to([3]) == {0, 1, 2, 3}
+
+
+def test_a_star() -> None:
+    result = a_star([0], _diamond_neighbours, {3}, lambda state: int(state != 3))
+    assert result.distances[3] == 3
+    assert result.path_to(3)[0] == 0
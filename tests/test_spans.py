@@ -0,0 +1,89 @@
+import json
+import os
+from pathlib import Path
+
+from advent_of_code.spans import Span, Spans, to_trace, write_trace
+
+
+def test_spans_disabled() -> None:
+    spans = Spans()
+    with spans.span("phase"):
+        pass
+    assert not spans.enabled
+    assert spans.spans is None
+
+
+def test_spans_collect() -> None:
+    spans = Spans()
+    with spans.collect() as outer_spans:
+        with spans.span("outer"), spans.collect() as inner_spans, spans.span("inner"):
+            pass
+        with spans.span("other"):
+            pass
+    assert not spans.enabled
+    assert [span.name for span in outer_spans] == ["outer", "other"]
+    assert [span.name for span in inner_spans] == ["inner"]
+    assert all(span.process_id == os.getpid() for span in outer_spans)
+
+
+def test_spans_nest() -> None:
+    spans = Spans()
+    with spans.collect() as recorded, spans.span("outer"), spans.span("inner"):
+        pass
+    inner, outer = recorded
+    assert outer.start <= inner.start
+    assert inner.start + inner.seconds <= outer.start + outer.seconds
+
+
+def test_traced() -> None:
+    spans = Spans()
+
+    @spans.traced("double")
+    def double(n: int) -> int:
+        return n * 2
+
+    assert double(1) == 2
+    with spans.collect() as recorded:
+        assert double(2) == 4
+    assert [span.name for span in recorded] == ["double"]
+
+
+def test_to_trace() -> None:
+    recorded = [
+        Span("solve", 10.5, 0.25, os.getpid(), 1),
+        Span("parse", 10.0, 0.5, 2, 3),
+    ]
+    assert to_trace(recorded) == {
+        "traceEvents": [
+            {"name": "process_name", "ph": "M", "pid": 2, "args": {"name": "worker 2"}},
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": "main"},
+            },
+            {
+                "name": "solve",
+                "ph": "X",
+                "ts": 500_000.0,
+                "dur": 250_000.0,
+                "pid": os.getpid(),
+                "tid": 1,
+            },
+            {
+                "name": "parse",
+                "ph": "X",
+                "ts": 0.0,
+                "dur": 500_000.0,
+                "pid": 2,
+                "tid": 3,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def test_write_trace(tmp_path: Path) -> None:
+    filepath = tmp_path / "trace.json"
+    write_trace([Span("solve", 1.0, 2.0, 3, 4)], str(filepath))
+    assert json.loads(filepath.read_text()) == to_trace([Span("solve", 1.0, 2.0, 3, 4)])
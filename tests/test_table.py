@@ -1,8 +1,12 @@
+from array import array
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+from advent_of_code import inputs
 from advent_of_code.table import Table
+from advent_of_code.utils import calculate_similarity, calculate_total_distance
 
 
 def test_cast_column() -> None:
@@ -22,3 +26,57 @@ def test_cast_column() -> None:
 def test_get_column(column_index: int, expected: list[Any]) -> None:
     table = Table([["foo", 1], ["bar", 2], ["baz", 3]])
     assert table.get_column(column_index) == expected
+
+
+def test_cast_column_to_array() -> None:
+    table = Table([["1", "a"], ["2", "b"]])
+    table.cast_column(0, int)
+    assert table.columns[0] == array("q", [1, 2])
+    assert table.columns[1] == ["a", "b"]
+
+
+def test_get_column_array() -> None:
+    table = Table([[1], [2], [3]])
+    table.cast_column(0, int)
+    column = table.get_column(0)
+    assert column is table.columns[0]
+    assert column == array("q", [1, 2, 3])
+
+
+def test_get_column_similarity() -> None:
+    table = Table.from_bytes(Path("tests/data/2024_01").read_bytes(), [int, int])
+    assert calculate_similarity(table.get_column(0), table.get_column(1)) == 31
+    assert calculate_total_distance(table.get_column(0), table.get_column(1)) == 11
+
+
+def test_from_bytes() -> None:
+    table = Table.from_bytes(b"3   4.5  x\n-4  3    y\n", [int, float])
+    assert table == [[3, 4.5, "x"], [-4, 3.0, "y"]]
+    assert table.columns[0] == array("q", [3, -4])
+    assert table.columns[1] == array("d", [4.5, 3.0])
+    assert len(table) == 2
+    assert table[1] == [-4, 3.0, "y"]
+    assert Table.from_bytes(b"1 2") == [["1", "2"]]
+    assert Table.from_bytes(b"") == []
+
+
+def test_from_bytes_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inputs, "CHUNK_SIZE", 4)
+    table = Table.from_bytes(b"1 a\n22 bb\n333 ccc\n", [int])
+    assert table == [[1, "a"], [22, "bb"], [333, "ccc"]]
+
+
+@pytest.mark.parametrize("chunk_size", [4, 1 << 16])
+def test_from_bytes_ragged(monkeypatch: pytest.MonkeyPatch, chunk_size: int) -> None:
+    monkeypatch.setattr(inputs, "CHUNK_SIZE", chunk_size)
+    with pytest.raises(ValueError, match=r"^row 2 has 1 fields, expected 2$"):
+        Table.from_bytes(b"1 2\n3 4\n5\n6 7\n")
+    with pytest.raises(ValueError, match=r"^row 1 has 0 fields, expected 2$"):
+        Table.from_bytes(b"1 2\n\n3 4\n")
+    with pytest.raises(ValueError, match=r"^row 1 has 3 fields, expected 2$"):
+        Table.from_bytes(b"1 2\n3 4 5\n6\n", [int, int])
+
+
+def test_ragged_rows() -> None:
+    with pytest.raises(ValueError, match=r"^row 1 has 1 fields, expected 2$"):
+        Table([[1, 2], [3]])
@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+from advent_of_code import vector
+from advent_of_code.lazy import lazy_import, optional_import
+from advent_of_code.vector import NUMPY_ENV, use_numpy
+
+
+@pytest.mark.parametrize(
+    ("setting", "size", "expected"),
+    [("1", 0, True), ("0", 1_000_000, False), ("", 99, False), ("", 100, True)],
+)
+def test_use_numpy(
+    monkeypatch: pytest.MonkeyPatch, setting: str, size: int, expected: bool
+) -> None:
+    monkeypatch.setenv(NUMPY_ENV, setting)
+    # Any module that is installed and loaded stands in for NumPy.
+    monkeypatch.setattr(vector, "np", lazy_import("json"))
+    assert use_numpy(size, 100, 1000) is expected
+
+
+def test_use_numpy_before_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(NUMPY_ENV, raising=False)
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.setattr(vector, "np", optional_import("colorsys"))
+    assert not use_numpy(999, 100, 1000)
+    assert use_numpy(1000, 100, 1000)
+
+
+def test_use_numpy_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vector, "np", optional_import("advent_of_code.missing"))
+    monkeypatch.delenv(NUMPY_ENV, raising=False)
+    assert not use_numpy(1_000_000, 100, 1000)
+    monkeypatch.setenv(NUMPY_ENV, "1")
+    assert use_numpy(0, 100, 1000)
+
+
+def test_use_numpy_invalid_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(NUMPY_ENV, "yes")
+    with pytest.raises(
+        ValueError, match=r"^AOC_NUMPY must be unset, empty, 0 or 1, not 'yes'$"
+    ):
+        use_numpy(0, 100, 1000)
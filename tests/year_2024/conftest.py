@@ -0,0 +1,37 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+from advent_of_code.vector import NUMPY_ENV
+from advent_of_code.year_2024.generators import generate_input
+
+
+class InputFile(NamedTuple):
+    filepath: str
+    solve_kwargs: dict[str, int]
+
+
+type WriteInput = Callable[..., InputFile]
+
+
+@pytest.fixture
+def synthetic_input(tmp_path: Path) -> WriteInput:
+    def write(day: int, *, seed: int = 0, scale: float = 1) -> InputFile:
+        synthetic_input = generate_input(day, scale, seed)
+        filepath = tmp_path / f"input_{day:02}_{seed}_{scale}"
+        filepath.write_text(synthetic_input.data)
+        return InputFile(str(filepath), synthetic_input.solve_kwargs)
+
+    return write
+
+
+@pytest.fixture(params=["0", "1"], ids=["python", "numpy"])
+def numpy_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    if request.param == "1":
+        pytest.importorskip("numpy")
+    monkeypatch.setenv(NUMPY_ENV, request.param)
+    return str(request.param)
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from advent_of_code.parallel import (
+    PARALLEL_BACKEND_ENV,
+    PARALLEL_WORKERS_ENV,
+    Backend,
+    is_free_threaded,
+)
+from advent_of_code.runner import Day
+from tests.year_2024.conftest import WriteInput
+
+# Days whose loops go through parallel_map.
+PARALLEL_DAYS = (6, 7, 19, 20)
+
+pytestmark = pytest.mark.backend
+
+# The first backend's answers, which the others must match.
+_answers: dict[int, object] = {}
+
+
+@pytest.mark.parametrize("backend", [Backend.PROCESS, Backend.THREAD], ids=str)
+@pytest.mark.parametrize("day", PARALLEL_DAYS, ids=lambda day: f"day_{day:02}")
+def test_backend(
+    benchmark: BenchmarkFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    synthetic_input: WriteInput,
+    day: int,
+    backend: Backend,
+) -> None:
+    filepath, solve_kwargs = synthetic_input(day)
+    monkeypatch.setenv(PARALLEL_BACKEND_ENV, backend)
+    # Even on one CPU, map with a pool rather than in-process.
+    monkeypatch.setenv(PARALLEL_WORKERS_ENV, str(max(2, os.process_cpu_count() or 1)))
+    solve = Day(2024, day).load().solve
+    benchmark.group = f"2024 day {day:02}"
+    benchmark.extra_info["free_threaded"] = is_free_threaded()
+    answer = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        solve, args=(filepath,), kwargs=solve_kwargs, rounds=1
+    )
+    assert _answers.setdefault(day, answer) == answer
@@ -0,0 +1,62 @@
+import pytest
+
+from advent_of_code.budgets import (
+    CLI_STARTUP_BUDGET_SECONDS,
+    DAY_STARTUP_BUDGET_SECONDS,
+    calibrate,
+    can_measure,
+    check_budget,
+    check_startup,
+    measure,
+    measure_import_times,
+    measure_startup,
+)
+from advent_of_code.runner import Day
+from advent_of_code.year_2024.generators import GENERATORS
+from tests.year_2024.conftest import WriteInput
+
+pytestmark = pytest.mark.budget
+
+DAY_STARTUP_ARGS = (
+    "-c",
+    "from advent_of_code.year_2024.day_13 import solve; solve('tests/data/2024_13')",
+)
+CLI_STARTUP_ARGS = (
+    *("-m", "advent_of_code", "run", "2024", "13", "--input", "tests/data/2024_13"),
+    *("--workers", "1", "--no-cache"),
+)
+
+
+@pytest.fixture(scope="module")
+def factor() -> float:
+    return calibrate()
+
+
+@pytest.mark.skipif(not can_measure(), reason="needs resource")
+@pytest.mark.parametrize("part", [1, 2], ids=lambda part: f"part{part}")
+@pytest.mark.parametrize("day", sorted(GENERATORS), ids=lambda day: f"day_{day:02}")
+def test_budget(
+    synthetic_input: WriteInput, factor: float, day: int, part: int
+) -> None:
+    filepath, solve_kwargs = synthetic_input(day)
+    measurement = measure(Day(2024, day), part, filepath, solve_kwargs)
+    report = check_budget((2024, day, part), measurement, factor)
+    if report is not None:
+        pytest.fail(report, pytrace=False)
+
+
+@pytest.mark.parametrize(
+    ("args", "budget_seconds"),
+    [
+        (DAY_STARTUP_ARGS, DAY_STARTUP_BUDGET_SECONDS),
+        (CLI_STARTUP_ARGS, CLI_STARTUP_BUDGET_SECONDS),
+    ],
+    ids=["day", "cli"],
+)
+def test_startup_budget(
+    factor: float, args: tuple[str, ...], budget_seconds: float
+) -> None:
+    seconds = measure_startup(*args)
+    report = check_startup(seconds, budget_seconds, factor, measure_import_times(*args))
+    if report is not None:
+        pytest.fail(report, pytrace=False)
@@ -1,9 +1,13 @@
-from advent_of_code.year_2024.day_01 import _prepare_lists, part1, part2
+from array import array
 
+import pytest
 
-def test__prepare_lists() -> None:
-    expected = ([3, 4, 2, 1, 3, 3], [4, 3, 5, 3, 9, 3])
-    assert _prepare_lists("tests/data/2024_01") == expected
+from advent_of_code.year_2024.day_01 import parse, part1, part2, solve
+
+
+def test_parse() -> None:
+    expected = (array("q", [3, 4, 2, 1, 3, 3]), array("q", [4, 3, 5, 3, 9, 3]))
+    assert parse("tests/data/2024_01") == expected
 
 
 def test_part1() -> None:
@@ -14,3 +18,12 @@ def test_part1() -> None:
 def test_part2() -> None:
     expected = 31
     assert part2("tests/data/2024_01") == expected
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_01") == (11, 31)
+
+
+@pytest.mark.usefixtures("numpy_backend")
+def test_solve_paths() -> None:
+    assert solve("tests/data/2024_01") == (11, 31)
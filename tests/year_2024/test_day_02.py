@@ -2,13 +2,14 @@ import pytest
 
 from advent_of_code.year_2024.day_02 import (
     _is_safe,
-    _prepare_data,
+    parse,
     part1,
     part2,
+    solve,
 )
 
 
-def test__prepare_data() -> None:
+def test_parse() -> None:
     expected = [
         [7, 6, 4, 2, 1],
         [1, 2, 7, 8, 9],
@@ -17,7 +18,7 @@ def test__prepare_data() -> None:
         [8, 6, 4, 4, 1],
         [1, 3, 6, 7, 9],
     ]
-    assert _prepare_data("tests/data/2024_02") == expected
+    assert parse("tests/data/2024_02") == expected
 
 
 class TestIsSafe:
@@ -94,3 +95,7 @@ def test_part1() -> None:
 def test_part2() -> None:
     expected = 4
     assert part2("tests/data/2024_02") == expected
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_02") == (2, 4)
@@ -1,26 +1,27 @@
 from advent_of_code.year_2024.day_03 import (
-    _filter_data,
-    _prepare_data,
+    _sum_enabled_muls,
     _sum_muls,
+    parse,
     part1,
     part2,
+    solve,
 )
 
 
-def test__prepare_data() -> None:
+def test_parse() -> None:
     expected = (
         r"xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
     )
-    assert _prepare_data("tests/data/2024_03_1") == expected
+    assert bytes(parse("tests/data/2024_03_1")) == expected.encode()
 
 
-def test__filter_data() -> None:
-    data = r"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
-    assert _filter_data(data) == r"xmul(2,4)&mul[3,7]!^?mul(8,5))"
+def test__sum_enabled_muls() -> None:
+    data = rb"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+    assert _sum_enabled_muls(data) == 48
 
 
 def test__sum_muls() -> None:
-    data = r"xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
+    data = rb"xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
     expected = 161
     assert _sum_muls(data) == expected
 
@@ -33,3 +34,7 @@ def test_part1() -> None:
 def test_part2() -> None:
     expected = 48
     assert part2("tests/data/2024_03_2") == expected
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_03_2") == (161, 48)
@@ -1,20 +1,22 @@
 import pytest
 
+from advent_of_code.grid import Grid
 from advent_of_code.year_2024.day_04 import (
     _generate_ray_patterns,
     _generate_x_patterns,
-    _read_input,
     _search_grid,
+    parse,
     part1,
     part2,
+    solve,
 )
 
 TEST_DATA_FILEPATH = "tests/data/2024_04"
 
 
 @pytest.fixture
-def data() -> list[str]:
-    return [
+def data() -> Grid:
+    rows = [
         "MMMSXXMASM",
         "MSAMXMSMSA",
         "AMXSXMAAMM",
@@ -26,10 +28,11 @@ def data() -> list[str]:
         "MAMMMXMMMM",
         "MXMXAXMASX",
     ]
+    return Grid.from_str("\n".join(rows))
 
 
-def test__read_input(data: list[str]) -> None:
-    assert _read_input(TEST_DATA_FILEPATH) == data
+def test_parse(data: Grid) -> None:
+    assert parse(TEST_DATA_FILEPATH) == data
 
 
 def test__generate_ray_patterns() -> None:
@@ -56,7 +59,7 @@ def test__generate_x_patterns() -> None:
     assert _generate_x_patterns() == expected
 
 
-def test__search_grid(data: list[str]) -> None:
+def test__search_grid(data: Grid) -> None:
     expected = 18
     assert _search_grid(data, "XMAS", _generate_ray_patterns()) == expected
 
@@ -69,3 +72,12 @@ def test_part1() -> None:
 def test_part2() -> None:
     expected = 9
     assert part2(TEST_DATA_FILEPATH) == expected
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (18, 9)
+
+
+@pytest.mark.usefixtures("numpy_backend")
+def test_solve_paths() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (18, 9)
@@ -9,6 +9,7 @@ from advent_of_code.year_2024.day_05 import (
     _read_input,
     _split_input,
     part2,
+    solve,
 )
 
 TEST_DATA_FILEPATH = "tests/data/2024_05"
@@ -188,3 +189,7 @@ class TestUpdateList:
 
 def test_part2() -> None:
     assert part2(TEST_DATA_FILEPATH) == 123
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (143, 123)
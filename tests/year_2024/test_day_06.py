@@ -2,7 +2,7 @@ from textwrap import dedent
 
 import pytest
 
-from advent_of_code.year_2024.day_06 import Coords, Map, part1, part2
+from advent_of_code.year_2024.day_06 import OBSTACLE, Map, part1, part2, solve
 
 TEST_DATA_FILEPATH = "tests/data/2024_06"
 
@@ -23,33 +23,30 @@ def data() -> str:
     """).strip()
 
 
-@pytest.fixture
-def map_() -> Map:
-    return Map(
-        10,
-        10,
-        Coords(4, 3),
-        {
-            Coords(2, 6),
-            Coords(4, 9),
-            Coords(6, 0),
-            Coords(8, 2),
-            Coords(7, 5),
-            Coords(1, 3),
-            Coords(0, 1),
-            Coords(9, 8),
-        },
-    )
-
-
 class TestMap:
-    def test_from_str(self, data: str, map_: Map) -> None:
-        actual = Map.from_str(data)
-        assert actual.width == map_.width
-        assert actual.height == map_.height
-        assert actual.position == map_.position
-        assert actual.obstacles == map_.obstacles
-        assert actual.previous_states == map_.previous_states
+    def test_from_str(self, data: str) -> None:
+        map_ = Map.from_str(data)
+        assert (map_.grid.width, map_.grid.height) == (10, 10)
+        assert map_.grid.coords(map_.start) == (4, 6)
+        assert map_.position == map_.start
+        assert {map_.grid.coords(i) for i in map_.grid.find_all(OBSTACLE)} == {
+            (4, 0),
+            (9, 1),
+            (2, 3),
+            (7, 4),
+            (1, 6),
+            (8, 7),
+            (0, 8),
+            (6, 9),
+        }
+        assert map_.previous_states == set()
+
+    def test_simulate(self, data: str) -> None:
+        map_ = Map.from_str(data)
+        map_.simulate()
+        assert not map_.is_in_area
+        assert not map_.is_stuck
+        assert map_.total_visited == 41
 
 
 def test_part1() -> None:
@@ -58,3 +55,7 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert part2(TEST_DATA_FILEPATH) == 6
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (41, 6)
@@ -1,4 +1,4 @@
-from advent_of_code.year_2024.day_07 import part1, part2
+from advent_of_code.year_2024.day_07 import part1, part2, solve
 
 TEST_DATA_FILEPATH = "tests/data/2024_07"
 
@@ -9,3 +9,7 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert part2(TEST_DATA_FILEPATH) == 11387
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (3749, 11387)
@@ -1,4 +1,4 @@
-from advent_of_code.year_2024.day_08 import part1, part2
+from advent_of_code.year_2024.day_08 import part1, part2, solve
 
 TEST_DATA_FILEPATH = "tests/data/2024_08"
 
@@ -9,3 +9,7 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert part2(TEST_DATA_FILEPATH) == 34
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (14, 34)
@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from typing import Any
 
-from advent_of_code.year_2024.day_11 import Stones, part1, part2
+from advent_of_code.year_2024.day_11 import Stones, part1, part2, solve
 
 TEST_DATA_FILEPATH = "tests/data/2024_11"
 
@@ -20,3 +20,7 @@ def test_performance_25(benchmark: Callable[..., Any]) -> None:
 
 def test_performance_75(benchmark: Callable[..., Any]) -> None:
     benchmark(Stones([125, 17]).simulate, 75)
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (55312, 65601038650482)
@@ -1,6 +1,6 @@
 import pytest
 
-from advent_of_code.year_2024.day_12 import part1, part2
+from advent_of_code.year_2024.day_12 import part1, part2, solve
 
 
 @pytest.mark.parametrize(
@@ -17,3 +17,7 @@ def test_part1(file_suffix: int, expected: int) -> None:
 )
 def test_part2(file_suffix: int, expected: int) -> None:
     assert part2(f"tests/data/2024_12_{file_suffix}") == expected
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_12_3") == (1930, 1206)
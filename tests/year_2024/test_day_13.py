@@ -1,6 +1,6 @@
 from random import randint
 
-from advent_of_code.year_2024.day_13 import ClawMachine, part1, part2
+from advent_of_code.year_2024.day_13 import ClawMachine, part1, part2, solve
 
 TEST_DATA_FILEPATH = "tests/data/2024_13"
 
@@ -38,3 +38,7 @@ def test_procedually() -> None:
             except AssertionError:
                 print(a_dxy, b_dxy, prize_xy, a_presses, b_presses)
                 raise
+
+
+def test_solve() -> None:
+    assert solve(TEST_DATA_FILEPATH) == (480, 875_318_608_908)
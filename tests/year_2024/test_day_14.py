@@ -1,7 +1,23 @@
-from advent_of_code.year_2024.day_14 import part1
+import pytest
+
+from advent_of_code.year_2024.day_14 import part1, part2, solve
+from tests.year_2024.conftest import WriteInput
 
 TEST_DATA_FILEPATH = "tests/data/2024_14"
 
 
 def test_part1() -> None:
     assert part1(TEST_DATA_FILEPATH, width=11, height=7) == 12
+
+
+def test_part2(synthetic_input: WriteInput) -> None:
+    # The generator plants the picture at this step for seed 0.
+    filepath, _ = synthetic_input(14, scale=0.2)
+    assert part2(filepath) == 6312
+
+
+@pytest.mark.usefixtures("numpy_backend")
+def test_solve_paths(synthetic_input: WriteInput) -> None:
+    assert part1(TEST_DATA_FILEPATH, width=11, height=7) == 12
+    filepath, _ = synthetic_input(14, scale=0.2)
+    assert solve(filepath) == (346_086, 6312)
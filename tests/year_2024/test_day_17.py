@@ -1,6 +1,6 @@
 import pytest
 
-from advent_of_code.year_2024.day_17 import part1, part2
+from advent_of_code.year_2024.day_17 import part1, part2, solve
 
 
 @pytest.mark.parametrize(
@@ -18,3 +18,7 @@ def test_part1(file_suffix: int, expected: str) -> None:
 
 def test_part2() -> None:
     assert part2("tests/data/2024_17_4") == 117_440
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_17_4") == ("0,3,5,4,3,0", 117_440)
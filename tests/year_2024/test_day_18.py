@@ -1,4 +1,4 @@
-from advent_of_code.year_2024.day_18 import part1, part2
+from advent_of_code.year_2024.day_18 import part1, part2, solve
 
 
 def test_part1() -> None:
@@ -7,3 +7,7 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert part2("tests/data/2024_18", 7, 7, 12) == "6,1"
+
+
+def test_solve() -> None:
+    assert solve("tests/data/2024_18", 7, 7, 12) == (22, "6,1")
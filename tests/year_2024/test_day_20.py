@@ -1,6 +1,6 @@
 import pytest
 
-from advent_of_code.year_2024.day_20 import Map, count_cheats, read_input
+from advent_of_code.year_2024.day_20 import count_cheats, parse
 
 
 class TestCountCheats:
@@ -22,8 +22,7 @@ class TestCountCheats:
         ],
     )
     def test_cheat_duration_2(self, steps_saved: int, expected: int) -> None:
-        data = read_input("tests/data/2024_20")
-        path = Map.from_str(data).get_path()
+        path = parse("tests/data/2024_20").get_path()
         assert count_cheats(path, 2, steps_saved) == expected
 
     @pytest.mark.parametrize(
@@ -47,6 +46,5 @@ class TestCountCheats:
         ],
     )
     def test_cheat_duration_20(self, steps_saved: int, expected: int) -> None:
-        data = read_input("tests/data/2024_20")
-        path = Map.from_str(data).get_path()
+        path = parse("tests/data/2024_20").get_path()
         assert count_cheats(path, 20, steps_saved) == expected
@@ -0,0 +1,29 @@
+import pytest
+
+from advent_of_code.runner import Day
+from advent_of_code.year_2024.generators import GENERATORS, generate_input
+from tests.year_2024.conftest import WriteInput
+
+
+def test_every_day_has_a_generator() -> None:
+    assert sorted(GENERATORS) == list(range(1, 21))
+
+
+def test_generate_input_is_seeded() -> None:
+    assert generate_input(4, 0.25, seed=1) == generate_input(4, 0.25, seed=1)
+    assert generate_input(4, 0.25, seed=1) != generate_input(4, 0.25, seed=2)
+
+
+@pytest.mark.parametrize(
+    ("day", "scale", "expected"),
+    [(1, 4, 4000), (4, 4, 280), (4, 16, 560), (17, 0.01, 1)],
+)
+def test_get_size(day: int, scale: float, expected: int) -> None:
+    assert GENERATORS[day].get_size(scale) == expected
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generated_input_solves(day: int, synthetic_input: WriteInput) -> None:
+    filepath, solve_kwargs = synthetic_input(day, scale=1 / 64)
+    answers = Day(2024, day).load().solve(filepath, **solve_kwargs)
+    assert len(answers) == 2
@@ -0,0 +1,37 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from advent_of_code.runner import Day
+from tests.year_2024.conftest import WriteInput
+
+# Days with a NumPy path, each solved from well below the real size, where the pure
+# Python path wins, to well above it, so the groups show where NumPy takes over.
+NUMPY_DAYS = (1, 4, 14)
+SCALES = (0.01, 0.1, 1, 4, 16)
+CASES = [
+    (day, part, scale) for day in NUMPY_DAYS for part in (1, 2) for scale in SCALES
+]
+
+pytestmark = pytest.mark.numpy
+
+# The pure Python path's answers, which the NumPy path must match.
+_answers: dict[tuple[int, int, float], object] = {}
+
+
+@pytest.mark.usefixtures("numpy_backend")
+@pytest.mark.parametrize(
+    "case", CASES, ids=lambda case: "day_{:02}-part_{}-{}x".format(*case)
+)
+def test_numpy(
+    benchmark: BenchmarkFixture,
+    synthetic_input: WriteInput,
+    case: tuple[int, int, float],
+) -> None:
+    day, part, scale = case
+    filepath, solve_kwargs = synthetic_input(day, scale=scale)
+    module = Day(2024, day).load()
+    parsed = module.parse(filepath, **solve_kwargs)
+    solve_part = module.solve_part1 if part == 1 else module.solve_part2
+    benchmark.group = f"2024 day {day:02} part {part} {scale}x"
+    answer = benchmark(solve_part, parsed)
+    assert _answers.setdefault(case, answer) == answer
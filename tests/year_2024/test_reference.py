@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.differential import check_seed, compare
+from advent_of_code.runner import Day
+from advent_of_code.year_2024.reference import REFERENCES
+
+EXAMPLE_FILEPATHS = sorted(
+    str(filepath) for filepath in Path("tests/data").glob("2024_*")
+)
+EXAMPLE_KWARGS = {"tests/data/2024_18": {"width": 7, "height": 7, "byte_count": 12}}
+
+
+def test_every_day_has_a_reference() -> None:
+    assert sorted(REFERENCES) == list(range(1, 21))
+
+
+@pytest.mark.parametrize("filepath", EXAMPLE_FILEPATHS)
+def test_examples_match_reference(filepath: str) -> None:
+    day = Day(2024, int(Path(filepath).name.split("_")[1]))
+    data = Path(filepath).read_text()
+    assert compare(day, data, EXAMPLE_KWARGS.get(filepath, {})) is None
+
+
+@pytest.mark.parametrize("day", sorted(REFERENCES))
+@pytest.mark.parametrize("seed", range(2))
+def test_generated_inputs_match_reference(day: int, seed: int) -> None:
+    assert check_seed(Day(2024, day), seed, 0.05) is None
+
+
+def test_reference_answers() -> None:
+    assert REFERENCES[1](Path("tests/data/2024_01").read_text()) == (11, 31)
+    assert REFERENCES[18](
+        Path("tests/data/2024_18").read_text(), width=7, height=7, byte_count=12
+    ) == (22, "6,1")
@@ -0,0 +1,23 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from advent_of_code.runner import Day
+from advent_of_code.year_2024.generators import GENERATORS
+from tests.year_2024.conftest import WriteInput
+
+SCALES = (1, 4, 16)
+
+pytestmark = pytest.mark.scaling
+
+
+@pytest.mark.parametrize("scale", SCALES, ids=lambda scale: f"{scale}x")
+@pytest.mark.parametrize("day", sorted(GENERATORS), ids=lambda day: f"day_{day:02}")
+def test_scaling(
+    benchmark: BenchmarkFixture, synthetic_input: WriteInput, day: int, scale: int
+) -> None:
+    filepath, solve_kwargs = synthetic_input(day, scale=scale)
+    solve = Day(2024, day).load().solve
+    benchmark.group = f"2024 day {day:02}"
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        solve, args=(filepath,), kwargs=solve_kwargs, rounds=1
+    )